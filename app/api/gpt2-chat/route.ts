@@ -81,6 +81,7 @@ function generateFallbackResponse(text: string) {
   return {
     response: `He procesado tu mensaje: "${text}". Este es un ejemplo de respuesta generada por el sistema GPT-2 en español.`,
     model: "gpt2-small-spanish",
+    answered_by: "fallback",
     parameters: {
       max_length: 120,
       temperature: 0.1,
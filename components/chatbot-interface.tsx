@@ -65,6 +65,7 @@ interface NLPAnalysis {
 interface GPT2Response {
   response: string
   model: string
+  answered_by?: "knowledge_base" | "gpt2" | "fallback"
   parameters: {
     max_length: number
     temperature: number
@@ -191,6 +192,7 @@ export function ChatbotInterface() {
       return {
         response: `He recibido tu mensaje: "${text}". Este es un ejemplo de respuesta generada por GPT-2 en español.`,
         model: "gpt2-small-spanish-fallback",
+        answered_by: "fallback",
         parameters: gpt2Config,
         prompt: text,
         timestamp: new Date().toISOString()
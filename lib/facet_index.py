@@ -0,0 +1,196 @@
+'''
+Índice Invertido por Facetas de los Juegos
+Asocia cada término de los atributos de los juegos (desarrollador, año,
+plataformas y género) al conjunto de juegos que lo tienen, guardado como
+un bitset (un entero de Python, un bit por juego). Las consultas de
+intersección y unión son operaciones AND/OR sobre enteros, sin recorrer
+las fichas de los juegos.
+
+Cada valor de un atributo se indexa entero ("mundo abierto", "epic games"),
+no palabra a palabra: en un mensaje solo cuenta si aparecen todas sus
+palabras seguidas, de modo que "el mundo" o "games" sueltos no se toman por
+atributos. Los valores compuestos se separan antes en sus partes ("Sandbox,
+Supervivencia"; "Acción-Aventura" son dos géneros) y se descartan las
+aclaraciones entre paréntesis ("Activision (varios estudios)").
+'''
+
+import re
+import logging
+from typing import Dict, List, Tuple, Any, Iterable, Optional
+
+# Configuración de logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+try:
+    from keyword_matcher import KeywordMatcher, split_words
+except ImportError:
+    from .keyword_matcher import KeywordMatcher, split_words
+
+# Atributos de GAME_INFO que se indexan
+FACET_FIELDS = ('desarrollador', 'año', 'plataformas', 'género')
+
+# Valores de atributos que no identifican nada por sí solos
+FACET_STOPWORDS = {'de', 'del', 'la', 'el', 'los', 'las', 'y', 'o', 'u', 'en', 'varios', 'otros'}
+
+# Aclaraciones entre paréntesis y separadores de las partes de un valor compuesto
+PARENTHESIS_PATTERN = re.compile(r"\([^)]*\)")
+VALUE_SEPARATOR_PATTERN = re.compile(r"[,;/-]")
+
+# Palabras que unen dos términos de un mensaje como alternativas ("pc o móvil")
+OR_WORDS = {'o', 'u'}
+
+
+def iter_bits(bits: int) -> Iterable[int]:
+    """Posiciones de los bits a 1 de un entero, de menor a mayor."""
+    while bits:
+        lowest = bits & -bits
+        yield lowest.bit_length() - 1
+        bits ^= lowest
+
+
+class FacetIndex:
+    """
+    Índice invertido término -> bitset de juegos, separado por faceta.
+    """
+
+    def __init__(self, games: Dict[str, Dict[str, Any]]):
+        """
+        Args:
+            games (Dict[str, Dict[str, Any]]): Información de los juegos por título
+        """
+        self.titles: List[str] = list(games.keys())
+        self.facets: Dict[str, Dict[str, int]] = {facet: {} for facet in FACET_FIELDS}
+        self.all_bits = (1 << len(self.titles)) - 1
+
+        for game_id, title in enumerate(self.titles):
+            info = games[title]
+            for facet in FACET_FIELDS:
+                value = info.get(facet)
+                if value is None:
+                    continue
+                values = value if isinstance(value, (list, tuple)) else [value]
+                for term in self._terms(values):
+                    postings = self.facets[facet]
+                    postings[term] = postings.get(term, 0) | (1 << game_id)
+
+        # Término -> facetas en las que aparece, y buscador de términos (de una o varias palabras) en los mensajes
+        self.term_facets: Dict[str, Tuple[str, ...]] = {}
+        for facet, postings in self.facets.items():
+            for term in postings:
+                self.term_facets[term] = self.term_facets.get(term, ()) + (facet,)
+        self.matcher = KeywordMatcher()
+        for term in self.term_facets:
+            self.matcher.add(term, term)
+        self.matcher.build()
+
+        logger.info(f"Índice de facetas construido: {len(self.titles)} juegos, {len(self.term_facets)} términos")
+
+    @staticmethod
+    def _terms(values: Iterable[Any]) -> List[str]:
+        """Términos indexables de los valores de un atributo (cada parte de un valor, entera)."""
+        terms = []
+        for value in values:
+            for part in VALUE_SEPARATOR_PATTERN.split(PARENTHESIS_PATTERN.sub(' ', str(value))):
+                term = ' '.join(split_words(part))
+                if term and term not in FACET_STOPWORDS and term not in terms:
+                    terms.append(term)
+        return terms
+
+    def lookup(self, term: str, facets: Optional[Iterable[str]] = None) -> int:
+        """
+        Bitset de los juegos que tienen el término en alguna de las facetas.
+
+        Args:
+            term (str): Término (en minúsculas)
+            facets (Optional[Iterable[str]]): Facetas a consultar. Por defecto, todas.
+
+        Returns:
+            int: Bitset de juegos
+        """
+        bits = 0
+        for facet in facets or FACET_FIELDS:
+            bits |= self.facets[facet].get(term, 0)
+        return bits
+
+    def all_of(self, terms: Iterable[str]) -> int:
+        """Intersección: juegos que tienen todos los términos."""
+        bits = self.all_bits
+        for term in terms:
+            bits &= self.lookup(term)
+            if not bits:
+                break
+        return bits
+
+    def any_of(self, terms: Iterable[str]) -> int:
+        """Unión: juegos que tienen alguno de los términos."""
+        bits = 0
+        for term in terms:
+            bits |= self.lookup(term)
+        return bits
+
+    def titles_for(self, bits: int) -> List[str]:
+        """Títulos de los juegos de un bitset, en el orden del catálogo."""
+        return [self.titles[game_id] for game_id in iter_bits(bits)]
+
+    def parse(self, text: str) -> List[List[str]]:
+        """
+        Extrae de un mensaje los términos de facetas agrupados en alternativas.
+
+        Un término de varias palabras solo se reconoce si aparecen todas,
+        seguidas ("mundo abierto"). Los términos se combinan con AND; dos
+        términos separados solo por "o"/"u" forman un grupo OR ("pc o móvil").
+
+        Args:
+            text (str): Mensaje del usuario
+
+        Returns:
+            List[List[str]]: Grupos de términos (AND entre grupos, OR dentro de cada grupo)
+        """
+        groups: List[List[str]] = []
+        words = split_words(text)
+        previous = None
+        for match in self.matcher.scan(text):
+            term = match.keyword
+            joined_by_or = (previous is not None and match.start == previous.end + 1
+                            and words[previous.end] in OR_WORDS)
+            if joined_by_or and groups:
+                if term not in groups[-1]:
+                    groups[-1].append(term)
+            elif [term] not in groups:
+                groups.append([term])
+            previous = match
+        return groups
+
+    def query(self, groups: List[List[str]]) -> int:
+        """
+        Resuelve grupos de términos: AND entre grupos y OR dentro de cada grupo.
+
+        Args:
+            groups (List[List[str]]): Grupos devueltos por parse
+
+        Returns:
+            int: Bitset de juegos
+        """
+        bits = self.all_bits
+        for group in groups:
+            bits &= self.any_of(group)
+            if not bits:
+                break
+        return bits
+
+    def search(self, text: str) -> Dict[str, Any]:
+        """
+        Interpreta un mensaje y devuelve los juegos que cumplen sus atributos.
+
+        Args:
+            text (str): Mensaje del usuario
+
+        Returns:
+            Dict[str, Any]: Grupos de términos reconocidos ('groups') y
+            títulos que los cumplen ('games')
+        """
+        groups = self.parse(text)
+        if not groups:
+            return {'groups': [], 'games': []}
+        return {'groups': groups, 'games': self.titles_for(self.query(groups))}
@@ -0,0 +1,227 @@
+'''
+Corrección de Erratas por Diccionario de Borrados (SymSpell)
+Encuentra la palabra conocida más cercana a una palabra mal escrita
+("fornite" -> "fortnite", "minecrat" -> "minecraft") sin compararla con
+todo el vocabulario.
+
+Al construir el índice se guardan, para cada palabra conocida, todas las
+variantes que resultan de borrarle hasta max_distance letras. Al buscar se
+generan los borrados de la palabra escrita: dos palabras a distancia d
+comparten algún borrado de como mucho d letras, así que basta con consultar
+esos borrados en un diccionario y verificar la distancia real de los pocos
+candidatos que aparecen. El coste depende de la longitud de la palabra, no
+del tamaño del vocabulario.
+
+El módulo incluye también una lista de palabras frecuentes del español
+general (data/spanish_common_words.txt): quien use el índice sobre un
+vocabulario temático puede no corregir esas palabras, que no son erratas
+aunque se parezcan a una conocida ("marido" y "mario").
+'''
+
+import threading
+import logging
+from pathlib import Path
+from typing import Dict, FrozenSet, List, NamedTuple, Optional, Set
+
+# Configuración de logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Longitud mínima para corregir una palabra (las cortas producen falsos positivos: "modo" -> "mod")
+FUZZY_MIN_LENGTH = 5
+
+# Longitud a partir de la cual se admiten dos erratas en lugar de una
+FUZZY_TWO_EDITS_LENGTH = 10
+
+# Correcciones ya calculadas que se conservan por índice
+LOOKUP_CACHE_SIZE = 4096
+
+# Lista de palabras frecuentes del español general (forma parte del código fuente)
+DEFAULT_COMMON_WORDS_PATH = str(Path(__file__).resolve().parent.parent / "data" / "spanish_common_words.txt")
+
+
+def max_edits(word: str) -> int:
+    """Número de erratas que se admiten en una palabra según su longitud."""
+    if len(word) < FUZZY_MIN_LENGTH:
+        return 0
+    return 2 if len(word) >= FUZZY_TWO_EDITS_LENGTH else 1
+
+
+def edit_distance(a: str, b: str, max_distance: int) -> int:
+    """
+    Distancia de edición con transposiciones de letras contiguas (OSA),
+    acotada: en cuanto se supera max_distance devuelve max_distance + 1.
+
+    Args:
+        a (str): Primera palabra
+        b (str): Segunda palabra
+        max_distance (int): Distancia máxima que interesa
+
+    Returns:
+        int: Distancia, o max_distance + 1 si es mayor
+    """
+    if abs(len(a) - len(b)) > max_distance:
+        return max_distance + 1
+
+    previous_previous = None
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        row_min = i
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            value = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                value = min(value, previous_previous[j - 2] + 1)
+            current[j] = value
+            row_min = min(row_min, value)
+        if row_min > max_distance:
+            return max_distance + 1
+        previous_previous, previous = previous, current
+    return min(previous[-1], max_distance + 1)
+
+
+def _deletes(word: str, distance: int) -> Set[str]:
+    """Variantes de una palabra con hasta distance letras borradas (incluida ella misma)."""
+    variants = {word}
+    frontier = [word]
+    for _ in range(distance):
+        next_frontier = []
+        for variant in frontier:
+            for i in range(len(variant)):
+                deleted = variant[:i] + variant[i + 1:]
+                if deleted not in variants:
+                    variants.add(deleted)
+                    next_frontier.append(deleted)
+        frontier = next_frontier
+    return variants
+
+
+class FuzzyMatch(NamedTuple):
+    """Corrección de una palabra escrita."""
+    word: str
+    correction: str
+    distance: int
+
+
+class FuzzyIndex:
+    """
+    Índice de borrados (SymSpell) sobre un conjunto de palabras conocidas.
+
+    Las palabras se guardan en minúsculas; ante varias correcciones a la
+    misma distancia gana la que se añadió primero.
+    """
+
+    def __init__(self, max_distance: int = 2):
+        """
+        Args:
+            max_distance (int): Erratas máximas que se podrán corregir
+        """
+        self.max_distance = max_distance
+        self._words: Dict[str, int] = {}  # palabra -> orden de inserción
+        self._deletes: Dict[str, List[str]] = {}
+        self._cache: Dict[str, Optional[FuzzyMatch]] = {}
+
+    def add(self, word: str) -> None:
+        """
+        Añade una palabra conocida.
+
+        Args:
+            word (str): Palabra (se compara en minúsculas)
+        """
+        word = word.lower()
+        if word in self._words:
+            return
+
+        self._words[word] = len(self._words)
+        for variant in _deletes(word, min(self.max_distance, max_edits(word))):
+            self._deletes.setdefault(variant, []).append(word)
+        self._cache.clear()
+
+    def lookup(self, word: str) -> Optional[FuzzyMatch]:
+        """
+        Palabra conocida más cercana a la escrita.
+
+        Args:
+            word (str): Palabra escrita
+
+        Returns:
+            Optional[FuzzyMatch]: Corrección (distancia 0 si la palabra es
+            conocida), o None si ninguna está a la distancia admitida
+        """
+        word = word.lower()
+        if word in self._words:
+            return FuzzyMatch(word, word, 0)
+        if word in self._cache:
+            return self._cache[word]
+
+        match = self._lookup(word)
+        if len(self._cache) >= LOOKUP_CACHE_SIZE:
+            self._cache.clear()
+        self._cache[word] = match
+        return match
+
+    def _lookup(self, word: str) -> Optional[FuzzyMatch]:
+        """Búsqueda sin caché."""
+        allowed = min(self.max_distance, max_edits(word))
+        if allowed == 0:
+            return None
+
+        best = None
+        best_key = None
+        checked = set()
+        for variant in _deletes(word, allowed):
+            for candidate in self._deletes.get(variant, ()):
+                if candidate in checked:
+                    continue
+                checked.add(candidate)
+
+                # Las palabras conocidas cortas tampoco admiten tantas erratas
+                limit = min(allowed, max_edits(candidate))
+                if limit == 0:
+                    continue
+                distance = edit_distance(word, candidate, limit)
+                if distance > limit:
+                    continue
+
+                key = (distance, self._words[candidate])
+                if best_key is None or key < best_key:
+                    best = FuzzyMatch(word, candidate, distance)
+                    best_key = key
+        return best
+
+    def __contains__(self, word: str) -> bool:
+        return word in self._words
+
+    def __len__(self) -> int:
+        return len(self._words)
+
+
+def load_common_words(path: str = DEFAULT_COMMON_WORDS_PATH) -> FrozenSet[str]:
+    """
+    Carga una lista de palabras (una por línea; se ignoran las vacías y las que empiezan por #).
+
+    Args:
+        path (str): Ruta del fichero
+
+    Returns:
+        FrozenSet[str]: Palabras en minúsculas
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        words = frozenset(line.strip().lower() for line in f if line.strip() and not line.startswith('#'))
+    logger.debug(f"Palabras frecuentes cargadas: {len(words)}")
+    return words
+
+
+_common_words = None
+_common_words_lock = threading.Lock()
+
+
+def get_common_words() -> FrozenSet[str]:
+    """Devuelve las palabras frecuentes del español, cargadas la primera vez que se piden."""
+    global _common_words
+
+    with _common_words_lock:
+        if _common_words is None:
+            _common_words = load_common_words()
+    return _common_words
@@ -0,0 +1,326 @@
+'''
+Índice de Recuperación de Juegos por Embeddings
+Representa cada entrada de la base de conocimiento de juegos (descripción,
+género, plataformas, desarrollador) con los vectores Word2Vec existentes
+para encontrar juegos a partir de preguntas vagas, no solo por su título.
+Los vectores se centran restando la media de las entradas, como en el
+clasificador de categorías: sin centrar, casi cualquier mensaje se parece
+por igual a todos los juegos. Además, un juego solo se da por identificado
+si el mensaje comparte con su entrada algún término que no aparece en
+ninguna otra.
+'''
+
+import os
+import json
+import hashlib
+import logging
+from typing import Dict, List, Set, Tuple, Any, Optional
+
+import numpy as np
+
+# Configuración de logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+try:
+    from semantic_embeddings import tokenize_for_embeddings
+except ImportError:
+    from .semantic_embeddings import tokenize_for_embeddings
+
+# Palabras funcionales que no aportan significado al vector de un documento
+STOPWORDS = {
+    'el', 'la', 'los', 'las', 'un', 'una', 'unos', 'unas', 'de', 'del', 'al',
+    'a', 'y', 'o', 'e', 'en', 'es', 'son', 'para', 'por', 'con', 'sin', 'que',
+    'lo', 'su', 'sus', 'se', 'me', 'te', 'mi', 'tu', 'más', 'muy', 'como',
+}
+
+# Palabras de las fichas que no distinguen un juego de otro aunque solo aparezcan en una
+GENERIC_TERMS = {
+    'juego', 'juegos', 'videojuego', 'videojuegos', 'jugar', 'serie', 'donde', 'puede', 'puedes',
+    'pueden', 'hace', 'hay', 'tiene', 'modo', 'modos', 'elementos', 'varios', 'estudio', 'estudios',
+    'the', 'of',
+}
+
+# Umbrales (sobre vectores centrados) para considerar que una búsqueda identifica un juego concreto
+MIN_GAME_SCORE = 0.4     # Similitud coseno mínima del mejor resultado
+MIN_GAME_MARGIN = 0.15   # Ventaja mínima del primero sobre el segundo
+
+# Letras con las que se comparan los términos ("construyes" y "construir" comparten "const")
+TERM_STEM_LENGTH = 5
+
+INDEX_FORMAT_VERSION = 2
+
+
+def _game_document(title: str, info: Dict[str, Any]) -> str:
+    """Texto que representa una entrada de juego en el índice."""
+    return ' '.join([
+        title,
+        str(info.get('descripción', '')),
+        str(info.get('género', '')),
+        ' '.join(info.get('plataformas', [])),
+        str(info.get('desarrollador', '')),
+    ])
+
+
+def text_vector(wv, text: str) -> Optional[np.ndarray]:
+    """
+    Media normalizada de los vectores unitarios de las palabras del texto.
+
+    Args:
+        wv: Vectores de palabras (KeyedVectors o NumpyKeyedVectors)
+        text (str): Texto a representar
+
+    Returns:
+        Optional[np.ndarray]: Vector unitario o None si ninguna palabra está en el vocabulario
+    """
+    rows = [
+        wv.key_to_index[token]
+        for token in tokenize_for_embeddings(text)
+        if token not in STOPWORDS and token in wv.key_to_index
+    ]
+    if not rows:
+        return None
+
+    vectors = np.asarray(wv.vectors[rows], dtype=np.float32)
+    vectors /= np.maximum(np.linalg.norm(vectors, axis=1, keepdims=True), 1e-12)
+    mean = vectors.mean(axis=0)
+    norm = np.linalg.norm(mean)
+    return mean / norm if norm > 0 else None
+
+
+def text_terms(text: str) -> Set[str]:
+    """Términos de un texto (raíces de sus palabras con significado), para comparar mensajes y entradas."""
+    return {
+        token[:TERM_STEM_LENGTH] for token in tokenize_for_embeddings(text)
+        if token not in STOPWORDS and token not in GENERIC_TERMS
+    }
+
+
+def distinctive_terms(documents: List[str]) -> List[Set[str]]:
+    """
+    Términos de cada documento que no aparece en ningún otro.
+
+    Args:
+        documents (List[str]): Textos de las entradas
+
+    Returns:
+        List[Set[str]]: Términos exclusivos de cada entrada, en el mismo orden
+    """
+    terms = [text_terms(document) for document in documents]
+    frequency: Dict[str, int] = {}
+    for document_terms in terms:
+        for term in document_terms:
+            frequency[term] = frequency.get(term, 0) + 1
+    return [{term for term in document_terms if frequency[term] == 1} for document_terms in terms]
+
+
+def games_fingerprint(games: Dict[str, Dict[str, Any]]) -> str:
+    """Huella del contenido de los juegos, para invalidar índices guardados."""
+    payload = json.dumps(games, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+
+class GameIndex:
+    """
+    Índice vectorial sobre las entradas de juegos.
+
+    Guarda una matriz normalizada (un vector centrado por juego) para
+    resolver cada consulta con un único producto matriz-vector y una
+    selección top-k, y los términos exclusivos de cada entrada.
+    """
+
+    def __init__(self, titles: List[str], matrix: np.ndarray, center: np.ndarray,
+                 terms: List[Set[str]], fingerprint: str, embeddings_version: Optional[int] = None):
+        """
+        Args:
+            titles (List[str]): Títulos de los juegos, en el orden de las filas
+            matrix (np.ndarray): Vectores centrados y normalizados (n_juegos, dimensión)
+            center (np.ndarray): Media de los vectores de las entradas
+            terms (List[Set[str]]): Términos exclusivos de cada entrada, en el orden de las filas
+            fingerprint (str): Huella de los juegos indexados
+            embeddings_version (Optional[int]): Versión de los vectores usados
+        """
+        self.titles = titles
+        self.matrix = matrix
+        self.center = center
+        self.terms = terms
+        self.fingerprint = fingerprint
+        self.embeddings_version = embeddings_version
+
+    @classmethod
+    def build(cls, embeddings, games: Dict[str, Dict[str, Any]]) -> 'GameIndex':
+        """
+        Construye el índice a partir de los juegos y los embeddings cargados.
+
+        Args:
+            embeddings (SemanticEmbeddings): Embeddings entrenados
+            games (Dict[str, Dict[str, Any]]): Información de los juegos por título
+
+        Returns:
+            GameIndex: Índice construido
+        """
+        wv = embeddings.wv
+        titles = []
+        documents = []
+        rows = []
+        for title, info in games.items():
+            document = _game_document(title, info)
+            vector = text_vector(wv, document)
+            if vector is not None:
+                titles.append(title)
+                documents.append(document)
+                rows.append(vector)
+
+        # Con una sola entrada no hay dirección común que quitar
+        center = np.mean(rows, axis=0) if len(rows) > 1 else np.zeros(wv.vector_size)
+        matrix = np.zeros((len(rows), wv.vector_size), dtype=np.float32)
+        for i, vector in enumerate(rows):
+            centered = vector - center
+            norm = np.linalg.norm(centered)
+            if norm > 0:
+                matrix[i] = centered / norm
+
+        logger.info(f"Índice de juegos construido: {len(titles)} entradas")
+        return cls(titles, matrix, center.astype(np.float32), distinctive_terms(documents),
+                   games_fingerprint(games), embeddings.vectors_version)
+
+    def save(self, index_dir: str) -> bool:
+        """
+        Guarda el índice en disco (matriz .npy + metadatos .json).
+
+        Returns:
+            bool: True si se guardó exitosamente
+        """
+        try:
+            os.makedirs(index_dir, exist_ok=True)
+            matrix_path = os.path.join(index_dir, "games.npy")
+            tmp_path = f"{matrix_path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                np.save(f, self.matrix)
+            os.replace(tmp_path, matrix_path)
+
+            meta = {
+                'format_version': INDEX_FORMAT_VERSION,
+                'titles': self.titles,
+                'center': [float(value) for value in self.center],
+                'terms': [sorted(terms) for terms in self.terms],
+                'fingerprint': self.fingerprint,
+                'embeddings_version': self.embeddings_version,
+            }
+            meta_path = os.path.join(index_dir, "games.json")
+            tmp_path = f"{meta_path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(meta, f, ensure_ascii=False)
+            os.replace(tmp_path, meta_path)
+            return True
+        except Exception as e:
+            logger.error(f"Error al guardar el índice de juegos: {str(e)}")
+            return False
+
+    @classmethod
+    def load(cls, index_dir: str) -> Optional['GameIndex']:
+        """
+        Carga un índice guardado (la matriz se mapea en memoria).
+
+        Returns:
+            Optional[GameIndex]: Índice cargado o None si no existe o es inválido
+        """
+        meta_path = os.path.join(index_dir, "games.json")
+        if not os.path.exists(meta_path):
+            return None
+
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            if meta.get('format_version') != INDEX_FORMAT_VERSION:
+                return None
+
+            matrix = np.load(os.path.join(index_dir, "games.npy"), mmap_mode='r')
+            if matrix.shape[0] != len(meta['titles']):
+                return None
+            center = np.asarray(meta['center'], dtype=np.float32)
+            terms = [set(game_terms) for game_terms in meta['terms']]
+            return cls(meta['titles'], matrix, center, terms, meta['fingerprint'], meta.get('embeddings_version'))
+        except Exception as e:
+            logger.error(f"Error al cargar el índice de juegos: {str(e)}")
+            return None
+
+    def is_current(self, embeddings, games: Dict[str, Dict[str, Any]]) -> bool:
+        """Indica si el índice corresponde a estos juegos y a esta versión de vectores."""
+        return (self.embeddings_version == embeddings.vectors_version
+                and self.fingerprint == games_fingerprint(games))
+
+    def search(self, embeddings, text: str, topk: int = 3) -> List[Tuple[str, float]]:
+        """
+        Busca los juegos más cercanos a un mensaje.
+
+        Args:
+            embeddings (SemanticEmbeddings): Embeddings con los que se construyó el índice
+            text (str): Mensaje del usuario
+            topk (int): Número de resultados
+
+        Returns:
+            List[Tuple[str, float]]: Lista de tuplas (título, similitud) ordenada
+        """
+        if not self.titles:
+            return []
+
+        query = text_vector(embeddings.wv, text)
+        if query is None:
+            return []
+
+        query = query - self.center
+        norm = np.linalg.norm(query)
+        if norm == 0:
+            return []
+        scores = self.matrix @ (query / norm)
+        topk = min(topk, len(scores))
+        if topk < len(scores):
+            best = np.argpartition(-scores, topk - 1)[:topk]
+        else:
+            best = np.arange(len(scores))
+        best = best[np.argsort(-scores[best], kind='stable')]
+        return [(self.titles[i], float(scores[i])) for i in best]
+
+    def best_match(self, embeddings, text: str) -> Optional[Tuple[str, float]]:
+        """
+        Devuelve el juego al que se refiere el mensaje si la coincidencia es
+        clara y el mensaje comparte algún término exclusivo con su entrada.
+
+        Args:
+            embeddings (SemanticEmbeddings): Embeddings con los que se construyó el índice
+            text (str): Mensaje del usuario
+
+        Returns:
+            Optional[Tuple[str, float]]: (título, similitud) o None
+        """
+        results = self.search(embeddings, text, topk=2)
+        if not results or results[0][1] < MIN_GAME_SCORE:
+            return None
+        if len(results) > 1 and results[0][1] - results[1][1] < MIN_GAME_MARGIN:
+            return None
+        if self.terms[self.titles.index(results[0][0])].isdisjoint(text_terms(text)):
+            return None
+        return results[0]
+
+
+def load_or_build_game_index(embeddings, games: Dict[str, Dict[str, Any]],
+                             index_dir: str = "models/game_index") -> GameIndex:
+    """
+    Carga el índice desde disco si está al día; si no, lo construye y lo guarda.
+
+    Args:
+        embeddings (SemanticEmbeddings): Embeddings entrenados
+        games (Dict[str, Dict[str, Any]]): Información de los juegos por título
+        index_dir (str): Directorio del índice guardado
+
+    Returns:
+        GameIndex: Índice listo para consultas
+    """
+    index = GameIndex.load(index_dir)
+    if index is not None and index.is_current(embeddings, games):
+        return index
+
+    index = GameIndex.build(embeddings, games)
+    index.save(index_dir)
+    return index
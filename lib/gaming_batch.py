@@ -0,0 +1,253 @@
+'''
+Análisis por Lotes de Mensajes de Videojuegos
+Aplica analyze_gaming_content a colecciones grandes de mensajes (ficheros
+JSONL con millones de líneas) en un pool de procesos:
+
+- Lectura y escritura en streaming, línea a línea, sin cargar el fichero
+- Cada proceso carga los embeddings y los índices una sola vez, al arrancar
+- Los resultados se escriben en el mismo orden que la entrada, una línea de
+  salida por cada línea de entrada (las vacías llevan un registro de error)
+- Un punto de control permite reanudar un análisis interrumpido
+- El informe final incluye mensajes/segundo
+'''
+
+import os
+import json
+import time
+import itertools
+import logging
+import multiprocessing
+from typing import Dict, Any, Iterable, Iterator, Optional, Tuple
+
+# Configuración de logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+try:
+    from gaming_knowledge import analyze_gaming_content, get_knowledge_indexes, EMBEDDINGS_AVAILABLE
+    if EMBEDDINGS_AVAILABLE:
+        from semantic_embeddings import get_shared_embeddings
+except ImportError:
+    from .gaming_knowledge import analyze_gaming_content, get_knowledge_indexes, EMBEDDINGS_AVAILABLE
+    if EMBEDDINGS_AVAILABLE:
+        from .semantic_embeddings import get_shared_embeddings
+
+# Mensajes que se envían juntos a cada proceso
+DEFAULT_CHUNKSIZE = 64
+
+# Mensajes entre dos puntos de control
+DEFAULT_CHECKPOINT_EVERY = 10000
+
+# Campo del resultado que se añade a cada registro de salida
+RESULT_FIELD = 'gaming_analysis'
+
+
+def _init_worker() -> None:
+    """
+    Inicializa un proceso del pool: carga los embeddings, el autómata de
+    palabras clave, el índice de erratas y el de facetas antes del primer mensaje.
+    """
+    logging.getLogger().setLevel(logging.WARNING)
+    logging.getLogger('semantic_embeddings').setLevel(logging.ERROR)
+    if EMBEDDINGS_AVAILABLE:
+        get_shared_embeddings()
+    get_knowledge_indexes()
+
+
+def _analyze_line(task: Tuple[str, str]) -> Tuple[str, bool]:
+    """
+    Analiza una línea JSONL y devuelve la línea de salida ya serializada
+    (la serialización también se reparte entre los procesos).
+
+    Args:
+        task: (línea JSONL, campo con el texto)
+
+    Returns:
+        Tuple[str, bool]: Registro de entrada con el análisis en RESULT_FIELD
+        (o un registro con 'error' si la línea está vacía o no se pudo
+        analizar) e indicador de éxito
+    """
+    line, text_field = task
+    if not line.strip():
+        return json.dumps({'error': 'línea vacía'}, ensure_ascii=False), False
+    try:
+        record = json.loads(line)
+        text = record.get(text_field) if isinstance(record, dict) else None
+        if not isinstance(text, str):
+            raise ValueError(f"La línea no tiene el campo de texto '{text_field}'")
+        record[RESULT_FIELD] = analyze_gaming_content(text)
+        return json.dumps(record, ensure_ascii=False), True
+    except Exception as e:
+        return json.dumps({'error': str(e), 'line': line.rstrip('\n')}, ensure_ascii=False), False
+
+
+def _create_pool(workers: Optional[int]):
+    """Pool de procesos nuevos (spawn) que cargan los índices una vez al arrancar."""
+    # Los embeddings y el modelo deben existir antes de arrancar los procesos,
+    # para que no los entrene cada uno por su cuenta
+    if EMBEDDINGS_AVAILABLE:
+        get_shared_embeddings()
+    context = multiprocessing.get_context('spawn')
+    return context.Pool(processes=workers, initializer=_init_worker)
+
+
+def analyze_gaming_batch(texts: Iterable[str], workers: Optional[int] = None,
+                         chunksize: int = DEFAULT_CHUNKSIZE) -> Iterator[Dict[str, Any]]:
+    """
+    Analiza muchos mensajes en paralelo, devolviendo los resultados en orden.
+
+    Args:
+        texts (Iterable[str]): Mensajes (se consumen a medida que se procesan)
+        workers (Optional[int]): Procesos del pool (por defecto, todos los
+            núcleos; 1 analiza en el propio proceso)
+        chunksize (int): Mensajes que se envían juntos a cada proceso
+
+    Returns:
+        Iterator[Dict[str, Any]]: Resultados de analyze_gaming_content, uno por mensaje
+    """
+    if workers == 1:
+        yield from map(analyze_gaming_content, texts)
+        return
+
+    with _create_pool(workers) as pool:
+        yield from pool.imap(analyze_gaming_content, texts, chunksize=chunksize)
+
+
+def _read_checkpoint(checkpoint_path: str, input_path: str) -> Optional[Dict[str, Any]]:
+    """Lee el punto de control si corresponde al mismo fichero de entrada."""
+    try:
+        with open(checkpoint_path, 'r', encoding='utf-8') as f:
+            checkpoint = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    stat = os.stat(input_path)
+    if checkpoint.get('input') != os.path.abspath(input_path) or checkpoint.get('input_size') != stat.st_size:
+        logger.warning("El punto de control es de otro fichero de entrada; se empieza desde el principio")
+        return None
+    return checkpoint
+
+
+def _write_checkpoint(checkpoint_path: str, checkpoint: Dict[str, Any]) -> None:
+    """Guarda el punto de control de forma atómica."""
+    tmp_path = f"{checkpoint_path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(checkpoint, f)
+    os.replace(tmp_path, checkpoint_path)
+
+
+def analyze_gaming_file(input_path: str, output_path: str, workers: Optional[int] = None,
+                        chunksize: int = DEFAULT_CHUNKSIZE, text_field: str = 'text',
+                        resume: bool = False,
+                        checkpoint_every: int = DEFAULT_CHECKPOINT_EVERY) -> Dict[str, Any]:
+    """
+    Analiza un fichero JSONL de mensajes y escribe otro JSONL con una línea
+    por cada línea de entrada, en el mismo orden. Las líneas vacías o que no
+    se pueden analizar producen un registro con 'error' y cuentan como errores.
+
+    El punto de control (<salida>.checkpoint.json) guarda cuántas líneas se
+    han escrito y el tamaño de la salida en ese momento; al reanudar, la
+    salida se recorta a ese tamaño y se saltan las líneas ya procesadas.
+
+    Args:
+        input_path (str): Fichero JSONL de entrada
+        output_path (str): Fichero JSONL de salida
+        workers (Optional[int]): Procesos del pool (por defecto, todos los núcleos)
+        chunksize (int): Mensajes que se envían juntos a cada proceso
+        text_field (str): Campo con el texto en cada línea
+        resume (bool): Continuar desde el punto de control, si existe
+        checkpoint_every (int): Mensajes entre dos puntos de control (mayor que 0)
+
+    Returns:
+        Dict[str, Any]: Líneas procesadas en esta ejecución y saltadas por el
+        punto de control, errores, tiempo y mensajes/segundo
+    """
+    checkpoint_path = f"{output_path}.checkpoint.json"
+    try:
+        if checkpoint_every <= 0:
+            raise ValueError(f"checkpoint_every debe ser mayor que 0: {checkpoint_every}")
+        checkpoint = _read_checkpoint(checkpoint_path, input_path) if resume else None
+        if checkpoint and not os.path.exists(output_path):
+            logger.warning("No existe la salida del punto de control; se empieza desde el principio")
+            checkpoint = None
+        skipped = checkpoint['processed'] if checkpoint else 0
+        if checkpoint and checkpoint.get('completed'):
+            logger.info("El análisis ya estaba completo")
+            return {'success': True, 'processed': 0, 'skipped': skipped, 'errors': 0,
+                    'seconds': 0.0, 'messages_per_sec': None, 'output': output_path}
+
+        output_dir = os.path.dirname(output_path)
+        if output_dir:
+            os.makedirs(output_dir, exist_ok=True)
+
+        state = {
+            'input': os.path.abspath(input_path),
+            'input_size': os.stat(input_path).st_size,
+            'processed': skipped,
+            'output_bytes': checkpoint['output_bytes'] if checkpoint else 0,
+            'completed': False,
+        }
+
+        processed = 0
+        errors = 0
+        start_time = time.perf_counter()
+        last_report = start_time
+
+        with open(input_path, 'r', encoding='utf-8') as source, \
+                open(output_path, 'r+b' if checkpoint else 'wb') as output:
+            # Descartar lo escrito después del último punto de control
+            output.truncate(state['output_bytes'])
+            output.seek(state['output_bytes'])
+
+            # Las líneas vacías también cuentan, para que el punto de control sea un número de línea
+            lines = itertools.islice(source, skipped, None)
+            tasks = ((line, text_field) for line in lines)
+
+            if workers == 1:
+                results = map(_analyze_line, tasks)
+                pool = None
+            else:
+                pool = _create_pool(workers)
+                results = pool.imap(_analyze_line, tasks, chunksize=chunksize)
+
+            try:
+                for result, ok in results:
+                    processed += 1
+                    output.write(result.encode('utf-8') + b'\n')
+                    if not ok:
+                        errors += 1
+
+                    if processed % checkpoint_every == 0:
+                        output.flush()
+                        state['processed'] = skipped + processed
+                        state['output_bytes'] = output.tell()
+                        _write_checkpoint(checkpoint_path, state)
+
+                        now = time.perf_counter()
+                        logger.info(f"{skipped + processed} mensajes "
+                                    f"({checkpoint_every / (now - last_report):.1f} mensajes/s)")
+                        last_report = now
+            finally:
+                if pool is not None:
+                    pool.terminate()
+
+            output.flush()
+            state['processed'] = skipped + processed
+            state['output_bytes'] = output.tell()
+            state['completed'] = True
+            _write_checkpoint(checkpoint_path, state)
+
+        seconds = time.perf_counter() - start_time
+        return {
+            'success': True,
+            'processed': processed,
+            'skipped': skipped,
+            'errors': errors,
+            'seconds': round(seconds, 3),
+            'messages_per_sec': round(processed / seconds, 1) if seconds > 0 else None,
+            'workers': workers or os.cpu_count(),
+            'output': output_path,
+        }
+    except Exception as e:
+        logger.error(f"Error en el análisis por lotes: {str(e)}")
+        return {'success': False, 'error': str(e)}
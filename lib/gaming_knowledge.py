@@ -4,388 +4,698 @@ Contiene información, vocabulario y respuestas relacionadas con videojuegos
 para ser utilizado por el chatbot de PLN especializado en videojuegos.
 '''
 
-from typing import Dict, List, Tuple, Any
+from typing import Dict, List, Tuple, Any, Optional, NamedTuple
+from collections import OrderedDict
+from functools import cached_property
+import copy
+import threading
 import logging
 
 # Configuración de logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+try:
+    from keyword_matcher import KeywordMatcher, split_words
+    from facet_index import FacetIndex
+    from fuzzy_match import FuzzyIndex, get_common_words
+    from knowledge_store import get_knowledge_store
+except ImportError:
+    from .keyword_matcher import KeywordMatcher, split_words
+    from .facet_index import FacetIndex
+    from .fuzzy_match import FuzzyIndex, get_common_words
+    from .knowledge_store import get_knowledge_store
+
 # Importar módulo de embeddings semánticos
 try:
-    from semantic_embeddings import SemanticEmbeddings, get_similar_terms_for_word, analyze_gaming_text_similarities
+    from semantic_embeddings import SemanticEmbeddings, get_similar_terms_for_word, analyze_gaming_text_similarities, get_shared_embeddings
+    from game_index import load_or_build_game_index
+    from category_classifier import CategoryClassifier, MIN_CATEGORY_SCORE
     EMBEDDINGS_AVAILABLE = True
 except ImportError:
     try:
-        from .semantic_embeddings import SemanticEmbeddings, get_similar_terms_for_word, analyze_gaming_text_similarities
+        from .semantic_embeddings import SemanticEmbeddings, get_similar_terms_for_word, analyze_gaming_text_similarities, get_shared_embeddings
+        from .game_index import load_or_build_game_index
+        from .category_classifier import CategoryClassifier, MIN_CATEGORY_SCORE
         EMBEDDINGS_AVAILABLE = True
     except ImportError:
         logger.warning("Módulo de embeddings semánticos no disponible")
         EMBEDDINGS_AVAILABLE = False
 
-# Vocabulario de videojuegos (palabras clave y sus categorías)
-GAMING_VOCABULARY = {
-    # Géneros de videojuegos
-    'acción': 'género',
-    'aventura': 'género',
-    'rpg': 'género',
-    'estrategia': 'género',
-    'shooter': 'género',
-    'fps': 'género',
-    'mmorpg': 'género',
-    'simulación': 'género',
-    'deportes': 'género',
-    'carreras': 'género',
-    'puzzle': 'género',
-    'plataformas': 'género',
-    'roguelike': 'género',
-    'metroidvania': 'género',
-    'battle royale': 'género',
-    'moba': 'género',
-    'sandbox': 'género',
-    'mundo abierto': 'género',
-    'survival': 'género',
-    'terror': 'género',
-    'horror': 'género',
-    
-    # Plataformas
-    'pc': 'plataforma',
-    'playstation': 'plataforma',
-    'ps4': 'plataforma',
-    'ps5': 'plataforma',
-    'xbox': 'plataforma',
-    'xbox one': 'plataforma',
-    'xbox series': 'plataforma',
-    'nintendo': 'plataforma',
-    'switch': 'plataforma',
-    'móvil': 'plataforma',
-    'android': 'plataforma',
-    'ios': 'plataforma',
-    
-    # Compañías y desarrolladores
-    'nintendo': 'compañía',
-    'sony': 'compañía',
-    'microsoft': 'compañía',
-    'ubisoft': 'compañía',
-    'ea': 'compañía',
-    'electronic arts': 'compañía',
-    'activision': 'compañía',
-    'blizzard': 'compañía',
-    'rockstar': 'compañía',
-    'valve': 'compañía',
-    'bethesda': 'compañía',
-    'capcom': 'compañía',
-    'square enix': 'compañía',
-    'konami': 'compañía',
-    'sega': 'compañía',
-    'bandai namco': 'compañía',
-    'cd projekt': 'compañía',
-    'epic games': 'compañía',
-    'riot games': 'compañía',
-    
-    # Juegos populares
-    'minecraft': 'juego',
-    'fortnite': 'juego',
-    'call of duty': 'juego',
-    'gta': 'juego',
-    'grand theft auto': 'juego',
-    'fifa': 'juego',
-    'the legend of zelda': 'juego',
-    'mario': 'juego',
-    'super mario': 'juego',
-    'pokemon': 'juego',
-    'overwatch': 'juego',
-    'league of legends': 'juego',
-    'dota': 'juego',
-    'world of warcraft': 'juego',
-    'the witcher': 'juego',
-    'dark souls': 'juego',
-    'elden ring': 'juego',
-    'cyberpunk': 'juego',
-    'assassin\'s creed': 'juego',
-    'red dead redemption': 'juego',
-    'halo': 'juego',
-    'god of war': 'juego',
-    'horizon': 'juego',
-    'final fantasy': 'juego',
-    'resident evil': 'juego',
-    'valorant': 'juego',
-    'apex legends': 'juego',
-    'among us': 'juego',
-    'roblox': 'juego',
-    
-    # Términos técnicos
-    'fps': 'técnico',
-    'gráficos': 'técnico',
-    'resolución': 'técnico',
-    'hdr': 'técnico',
-    'ray tracing': 'técnico',
-    'dlss': 'técnico',
-    'latencia': 'técnico',
-    'ping': 'técnico',
-    'lag': 'técnico',
-    'bug': 'técnico',
-    'glitch': 'técnico',
-    'parche': 'técnico',
-    'actualización': 'técnico',
-    'dlc': 'técnico',
-    'expansión': 'técnico',
-    'mod': 'técnico',
-    'shader': 'técnico',
-    'textura': 'técnico',
-    'renderizado': 'técnico',
-    
-    # Términos de gameplay
-    'nivel': 'gameplay',
-    'misión': 'gameplay',
-    'quest': 'gameplay',
-    'jefe': 'gameplay',
-    'boss': 'gameplay',
-    'npc': 'gameplay',
-    'personaje': 'gameplay',
-    'inventario': 'gameplay',
-    'habilidad': 'gameplay',
-    'skill': 'gameplay',
-    'arma': 'gameplay',
-    'equipo': 'gameplay',
-    'crafteo': 'gameplay',
-    'crafting': 'gameplay',
-    'farmeo': 'gameplay',
-    'farming': 'gameplay',
-    'loot': 'gameplay',
-    'botín': 'gameplay',
-    'pvp': 'gameplay',
-    'pve': 'gameplay',
-    'multijugador': 'gameplay',
-    'cooperativo': 'gameplay',
-    'competitivo': 'gameplay',
-    'campaña': 'gameplay',
-    'historia': 'gameplay',
-    'logro': 'gameplay',
-    'trofeo': 'gameplay',
-    'achievement': 'gameplay',
-    'speedrun': 'gameplay',
-    'easter egg': 'gameplay',
+# El vocabulario (GAMING_VOCABULARY), las respuestas temáticas (GAMING_RESPONSES)
+# y las fichas de juegos (GAME_INFO) viven en la base de conocimiento SQLite,
+# importada desde data/gaming_knowledge.json. Se consultan bajo demanda con
+# get_knowledge_store(); los tres nombres siguen disponibles como atributos
+# del módulo, pero leerlos carga el catálogo completo.
+_KNOWLEDGE_ATTRIBUTES = {
+    'GAME_INFO': lambda store: store.games(),
+    'GAMING_VOCABULARY': lambda store: store.vocabulary(),
+    'GAMING_RESPONSES': lambda store: {category: store.responses(category) for category in store.response_categories()},
 }
 
-# Respuestas temáticas sobre videojuegos
-GAMING_RESPONSES = {
-    'general': [
-        "Los videojuegos son una forma de entretenimiento interactivo que ha evolucionado enormemente desde sus inicios. ¿Qué aspecto te interesa más?",
-        "El mundo de los videojuegos es muy amplio, abarcando desde juegos indie hasta grandes producciones AAA. ¿Tienes algún género favorito?",
-        "Los videojuegos combinan narrativa, arte, música y tecnología de formas únicas. ¿Qué juegos has disfrutado recientemente?",
-        "La industria de los videojuegos genera más ingresos que la música y el cine combinados. ¿Qué plataforma utilizas para jugar?",
-        "Los videojuegos pueden ser experiencias solitarias profundas o conectar a millones de personas en todo el mundo. ¿Prefieres jugar solo o en multijugador?",
-    ],
-    
-    'géneros': [
-        "Los géneros de videojuegos incluyen acción, aventura, RPG, estrategia, simulación, deportes, y muchos más. Cada uno ofrece experiencias muy diferentes.",
-        "Los RPG (juegos de rol) te permiten desarrollar personajes a lo largo de extensas historias, mientras que los FPS se centran en la acción en primera persona.",
-        "Los juegos de mundo abierto como GTA o The Witcher ofrecen libertad para explorar, mientras que los roguelikes como Hades o Dead Cells se basan en partidas cortas con alta rejugabilidad.",
-        "Los MOBA como League of Legends y los Battle Royale como Fortnite han dominado la escena competitiva en los últimos años.",
-        "Los juegos de plataformas como Mario siguen siendo populares décadas después de su creación, mostrando que el buen diseño de niveles es atemporal.",
-    ],
-    
-    'plataformas': [
-        "Las principales plataformas de juego actuales son PC, PlayStation 5, Xbox Series X/S y Nintendo Switch, cada una con sus exclusivos y ventajas.",
-        "El PC ofrece la mayor versatilidad y potencia gráfica, mientras que las consolas proporcionan una experiencia más accesible y optimizada.",
-        "El gaming móvil ha crecido enormemente, con títulos como Genshin Impact demostrando que los juegos de alta calidad también pueden funcionar en smartphones.",
-        "La retrocompatibilidad es una característica importante en las consolas modernas, permitiéndote jugar a títulos de generaciones anteriores.",
-        "Las plataformas de streaming como Xbox Cloud Gaming y GeForce Now están cambiando la forma en que accedemos a los juegos, eliminando la necesidad de hardware potente.",
-    ],
-    
-    'tecnología': [
-        "Los avances en ray tracing están revolucionando los gráficos de los videojuegos, creando iluminación y reflejos mucho más realistas.",
-        "Las tecnologías como DLSS de NVIDIA utilizan IA para mejorar el rendimiento sin sacrificar la calidad visual.",
-        "Los SSD de alta velocidad en las consolas de nueva generación han reducido drásticamente los tiempos de carga y permiten mundos más detallados.",
-        "La realidad virtual (VR) y aumentada (AR) están creando nuevas formas de interactuar con los videojuegos, aumentando la inmersión.",
-        "El audio 3D y las características hápticas de controladores como el DualSense de PS5 añaden nuevas dimensiones a la experiencia de juego.",
-    ],
-    
-    'industria': [
-        "La industria de los videojuegos está en constante evolución, con nuevos modelos de negocio como el free-to-play y los servicios de suscripción.",
-        "Los estudios indie han florecido en la última década, creando algunos de los juegos más innovadores y aclamados por la crítica.",
-        "Las adquisiciones de estudios por parte de grandes compañías como Microsoft (Bethesda, Activision Blizzard) están cambiando el panorama de la industria.",
-        "Los eventos como E3, Gamescom y The Game Awards son momentos clave donde se anuncian los nuevos títulos y tendencias.",
-        "El desarrollo de videojuegos es un proceso complejo que puede llevar años y requiere equipos multidisciplinares de programadores, artistas, diseñadores y más.",
-    ],
-    
-    'cultura': [
-        "Los esports han crecido hasta convertirse en un fenómeno global con millones de espectadores y premios millonarios.",
-        "Los streamers y creadores de contenido han transformado cómo descubrimos y experimentamos los videojuegos.",
-        "Los videojuegos han inspirado películas, series, libros y otros medios, demostrando su impacto cultural.",
-        "Muchos videojuegos exploran temas profundos como la ética, la filosofía, la política y las relaciones humanas.",
-        "Las comunidades de modding extienden la vida de los juegos creando nuevo contenido y mejoras para títulos existentes.",
-    ],
-    
-    'fuera_de_tema': [
-        "Estamos hablando de videojuegos. Si tienes alguna pregunta o comentario sobre juegos, consolas, o la industria gaming, estaré encantado de seguir la conversación.",
-        "Parece que nos estamos desviando del tema de los videojuegos. ¿Te gustaría que volvamos a hablar sobre algún aspecto del mundo gaming?",
-        "Como especialista en videojuegos, puedo ofrecerte información sobre juegos, plataformas, géneros y más. ¿Hay algo específico del mundo gaming que te interese?",
-        "Mi conocimiento se centra en videojuegos. Si quieres hablar de otro tema, puedo intentar relacionarlo con el mundo de los videojuegos si es posible.",
-        "Estoy especializado en conversar sobre videojuegos. ¿Quieres que hablemos sobre algún juego, consola o tendencia reciente en la industria?",
-    ]
+def __getattr__(name: str) -> Any:
+    """Materializa GAME_INFO, GAMING_VOCABULARY o GAMING_RESPONSES desde la base de conocimiento."""
+    if name in _KNOWLEDGE_ATTRIBUTES:
+        return _KNOWLEDGE_ATTRIBUTES[name](get_knowledge_store())
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def build_gaming_matcher(vocabulary: Dict[str, str], games: Dict[str, Dict[str, Any]]) -> KeywordMatcher:
+    """
+    Compila las palabras clave del vocabulario y los títulos de juegos (con
+    sus alias) en un único autómata de Aho–Corasick.
+    
+    Args:
+        vocabulary (Dict[str, str]): Palabras clave y su categoría
+        games (Dict[str, Dict[str, Any]]): Información de los juegos por título
+        
+    Returns:
+        KeywordMatcher: Autómata listo para buscar
+    """
+    matcher = KeywordMatcher()
+    for keyword, category in vocabulary.items():
+        matcher.add(keyword, ('keyword', category))
+    for game, info in games.items():
+        matcher.add(game, ('game', game))
+        for alias in info.get('alias', []):
+            matcher.add(alias, ('game', game))
+    return matcher.build()
+
+def build_gaming_fuzzy_index(matcher: KeywordMatcher) -> FuzzyIndex:
+    """
+    Índice de erratas sobre las palabras que forman las palabras clave y
+    los títulos del autómata.
+    
+    Args:
+        matcher (KeywordMatcher): Autómata de palabras clave y títulos
+        
+    Returns:
+        FuzzyIndex: Índice listo para corregir palabras
+    """
+    index = FuzzyIndex()
+    for keyword in matcher.keywords():
+        for word in split_words(keyword):
+            index.add(word)
+    return index
+
+class KnowledgeIndexes(NamedTuple):
+    """
+    Índices derivados de la base de conocimiento (autómata de palabras clave
+    y títulos, índice de erratas e índice de atributos), todos de la misma
+    versión, junto con las fichas de los juegos de esa versión: un título
+    encontrado con estos índices siempre tiene ficha, aunque la base ya
+    sirva otra versión.
+    """
+    version: int
+    sections: Dict[str, str]
+    matcher: KeywordMatcher
+    fuzzy_index: FuzzyIndex
+    facets: FacetIndex
+    games: Dict[str, Dict[str, Any]]
+
+# Índices en uso: se sustituyen enteros con una sola asignación, así que un
+# mensaje nunca ve unos de una versión y otros de otra
+_knowledge_indexes = None
+_knowledge_lock = threading.Lock()
+
+def _build_knowledge_indexes(store, previous: Optional[KnowledgeIndexes]) -> KnowledgeIndexes:
+    """
+    Construye los índices de la versión actual de la base, reutilizando los
+    de la versión anterior cuyas secciones de origen no han cambiado.
+    
+    Args:
+        store (KnowledgeStore): Base de conocimiento
+        previous (Optional[KnowledgeIndexes]): Índices de la versión anterior
+        
+    Returns:
+        KnowledgeIndexes: Índices de la versión actual
+    """
+    store.sections()  # Abre la base si aún no se ha abierto
+    version = store.version
+    sections = store.sections()
+    old_sections = previous.sections if previous is not None else {}
+    
+    rebuild_matcher = previous is None or any(
+        old_sections.get(name) != sections.get(name) for name in ('vocabulary', 'titles'))
+    rebuild_facets = previous is None or old_sections.get('games') != sections.get('games')
+    games = store.games() if rebuild_matcher or rebuild_facets else previous.games
+    
+    if rebuild_matcher:
+        matcher = build_gaming_matcher(store.vocabulary(), games)
+        fuzzy_index = build_gaming_fuzzy_index(matcher)
+    else:
+        matcher, fuzzy_index = previous.matcher, previous.fuzzy_index
+    facets = FacetIndex(games) if rebuild_facets else previous.facets
+    
+    if previous is not None:
+        rebuilt = [name for name, flag in (('palabras clave', rebuild_matcher), ('facetas', rebuild_facets)) if flag]
+        logger.info(f"Índices de conocimiento en la versión {version}; reconstruidos: {', '.join(rebuilt) or 'ninguno'}")
+    return KnowledgeIndexes(version, sections, matcher, fuzzy_index, facets, games)
+
+def get_knowledge_indexes() -> KnowledgeIndexes:
+    """
+    Devuelve los índices de la versión actual de la base de conocimiento,
+    construyéndolos la primera vez y cuando la base se recarga.
+    
+    Mientras un hilo reconstruye los índices, el resto sigue usando los de
+    la versión anterior en lugar de esperar.
+    """
+    global _knowledge_indexes
+    store = get_knowledge_store()
+    indexes = _knowledge_indexes
+    if indexes is not None and indexes.version == store.version:
+        return indexes
+    
+    if not _knowledge_lock.acquire(blocking=indexes is None):
+        return indexes
+    try:
+        indexes = _knowledge_indexes
+        if indexes is None or indexes.version != store.version:
+            indexes = _build_knowledge_indexes(store, indexes)
+            _knowledge_indexes = indexes
+            store.add_reload_listener(_on_knowledge_reload)
+        return indexes
+    finally:
+        _knowledge_lock.release()
+
+def _on_knowledge_reload(store) -> None:
+    """Reconstruye los índices en el hilo que recarga la base, antes de que los pida un mensaje."""
+    get_knowledge_indexes()
+    with _analysis_lock:
+        _analysis_cache.clear()
+
+def get_gaming_matcher() -> KeywordMatcher:
+    """Devuelve el autómata de palabras clave y títulos de la versión actual."""
+    return get_knowledge_indexes().matcher
+
+def get_gaming_fuzzy_index() -> FuzzyIndex:
+    """Devuelve el índice de erratas de palabras clave y títulos de la versión actual."""
+    return get_knowledge_indexes().fuzzy_index
+
+def get_game_facets() -> FacetIndex:
+    """Devuelve el índice de facetas de los juegos de la versión actual."""
+    return get_knowledge_indexes().facets
+
+# Palabras que convierten un mensaje con atributos en una petición de juegos
+ATTRIBUTE_QUESTION_WORDS = {'juegos', 'títulos', 'cuáles', 'cuales'}
+
+# Palabras que pueden acompañar a los atributos en una pregunta que solo
+# pide la lista de juegos ("qué juegos hay de PC o móvil"); cualquier otra
+# hace de la pregunta una conversación abierta
+ATTRIBUTE_FILLER_WORDS = ATTRIBUTE_QUESTION_WORDS | {
+    'qué', 'que', 'cuál', 'cual', 'hay', 'son', 'existen', 'conoces', 'dime', 'dame', 'lista',
+    'juego', 'videojuego', 'videojuegos', 'titulos', 'el', 'la', 'los', 'las', 'un', 'una', 'unos', 'unas',
+    'de', 'del', 'en', 'para', 'con', 'por', 'y', 'o', 'u', 'a', 'al', 'me', 'año', 'género',
+    'plataforma', 'plataformas', 'desarrollados', 'hechos', 'salidos', 'lanzados', 'publicados',
 }
 
-# Información sobre juegos específicos
-GAME_INFO = {
-    'minecraft': {
-        'descripción': 'Juego sandbox de mundo abierto donde puedes construir, explorar y sobrevivir.',
-        'desarrollador': 'Mojang Studios',
-        'año': 2011,
-        'plataformas': ['PC', 'Consolas', 'Móvil'],
-        'género': 'Sandbox, Supervivencia',
-    },
-    'fortnite': {
-        'descripción': 'Battle royale gratuito con elementos de construcción y eventos en vivo.',
-        'desarrollador': 'Epic Games',
-        'año': 2017,
-        'plataformas': ['PC', 'Consolas', 'Móvil'],
-        'género': 'Battle Royale, Shooter',
-    },
-    'the legend of zelda': {
-        'descripción': 'Serie de aventuras épicas en el mundo de Hyrule, protagonizada por Link.',
-        'desarrollador': 'Nintendo',
-        'año': 1986,
-        'plataformas': ['Consolas Nintendo'],
-        'género': 'Acción-Aventura',
-    },
-    'grand theft auto': {
-        'descripción': 'Serie de mundo abierto ambientada en ciudades ficticias inspiradas en lugares reales.',
-        'desarrollador': 'Rockstar Games',
-        'año': 1997,
-        'plataformas': ['PC', 'Consolas'],
-        'género': 'Acción-Aventura, Mundo Abierto',
-    },
-    'call of duty': {
-        'descripción': 'Serie de shooters en primera persona con modos campaña y multijugador.',
-        'desarrollador': 'Activision (varios estudios)',
-        'año': 2003,
-        'plataformas': ['PC', 'Consolas'],
-        'género': 'FPS, Shooter',
-    },
+# Palabras que, sin ser palabras clave, indican que el mensaje habla de videojuegos
+GAMING_CONTEXT_WORDS = {
+    'juego', 'juegos', 'jugar', 'jugando', 'juega', 'juegas', 'jugué', 'videojuego', 'videojuegos',
+    'partida', 'partidas', 'consola', 'consolas', 'gamer', 'gaming',
 }
 
+def scan_gaming_text(text: str, indexes: Optional[KnowledgeIndexes] = None) -> Dict[str, List]:
+    """
+    Busca en una sola pasada todas las palabras clave y títulos de juegos
+    del texto, respetando los límites de palabra y dando prioridad a la
+    coincidencia más larga. Las palabras con erratas ("fornite") se corrigen
+    antes con el índice de erratas, salvo las palabras corrientes del
+    español ("marido" no es "mario"). Una corrección hacia una palabra
+    corriente ("histria" -> "historia") solo se acepta si el mensaje ya
+    habla de videojuegos por otra vía: una palabra clave o un título
+    literal, una palabra como "juego" o la corrección hacia un término poco
+    común (un título, una compañía).
+    
+    Args:
+        text (str): Texto a analizar
+        indexes (Optional[KnowledgeIndexes]): Índices a usar (por defecto, los de la versión actual)
+        
+    Returns:
+        Dict[str, List]: 'keywords' con tuplas (palabra, categoría) y 'games'
+        con los títulos, ambos sin repetir y en orden de aparición, y
+        'corrections' con las correcciones (FuzzyMatch) que han dado lugar a
+        alguna coincidencia
+    """
+    # Corregir las palabras desconocidas por la palabra clave más cercana
+    indexes = indexes or get_knowledge_indexes()
+    fuzzy_index = indexes.fuzzy_index
+    common_words = get_common_words()
+    words = split_words(text)
+    candidates = {}
+    for position, word in enumerate(words):
+        if word not in fuzzy_index and word not in common_words:
+            correction = fuzzy_index.lookup(word)
+            if correction is not None:
+                candidates[position] = correction
+    
+    # Correcciones solo hacia palabras corrientes: hace falta otra prueba de que el mensaje es de videojuegos
+    if candidates and all(candidate.correction in common_words for candidate in candidates.values()):
+        if GAMING_CONTEXT_WORDS.isdisjoint(words) and not indexes.matcher.scan(text):
+            candidates = {}
+    
+    if candidates:
+        corrected = [candidates[i].correction if i in candidates else word for i, word in enumerate(words)]
+        matches = indexes.matcher.scan(' '.join(corrected))
+    else:
+        matches = indexes.matcher.scan(text)
+    
+    keywords = []
+    games = []
+    corrections = []
+    seen_keywords = set()
+    for match in matches:
+        for kind, value in match.values:
+            if kind == 'keyword' and match.keyword not in seen_keywords:
+                seen_keywords.add(match.keyword)
+                keywords.append((match.keyword, value))
+            elif kind == 'game' and value not in games:
+                games.append(value)
+        for position in range(match.start, match.end):
+            if position in candidates and candidates[position] not in corrections:
+                corrections.append(candidates[position])
+    return {'keywords': keywords, 'games': games, 'corrections': corrections}
+
+# Categorías de GAMING_RESPONSES que se eligen según el contenido del mensaje
+RESPONSE_CATEGORIES = ['géneros', 'plataformas', 'tecnología', 'industria', 'cultura']
+
+# Peso de cada categoría del vocabulario en las categorías de respuesta
+CATEGORY_RESPONSE_WEIGHTS = {
+    'género': {'géneros': 1.0},
+    'plataforma': {'plataformas': 1.0},
+    'técnico': {'tecnología': 1.0},
+    'compañía': {'industria': 1.0},
+    # Distribuir entre varias categorías
+    'gameplay': {'géneros': 0.5, 'cultura': 0.5},
+    'juego': {'géneros': 0.5, 'cultura': 0.5},
+}
+
+# Índice vectorial de GAME_INFO (se construye o se carga la primera vez que se usa)
+_game_index = None  # (índice, huella de las fichas con las que se construyó)
+
+def get_game_index():
+    """
+    Devuelve el índice de recuperación de juegos, construyéndolo o cargándolo
+    de disco la primera vez y reconstruyéndolo si cambian los embeddings o
+    las fichas de los juegos.
+    """
+    global _game_index
+    if not EMBEDDINGS_AVAILABLE:
+        return None
+    
+    embeddings = get_shared_embeddings()
+    if not embeddings.is_trained:
+        return None
+    
+    store = get_knowledge_store()
+    games_hash = store.sections().get('games')
+    current = _game_index
+    if current is None or current[0].embeddings_version != embeddings.vectors_version or current[1] != games_hash:
+        current = (load_or_build_game_index(embeddings, store.games()), games_hash)
+        _game_index = current
+    return current[0]
+
+# Clasificador de categorías por centroides (se construye la primera vez que se usa)
+_category_classifier = None  # (clasificador, huella del vocabulario con el que se construyó)
+
+def get_category_classifier():
+    """
+    Devuelve el clasificador de categorías, construyéndolo la primera vez y
+    reconstruyéndolo si cambian los embeddings o el vocabulario.
+    """
+    global _category_classifier
+    if not EMBEDDINGS_AVAILABLE:
+        return None
+    
+    embeddings = get_shared_embeddings()
+    if not embeddings.is_trained:
+        return None
+    
+    store = get_knowledge_store()
+    vocabulary_hash = store.sections().get('vocabulary')
+    current = _category_classifier
+    if (current is None or current[0].embeddings_version != embeddings.vectors_version
+            or current[1] != vocabulary_hash):
+        current = (CategoryClassifier.build(embeddings, store.vocabulary()), vocabulary_hash)
+        _category_classifier = current
+    return current[0]
+
+def classify_gaming_categories(text: str) -> List[Dict[str, Any]]:
+    """
+    Clasifica un texto en las categorías del vocabulario de videojuegos
+    comparándolo con el centroide de cada categoría.
+    
+    Args:
+        text (str): Texto del usuario
+        
+    Returns:
+        List[Dict[str, Any]]: Distribución de categorías ordenada de mayor a menor
+    """
+    try:
+        classifier = get_category_classifier()
+        if classifier is None:
+            return []
+        return [
+            {'category': category, 'probability': round(probability, 4), 'similarity': round(similarity, 4)}
+            for category, probability, similarity in classifier.classify(get_shared_embeddings(), text)
+        ]
+    except Exception as e:
+        logger.error(f"Error en la clasificación de categorías: {str(e)}")
+        return []
+
+def _keyword_category_scores(hits: Dict[str, List]) -> Dict[str, float]:
+    """Puntuación de las categorías de respuesta contando palabras clave literales."""
+    categories = {category: 0 for category in RESPONSE_CATEGORIES}
+    for keyword, category in hits['keywords']:
+        for response_category, weight in CATEGORY_RESPONSE_WEIGHTS.get(category, {}).items():
+            categories[response_category] += weight
+    return categories
+
+def _classifier_category_scores(ranking: List[Dict[str, Any]]) -> Dict[str, float]:
+    """Puntuación de las categorías de respuesta según la distribución del clasificador por centroides."""
+    categories = {category: 0 for category in RESPONSE_CATEGORIES}
+    for entry in ranking:
+        for response_category, weight in CATEGORY_RESPONSE_WEIGHTS.get(entry['category'], {}).items():
+            categories[response_category] += weight * entry['probability']
+    return categories
+
+# Peso del clasificador al desempatar categorías con la misma puntuación por
+# palabras clave (los recuentos van de 0.5 en 0.5, así que nunca invierte uno)
+CLASSIFIER_TIE_BREAK_WEIGHT = 0.1
+
+def _response_category_scores(text: str, hits: Dict[str, List]) -> Dict[str, float]:
+    """
+    Puntuación de las categorías de respuesta. Deciden las palabras clave
+    literales; el clasificador por centroides solo desempata las categorías
+    igualadas y, en los mensajes sin palabras clave, puntúa él mismo si su
+    mejor categoría supera MIN_CATEGORY_SCORE (si no, todas quedan a 0).
+    """
+    categories = _keyword_category_scores(hits)
+    if not EMBEDDINGS_AVAILABLE:
+        return categories
+    
+    best = max(categories.values())
+    tied = [category for category, score in categories.items() if score == best]
+    if best > 0 and len(tied) == 1:
+        return categories
+    
+    ranking = classify_gaming_categories(text)
+    if best == 0:
+        if ranking and ranking[0]['similarity'] >= MIN_CATEGORY_SCORE:
+            return _classifier_category_scores(ranking)
+        return categories
+    
+    classifier_scores = _classifier_category_scores(ranking)
+    for category in tied:
+        categories[category] += CLASSIFIER_TIE_BREAK_WEIGHT * classifier_scores[category]
+    return categories
+
+def find_games_by_description(text: str, topk: int = 3) -> List[Tuple[str, float]]:
+    """
+    Busca juegos de GAME_INFO cuya descripción, género o plataformas se
+    parezcan semánticamente al texto, aunque no se mencione el título.
+    
+    Sin embeddings entrenados, se usa la búsqueda de texto completo de la
+    base de conocimiento (palabras del texto en las fichas).
+    
+    Args:
+        text (str): Texto del usuario
+        topk (int): Número de juegos a devolver
+        
+    Returns:
+        List[Tuple[str, float]]: Lista de tuplas (juego, similitud), o
+        (juego, puntuación de texto completo) si no hay embeddings
+    """
+    try:
+        index = get_game_index()
+        if index is not None:
+            return index.search(get_shared_embeddings(), text, topk)
+        return get_knowledge_store().search_games(text, topk)
+    except Exception as e:
+        logger.error(f"Error en la búsqueda de juegos: {str(e)}")
+        return []
+
+def _describe_game(info: Dict[str, Any]) -> str:
+    """Respuesta con la información de un juego de GAME_INFO."""
+    return f"{info['descripción']} Desarrollado por {info['desarrollador']} en {info['año']}, está disponible para {', '.join(info['plataformas'])} y pertenece al género {info['género']}."
+
+def _describe_attribute_results(result: Dict[str, Any]) -> str:
+    """Respuesta con los juegos que cumplen los atributos pedidos en el mensaje."""
+    attributes = ", ".join(" o ".join(group) for group in result['groups'])
+    if not result['games']:
+        return f"No conozco ningún juego que cumpla todo eso ({attributes}). Prueba con menos condiciones."
+    return f"Juegos con {attributes}: {', '.join(game.title() for game in result['games'])}."
+
+# Análisis por mensaje ya calculados (los más recientes primero en salir)
+ANALYSIS_CACHE_SIZE = 256
+_analysis_cache = OrderedDict()
+_analysis_lock = threading.Lock()
+
+class MessageAnalysis:
+    """
+    Análisis de un mensaje que se calcula una sola vez y se reutiliza.
+    
+    Cada parte (palabras clave, juegos, categorías, pares semánticos,
+    términos similares, juego descrito) se calcula la primera vez que se
+    pide, de modo que is_gaming_related, get_gaming_response,
+    enhance_gaming_response_with_semantics y analyze_gaming_content
+    comparten el mismo trabajo en lugar de repetirlo.
+    """
+    
+    def __init__(self, text: str):
+        """
+        Args:
+            text (str): Mensaje del usuario
+        """
+        self.text = text
+        self.embeddings_version = None  # Versión de los vectores usados en las partes semánticas
+    
+    @cached_property
+    def indexes(self) -> KnowledgeIndexes:
+        """Índices de la base de conocimiento con los que se analiza el mensaje."""
+        return get_knowledge_indexes()
+    
+    @cached_property
+    def hits(self) -> Dict[str, List]:
+        """Palabras clave y juegos del mensaje (una pasada del autómata de palabras clave)."""
+        return scan_gaming_text(self.text, self.indexes)
+    
+    @property
+    def is_gaming_related(self) -> bool:
+        return bool(self.hits['keywords'] or self.hits['games'])
+    
+    @cached_property
+    def keywords(self) -> List[Dict[str, str]]:
+        return [{'word': keyword, 'category': category} for keyword, category in self.hits['keywords']]
+    
+    @cached_property
+    def categories(self) -> Dict[str, int]:
+        """Número de palabras clave por categoría del vocabulario."""
+        categories = {}
+        for keyword, category in self.hits['keywords']:
+            categories[category] = categories.get(category, 0) + 1
+        return categories
+    
+    @cached_property
+    def semantic(self) -> Tuple[Optional[Dict[str, Any]], List[Dict[str, Any]]]:
+        """Pares semánticos del texto y términos similares a cada palabra clave."""
+        semantic_analysis = None
+        similar_terms = []
+        if EMBEDDINGS_AVAILABLE:
+            try:
+                self.embeddings_version = get_shared_embeddings().vectors_version
+                
+                # Análisis de similitudes semánticas
+                semantic_analysis = analyze_gaming_text_similarities(self.text)
+                
+                # Obtener términos similares para las palabras clave encontradas
+                for keyword_info in self.keywords:
+                    similar_terms.extend(get_similar_terms_for_word(keyword_info['word'], topn=3))
+                
+            except Exception as e:
+                logger.error(f"Error en análisis semántico: {str(e)}")
+                semantic_analysis = {'error': str(e)}
+        return semantic_analysis, similar_terms
+    
+    @cached_property
+    def attribute_games(self) -> Optional[Dict[str, Any]]:
+        """Juegos que cumplen los atributos pedidos en el mensaje ("juegos de PC de mundo abierto"), si los hay."""
+        if ATTRIBUTE_QUESTION_WORDS.isdisjoint(split_words(self.text)):
+            return None
+        result = self.indexes.facets.search(self.text)
+        return result if result['groups'] else None
+    
+    @cached_property
+    def described_game(self) -> Optional[Tuple[str, float]]:
+        """Juego de GAME_INFO descrito sin nombrarlo, si el índice lo identifica con claridad."""
+        if not EMBEDDINGS_AVAILABLE:
+            return None
+        try:
+            index = get_game_index()
+            self.embeddings_version = get_shared_embeddings().vectors_version
+            return index.best_match(get_shared_embeddings(), self.text) if index is not None else None
+        except Exception as e:
+            logger.error(f"Error en la búsqueda de juegos: {str(e)}")
+            return None
+    
+    @cached_property
+    def response_categories(self) -> Dict[str, float]:
+        """Puntuación de las categorías de respuesta (palabras clave, desempatadas o suplidas por los centroides)."""
+        return _response_category_scores(self.text, self.hits)
+    
+    def is_stale(self) -> bool:
+        """Indica si el análisis usó índices o vectores que ya no están en uso."""
+        indexes = self.__dict__.get('indexes')
+        if indexes is not None and indexes.version != get_knowledge_store().version:
+            return True
+        if self.embeddings_version is None:
+            return False
+        return get_shared_embeddings().vectors_version != self.embeddings_version
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Resultado con el formato de analyze_gaming_content (copia independiente)."""
+        semantic_analysis, similar_terms = self.semantic
+        return {
+            'is_gaming_related': self.is_gaming_related,
+            'keywords': copy.deepcopy(self.keywords),
+            'games_mentioned': list(self.hits['games']),
+            'corrections': [correction._asdict() for correction in self.hits['corrections']],
+            'categories': dict(self.categories),
+            'semantic_analysis': copy.deepcopy(semantic_analysis),
+            'similar_terms': copy.deepcopy(similar_terms)
+        }
+
+def get_message_analysis(text: str) -> MessageAnalysis:
+    """
+    Devuelve el análisis de un mensaje, reutilizando el ya calculado para el
+    mismo texto mientras no cambie la versión de los embeddings.
+    
+    Args:
+        text (str): Mensaje del usuario
+        
+    Returns:
+        MessageAnalysis: Análisis del mensaje
+    """
+    with _analysis_lock:
+        analysis = _analysis_cache.get(text)
+        if analysis is not None:
+            _analysis_cache.move_to_end(text)
+    
+    if analysis is None or analysis.is_stale():
+        analysis = MessageAnalysis(text)
+        with _analysis_lock:
+            _analysis_cache[text] = analysis
+            _analysis_cache.move_to_end(text)
+            while len(_analysis_cache) > ANALYSIS_CACHE_SIZE:
+                _analysis_cache.popitem(last=False)
+    return analysis
+
 def is_gaming_related(text: str) -> bool:
     """Determina si un texto está relacionado con videojuegos."""
-    text_lower = text.lower()
+    return get_message_analysis(text).is_gaming_related
+
+def _structured_answer(analysis: MessageAnalysis) -> Optional[Tuple[str, str]]:
+    """
+    Respuesta que sale directamente de la base de conocimiento, sin
+    embeddings: la ficha de un juego nombrado o los juegos que cumplen los
+    atributos pedidos.
     
-    # Buscar palabras clave de videojuegos en el texto
-    for keyword in GAMING_VOCABULARY.keys():
-        if keyword in text_lower:
-            return True
+    Returns:
+        Optional[Tuple[str, str]]: (ruta, respuesta), con ruta 'attribute' o
+        'game'; None si el mensaje no nombra un juego ni pregunta por atributos
+    """
+    # Preguntas por atributos sin nombrar un juego: responder desde el índice de facetas
+    if analysis.attribute_games and not analysis.hits['games']:
+        return 'attribute', _describe_attribute_results(analysis.attribute_games)
     
-    # Buscar nombres de juegos específicos
-    for game in GAME_INFO.keys():
-        if game in text_lower:
-            return True
+    # Buscar menciones de juegos específicos (fichas de la misma versión que los índices)
+    if analysis.hits['games']:
+        info = analysis.indexes.games.get(analysis.hits['games'][0])
+        if info is not None:
+            return 'game', _describe_game(info)
+    return None
+
+def _is_attribute_only(text: str, facets: FacetIndex) -> bool:
+    """Indica si el mensaje solo pide juegos por atributos (cada palabra es un atributo o de relleno)."""
+    covered = set()
+    for match in facets.matcher.scan(text):
+        covered.update(range(match.start, match.end))
+    return all(position in covered or word in ATTRIBUTE_FILLER_WORDS
+               for position, word in enumerate(split_words(text)))
+
+def get_knowledge_answer(text: str) -> Optional[Dict[str, Any]]:
+    """
+    Respuesta de la base de conocimiento para los mensajes que tienen una
+    respuesta segura (un título nombrado, con o sin erratas, o una pregunta
+    que solo pide juegos por atributos), sin cargar embeddings ni modelos
+    generativos. Las preguntas por atributos con más contenido ("juegos de
+    Nintendo para jugar con mis hijos") se dejan a la conversación abierta.
+    
+    Args:
+        text (str): Mensaje del usuario
+        
+    Returns:
+        Optional[Dict[str, Any]]: 'response', 'route' ('game' o 'attribute'),
+        'games' y 'corrections'; None si el mensaje es de conversación abierta
+    """
+    analysis = get_message_analysis(text)
+    answer = _structured_answer(analysis)
+    if answer is None:
+        return None
     
-    return False
+    route, response = answer
+    if route == 'attribute' and not _is_attribute_only(text, analysis.indexes.facets):
+        return None
+    games = analysis.attribute_games['games'] if route == 'attribute' else analysis.hits['games'][:1]
+    return {
+        'response': response,
+        'route': route,
+        'games': list(games),
+        'corrections': [correction._asdict() for correction in analysis.hits['corrections']],
+    }
 
 def get_gaming_response(text: str) -> str:
     """Genera una respuesta relacionada con videojuegos basada en el texto de entrada."""
-    text_lower = text.lower()
+    analysis = get_message_analysis(text)
+    
+    # Juego nombrado o pregunta por atributos: ficha o juegos de la base de conocimiento
+    answer = _structured_answer(analysis)
+    if answer is not None:
+        # Enriquecer con análisis semántico
+        return _enhance_with_analysis(analysis, answer[1])
     
-    # Verificar si el texto está relacionado con videojuegos
-    if not is_gaming_related(text_lower):
+    # Verificar si el texto está relacionado con videojuegos (por palabras
+    # clave o, sin ellas, por una categoría clara del clasificador)
+    if not analysis.is_gaming_related and max(analysis.response_categories.values()) == 0:
         # Si no está relacionado, devolver una respuesta que redirija al tema de videojuegos
-        import random
-        return random.choice(GAMING_RESPONSES['fuera_de_tema'])
-    
-    # Buscar menciones de juegos específicos
-    for game, info in GAME_INFO.items():
-        if game in text_lower:
-            base_response = f"{info['descripción']} Desarrollado por {info['desarrollador']} en {info['año']}, está disponible para {', '.join(info['plataformas'])} y pertenece al género {info['género']}."
-            # Enriquecer con análisis semántico
-            return enhance_gaming_response_with_semantics(text, base_response)
-    
-    # Identificar la categoría más relevante basada en palabras clave
-    categories = {
-        'géneros': 0,
-        'plataformas': 0,
-        'tecnología': 0,
-        'industria': 0,
-        'cultura': 0,
-    }
+        return get_knowledge_store().random_response('fuera_de_tema')
+    
+    # Buscar juegos descritos sin nombrarlos mediante el índice de embeddings
+    match = analysis.described_game
+    info = analysis.indexes.games.get(match[0]) if match else None
+    if info is not None:
+        game = match[0]
+        base_response = f"Por lo que describes, puede que hables de {game.title()}. " + _describe_game(info)
+        return _enhance_with_analysis(analysis, base_response)
     
-    for keyword, category in GAMING_VOCABULARY.items():
-        if keyword in text_lower:
-            if category == 'género':
-                categories['géneros'] += 1
-            elif category == 'plataforma':
-                categories['plataformas'] += 1
-            elif category == 'técnico':
-                categories['tecnología'] += 1
-            elif category == 'compañía':
-                categories['industria'] += 1
-            elif category in ['gameplay', 'juego']:
-                # Distribuir entre varias categorías
-                categories['géneros'] += 0.5
-                categories['cultura'] += 0.5
+    # Identificar la categoría más relevante (palabras clave, desempatadas por los centroides)
+    categories = analysis.response_categories
     
     # Determinar la categoría más relevante
     max_category = max(categories.items(), key=lambda x: x[1])
     
     # Si no hay una categoría clara, usar respuesta general
     if max_category[1] == 0:
-        import random
-        base_response = random.choice(GAMING_RESPONSES['general'])
+        base_response = get_knowledge_store().random_response('general')
     else:
         # Devolver respuesta de la categoría más relevante
-        import random
-        base_response = random.choice(GAMING_RESPONSES[max_category[0]])
+        base_response = get_knowledge_store().random_response(max_category[0])
     
     # Enriquecer con análisis semántico
-    return enhance_gaming_response_with_semantics(text, base_response)
+    return _enhance_with_analysis(analysis, base_response)
 
 def analyze_gaming_content(text: str) -> Dict[str, Any]:
     """Analiza el contenido relacionado con videojuegos en un texto."""
-    text_lower = text.lower()
-    result = {
-        'is_gaming_related': is_gaming_related(text_lower),
-        'keywords': [],
-        'games_mentioned': [],
-        'categories': {},
-        'semantic_analysis': None,
-        'similar_terms': []
-    }
-    
-    # Extraer palabras clave de videojuegos
-    for keyword, category in GAMING_VOCABULARY.items():
-        if keyword in text_lower:
-            result['keywords'].append({
-                'word': keyword,
-                'category': category
-            })
-            
-            # Actualizar conteo de categorías
-            if category not in result['categories']:
-                result['categories'][category] = 0
-            result['categories'][category] += 1
-    
-    # Identificar juegos mencionados
-    for game in GAME_INFO.keys():
-        if game in text_lower:
-            result['games_mentioned'].append(game)
-    
-    # Análisis semántico con embeddings si está disponible
-    if EMBEDDINGS_AVAILABLE:
-        try:
-            # Análisis de similitudes semánticas
-            semantic_analysis = analyze_gaming_text_similarities(text)
-            result['semantic_analysis'] = semantic_analysis
-            
-            # Obtener términos similares para las palabras clave encontradas
-            for keyword_info in result['keywords']:
-                word = keyword_info['word']
-                similar_terms = get_similar_terms_for_word(word, topn=3)
-                result['similar_terms'].extend(similar_terms)
-            
-        except Exception as e:
-            logger.error(f"Error en análisis semántico: {str(e)}")
-            result['semantic_analysis'] = {'error': str(e)}
-    
-    return result
+    return get_message_analysis(text).to_dict()
 
 def get_semantic_similar_terms(word: str, topn: int = 5) -> List[Dict[str, Any]]:
     """
@@ -419,18 +729,20 @@ def enhance_gaming_response_with_semantics(text: str, base_response: str) -> str
     Returns:
         str: Respuesta enriquecida con información semántica
     """
+    return _enhance_with_analysis(get_message_analysis(text), base_response)
+
+def _enhance_with_analysis(message: MessageAnalysis, base_response: str) -> str:
+    """Enriquece una respuesta con el análisis semántico ya calculado del mensaje."""
     if not EMBEDDINGS_AVAILABLE:
         return base_response
     
     try:
         # Obtener análisis semántico
-        analysis = analyze_gaming_content(text)
+        semantic_info, similar_terms = message.semantic
         
-        if not analysis.get('semantic_analysis'):
+        if not semantic_info:
             return base_response
         
-        semantic_info = analysis['semantic_analysis']
-        
         # Si hay términos similares interesantes, mencionarlos
         if semantic_info.get('most_similar_pairs'):
             similar_pairs = semantic_info['most_similar_pairs'][:2]  # Top 2 pares
@@ -446,8 +758,8 @@ def enhance_gaming_response_with_semantics(text: str, base_response: str) -> str
                 base_response += similar_text
         
         # Si hay términos similares específicos, sugerir exploración
-        if analysis.get('similar_terms'):
-            top_terms = analysis['similar_terms'][:3]
+        if similar_terms:
+            top_terms = similar_terms[:3]
             if top_terms:
                 suggestions = []
                 for term in top_terms:
@@ -0,0 +1,199 @@
+'''
+Buscador de Palabras Clave con Aho–Corasick
+Compila un conjunto de palabras clave (de una o varias palabras) en un
+autómata que encuentra todas sus apariciones en un texto en una sola
+pasada, respetando los límites de palabra ("pc" no aparece en "épica") y
+dando prioridad a la coincidencia más larga ("xbox series" antes que "xbox").
+
+El autómata trabaja sobre palabras y no sobre caracteres: el texto se
+divide en palabras con una expresión regular (en C) y cada paso del
+autómata es una búsqueda en diccionario por palabra, lo que además
+garantiza los límites de palabra sin comprobaciones adicionales.
+'''
+
+import re
+from typing import Any, Dict, List, NamedTuple, Tuple
+import logging
+
+# Configuración de logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Palabras: secuencias de letras (con tildes y ñ) y dígitos
+WORD_PATTERN = re.compile(r"[^\W_]+")
+
+
+def split_words(text: str) -> List[str]:
+    """
+    Divide un texto en palabras en minúsculas (equivale a WORD_PATTERN.findall).
+
+    La mayoría de los fragmentos separados por espacios ya son una palabra
+    completa; la expresión regular solo se aplica a los que llevan signos.
+    """
+    words = []
+    for token in text.lower().split():
+        if token.isalnum():
+            words.append(token)
+        else:
+            words.extend(WORD_PATTERN.findall(token))
+    return words
+
+
+class KeywordMatch(NamedTuple):
+    """Aparición de una palabra clave en el texto (posiciones en palabras, fin exclusivo)."""
+    start: int
+    end: int
+    keyword: str
+    values: Tuple[Any, ...]
+
+
+class KeywordMatcher:
+    """
+    Autómata de Aho–Corasick sobre secuencias de palabras en minúsculas.
+
+    Cada palabra clave puede llevar varios valores asociados (por ejemplo,
+    su categoría en el vocabulario y su ficha de juego), que se devuelven
+    juntos en cada coincidencia.
+    """
+
+    def __init__(self):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[int]] = [[]]
+        self._keywords: List[str] = []
+        self._lengths: List[int] = []
+        self._values: List[List[Any]] = []
+        self._value_tuples: List[Tuple[Any, ...]] = []
+        self._index: Dict[str, int] = {}
+        self._built = False
+
+    def add(self, keyword: str, value: Any) -> None:
+        """
+        Añade una palabra clave con un valor asociado.
+
+        Args:
+            keyword (str): Palabra clave (se compara en minúsculas)
+            value (Any): Valor que se devuelve con cada coincidencia
+        """
+        words = split_words(keyword)
+        if not words:
+            return
+
+        key = ' '.join(words)
+        if key in self._index:
+            self._values[self._index[key]].append(value)
+            return
+
+        node = 0
+        for word in words:
+            next_node = self._goto[node].get(word)
+            if next_node is None:
+                next_node = len(self._goto)
+                self._goto[node][word] = next_node
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            node = next_node
+
+        self._index[key] = len(self._keywords)
+        self._output[node].append(len(self._keywords))
+        self._keywords.append(keyword.lower())
+        self._lengths.append(len(words))
+        self._values.append([value])
+        self._built = False
+
+    def build(self) -> 'KeywordMatcher':
+        """
+        Calcula los enlaces de fallo (recorrido en anchura) y une las salidas
+        de cada estado con las de su enlace de fallo.
+
+        Returns:
+            KeywordMatcher: El propio buscador, listo para buscar
+        """
+        queue = list(self._goto[0].values())
+        for node in queue:
+            self._fail[node] = 0
+
+        position = 0
+        while position < len(queue):
+            node = queue[position]
+            position += 1
+            for word, child in self._goto[node].items():
+                queue.append(child)
+                fallback = self._fail[node]
+                while fallback and word not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[child] = self._goto[fallback].get(word, 0)
+                self._output[child] = self._output[child] + self._output[self._fail[child]]
+
+        self._value_tuples = [tuple(values) for values in self._values]
+        self._built = True
+        return self
+
+    def find_all(self, text: str) -> List[KeywordMatch]:
+        """
+        Todas las apariciones de palabras clave, incluidas las que se solapan.
+
+        Args:
+            text (str): Texto en el que buscar
+
+        Returns:
+            List[KeywordMatch]: Coincidencias en orden de aparición de su final;
+            start y end son posiciones en palabras del texto
+        """
+        if not self._built:
+            self.build()
+
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+
+        matches = []
+        node = 0
+        for i, word in enumerate(split_words(text)):
+            next_node = goto[node].get(word)
+            while next_node is None and node:
+                node = fail[node]
+                next_node = goto[node].get(word)
+            node = next_node or 0
+            if output[node]:
+                for keyword_id in output[node]:
+                    matches.append(KeywordMatch(
+                        i + 1 - self._lengths[keyword_id], i + 1,
+                        self._keywords[keyword_id], self._value_tuples[keyword_id]
+                    ))
+        return matches
+
+    def scan(self, text: str) -> List[KeywordMatch]:
+        """
+        Coincidencias sin solapamiento, dando prioridad a la más larga: si
+        "xbox series" y "xbox" aparecen en el mismo sitio, solo se devuelve
+        la primera.
+
+        Args:
+            text (str): Texto en el que buscar
+
+        Returns:
+            List[KeywordMatch]: Coincidencias ordenadas por posición
+        """
+        candidates = self.find_all(text)
+        if len(candidates) < 2:
+            return candidates
+
+        candidates.sort(key=lambda m: (m.start - m.end, m.start))
+        taken = []
+        used = set()
+        for match in candidates:
+            positions = range(match.start, match.end)
+            if used.isdisjoint(positions):
+                used.update(positions)
+                taken.append(match)
+        taken.sort(key=lambda m: m.start)
+        return taken
+
+    def keywords(self) -> List[str]:
+        """Palabras clave añadidas, en orden de inserción."""
+        return list(self._keywords)
+
+    def __len__(self) -> int:
+        return len(self._keywords)
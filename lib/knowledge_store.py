@@ -0,0 +1,589 @@
+'''
+Base de Conocimiento de Videojuegos en SQLite
+Guarda los juegos, el vocabulario y las respuestas temáticas en una base de
+datos SQLite en disco, con un índice de texto completo (FTS5) sobre las
+fichas de los juegos (las preguntas por atributos las resuelve el índice de
+facetas en memoria, lib/facet_index.py). El contenido se importa desde data/gaming_knowledge.json
+la primera vez que se usa, y de nuevo cuando ese fichero cambia.
+
+Nada se carga al importar el módulo: la base se abre en la primera consulta
+y cada consulta lee solo las filas que necesita. Las sentencias SQL son
+constantes, de modo que sqlite3 las reutiliza ya compiladas desde su caché
+de sentencias, y las fichas y respuestas más pedidas se sirven desde una
+pequeña caché en memoria.
+
+El fichero de contenido se vigila: si cambia, se vuelve a importar en una
+sola transacción y se avisa a quien haya construido índices a partir de él
+(con la huella de cada sección, para que reconstruya solo lo que cambió).
+'''
+
+import os
+import json
+import time
+import random
+import sqlite3
+import hashlib
+import threading
+import logging
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, List, Tuple, Any, Optional, Callable
+
+# Configuración de logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+try:
+    from keyword_matcher import split_words
+except ImportError:
+    from .keyword_matcher import split_words
+
+# Contenido inicial de la base (forma parte del código fuente)
+DEFAULT_SEED_PATH = str(Path(__file__).resolve().parent.parent / "data" / "gaming_knowledge.json")
+
+# Variable de entorno con la ruta de otro fichero de contenido
+KNOWLEDGE_PATH_ENV = "GAMING_KNOWLEDGE_PATH"
+
+# Base de datos generada a partir del contenido inicial
+DEFAULT_DB_PATH = "models/gaming_knowledge.db"
+
+# Segundos mínimos entre dos comprobaciones de cambios en el fichero de contenido
+RELOAD_CHECK_SECONDS = 2.0
+
+# Versión del esquema; si cambia, el contenido se vuelve a importar
+SCHEMA_VERSION = 2
+
+# Sentencias compiladas que sqlite3 conserva por conexión
+STATEMENT_CACHE_SIZE = 128
+
+# Fichas y listas de respuestas que se conservan en memoria
+READ_CACHE_SIZE = 512
+
+
+def _fts5_available() -> bool:
+    """Indica si el SQLite enlazado incluye la extensión FTS5."""
+    try:
+        connection = sqlite3.connect(":memory:")
+        try:
+            connection.execute("CREATE VIRTUAL TABLE probe USING fts5(text)")
+        finally:
+            connection.close()
+        return True
+    except sqlite3.Error:
+        return False
+
+
+FTS5_AVAILABLE = _fts5_available()
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS games (
+    id INTEGER PRIMARY KEY,
+    title TEXT NOT NULL UNIQUE,
+    description TEXT NOT NULL DEFAULT '',
+    info TEXT NOT NULL
+);
+-- Índices por atributo de versiones anteriores (ahora los sustituye el índice de facetas)
+DROP INDEX IF EXISTS games_developer;
+DROP INDEX IF EXISTS games_year;
+DROP TABLE IF EXISTS game_platforms;
+DROP TABLE IF EXISTS game_genres;
+CREATE TABLE IF NOT EXISTS vocabulary (keyword TEXT PRIMARY KEY, category TEXT NOT NULL);
+CREATE INDEX IF NOT EXISTS vocabulary_category ON vocabulary (category);
+CREATE TABLE IF NOT EXISTS responses (
+    id INTEGER PRIMARY KEY,
+    category TEXT NOT NULL,
+    text TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_category ON responses (category);
+"""
+
+FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS games_fts USING fts5(
+    title, description, developer, genre, platforms,
+    tokenize = 'unicode61 remove_diacritics 2'
+);
+"""
+
+# Consultas (constantes, para que sqlite3 reutilice la sentencia compilada)
+SQL_GET_META = "SELECT value FROM meta WHERE key = ?"
+SQL_SET_META = "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)"
+SQL_GET_GAME = "SELECT info FROM games WHERE title = ?"
+SQL_GAME_TITLES = "SELECT title FROM games ORDER BY id"
+SQL_ALL_GAMES = "SELECT title, info FROM games ORDER BY id"
+SQL_SEARCH_FTS = (
+    "SELECT games.title, bm25(games_fts) FROM games_fts JOIN games ON games.id = games_fts.rowid "
+    "WHERE games_fts MATCH ? ORDER BY bm25(games_fts) LIMIT ?"
+)
+SQL_SEARCH_LIKE = "SELECT title, description FROM games ORDER BY id"
+SQL_KEYWORD_CATEGORY = "SELECT category FROM vocabulary WHERE keyword = ?"
+SQL_ALL_VOCABULARY = "SELECT keyword, category FROM vocabulary ORDER BY rowid"
+SQL_RESPONSES = "SELECT text FROM responses WHERE category = ? ORDER BY id"
+SQL_RESPONSE_CATEGORIES = "SELECT DISTINCT category FROM responses ORDER BY id"
+SQL_COUNT = {
+    'games': "SELECT COUNT(*) FROM games",
+    'vocabulary': "SELECT COUNT(*) FROM vocabulary",
+    'responses': "SELECT COUNT(*) FROM responses",
+}
+
+
+def _seed_hash(payload: bytes) -> str:
+    """Huella del contenido inicial, para saber si hay que volver a importarlo."""
+    return hashlib.sha1(payload + f"schema={SCHEMA_VERSION}".encode('utf-8')).hexdigest()
+
+
+def section_hashes(seed: Dict[str, Any]) -> Dict[str, str]:
+    """
+    Huella de cada sección del contenido, para saber qué índices derivados
+    hay que reconstruir cuando cambia.
+
+    Args:
+        seed (Dict[str, Any]): Diccionario con 'games', 'vocabulary' y 'responses'
+
+    Returns:
+        Dict[str, str]: Huellas de 'vocabulary', 'titles' (títulos y alias),
+        'games' (fichas completas) y 'responses'
+    """
+    games = seed.get('games', {})
+    sections = {
+        'vocabulary': seed.get('vocabulary', {}),
+        'titles': {title.lower(): info.get('alias', []) for title, info in games.items()},
+        'games': games,
+        'responses': seed.get('responses', {}),
+    }
+    return {
+        name: hashlib.sha1(json.dumps(value, ensure_ascii=False, sort_keys=True).encode('utf-8')).hexdigest()
+        for name, value in sections.items()
+    }
+
+
+class KnowledgeStore:
+    """
+    Base de conocimiento de videojuegos respaldada por SQLite.
+
+    Cada hilo usa su propia conexión; la base se abre en modo WAL para que
+    varios procesos puedan leer a la vez mientras otro importa. Los lectores
+    ven el contenido anterior o el nuevo completo, nunca una mezcla.
+    """
+
+    def __init__(self, db_path: str = DEFAULT_DB_PATH, seed_path: Optional[str] = DEFAULT_SEED_PATH,
+                 cache_size: int = READ_CACHE_SIZE):
+        """
+        Args:
+            db_path (str): Ruta de la base de datos SQLite
+            seed_path (Optional[str]): JSON con el contenido inicial ('games',
+                'vocabulary' y 'responses'), o None para usar la base tal cual
+            cache_size (int): Entradas de la caché de lectura
+        """
+        self.db_path = db_path
+        self.seed_path = seed_path
+        self.cache_size = cache_size
+        self.version = 0  # Aumenta cada vez que cambia el contenido en uso
+        self.content_hash = None
+        self._sections: Dict[str, str] = {}
+        self._seed_stamp = None
+        self._local = threading.local()
+        self._ready = False
+        self._open_lock = threading.Lock()
+        self._cache = OrderedDict()
+        self._cache_lock = threading.Lock()
+
+        # Recarga del fichero de contenido
+        self._last_reload_check = 0.0
+        self._reload_lock = threading.Lock()
+        self._listeners: List[Callable[['KnowledgeStore'], None]] = []
+        self._watcher_stop = threading.Event()
+        self._watcher = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """Conexión del hilo actual (en modo autocommit: las transacciones son explícitas)."""
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            if os.path.dirname(self.db_path):
+                os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+            connection = sqlite3.connect(self.db_path, isolation_level=None,
+                                         cached_statements=STATEMENT_CACHE_SIZE)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+        return connection
+
+    def _db(self) -> sqlite3.Connection:
+        """Conexión lista para consultar: crea el esquema e importa el contenido la primera vez."""
+        if not self._ready:
+            with self._open_lock:
+                if not self._ready:
+                    self._open()
+                    self._ready = True
+        return self._connect()
+
+    def _open(self) -> None:
+        """Crea el esquema si falta e importa el contenido inicial si ha cambiado."""
+        connection = self._connect()
+        connection.executescript(SCHEMA)
+        if FTS5_AVAILABLE:
+            connection.executescript(FTS_SCHEMA)
+
+        if self.seed_path is not None and not os.path.exists(self.seed_path):
+            logger.warning(f"No se encontró el contenido inicial: {self.seed_path}")
+        try:
+            synced = self._sync(connection)
+        except (OSError, ValueError, sqlite3.Error) as e:
+            # Igual que al recargar: un fichero no válido no impide usar lo que ya haya en la base
+            logger.error(f"No se pudo importar el contenido inicial: {str(e)}")
+            synced = False
+        if not synced:
+            # Sin fichero de contenido: usar lo que ya haya en la base
+            row = connection.execute(SQL_GET_META, ('seed_hash',)).fetchone()
+            if row is not None:
+                self._activate(connection, row[0])
+
+    def _get_seed_stamp(self) -> Optional[Tuple[int, int]]:
+        """Fecha de modificación y tamaño del fichero de contenido (None si no existe)."""
+        if self.seed_path is None:
+            return None
+        try:
+            stat = os.stat(self.seed_path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _sync(self, connection: sqlite3.Connection) -> bool:
+        """
+        Importa el fichero de contenido si ha cambiado desde la última vez.
+
+        Returns:
+            bool: True si el contenido en uso ha cambiado
+        """
+        stamp = self._get_seed_stamp()
+        if stamp is None or stamp == self._seed_stamp:
+            return False
+
+        with open(self.seed_path, 'rb') as f:
+            payload = f.read()
+        self._seed_stamp = stamp
+        seed_hash = _seed_hash(payload)
+        if seed_hash == self.content_hash:
+            return False
+
+        # Otro proceso puede haberlo importado ya; si no, importarlo ahora
+        row = connection.execute(SQL_GET_META, ('seed_hash',)).fetchone()
+        if row is None or row[0] != seed_hash:
+            seed = json.loads(payload.decode('utf-8'))
+            if not isinstance(seed, dict):
+                raise ValueError("El contenido debe ser un objeto JSON")
+            self._import(connection, seed, seed_hash)
+        self._activate(connection, seed_hash)
+        return True
+
+    def _activate(self, connection: sqlite3.Connection, seed_hash: str) -> None:
+        """Pasa a usar el contenido importado: nueva versión y huellas de sus secciones."""
+        row = connection.execute(SQL_GET_META, ('sections',)).fetchone()
+        self._sections = json.loads(row[0]) if row else {}
+        self.content_hash = seed_hash
+        self.version += 1
+        with self._cache_lock:
+            self._cache.clear()
+
+    def sections(self) -> Dict[str, str]:
+        """Huellas de las secciones del contenido en uso (ver section_hashes)."""
+        self._db()
+        return dict(self._sections)
+
+    def reload_if_changed(self, force_check: bool = False) -> bool:
+        """
+        Vuelve a importar el fichero de contenido si ha cambiado.
+
+        La comprobación es un simple stat y se hace como mucho una vez cada
+        RELOAD_CHECK_SECONDS. Si el fichero nuevo no es válido se sigue usando
+        el contenido anterior.
+
+        Args:
+            force_check (bool): Comprobar aunque no haya pasado el intervalo
+
+        Returns:
+            bool: True si se cargó contenido nuevo
+        """
+        # Si la base aún no se ha abierto, la primera consulta ya cargará lo último
+        if not self._ready:
+            return False
+
+        now = time.monotonic()
+        if not force_check and now - self._last_reload_check < RELOAD_CHECK_SECONDS:
+            return False
+
+        if not self._reload_lock.acquire(blocking=False):
+            return False
+        try:
+            self._last_reload_check = now
+            changed = self._sync(self._connect())
+        except (OSError, ValueError, sqlite3.Error) as e:
+            logger.error(f"No se pudo recargar la base de conocimiento: {str(e)}")
+            changed = False
+        finally:
+            self._reload_lock.release()
+
+        if changed:
+            logger.info(f"Base de conocimiento recargada (versión {self.version})")
+            for listener in list(self._listeners):
+                try:
+                    listener(self)
+                except Exception as e:
+                    logger.error(f"Error al actualizar los índices de la base de conocimiento: {str(e)}")
+        return changed
+
+    def add_reload_listener(self, listener: Callable[['KnowledgeStore'], None]) -> None:
+        """
+        Registra una función que se llama (en el hilo que recarga) cada vez
+        que se carga contenido nuevo.
+
+        Args:
+            listener (Callable[[KnowledgeStore], None]): Función que recibe la base
+        """
+        if listener not in self._listeners:
+            self._listeners.append(listener)
+
+    def start_watcher(self, interval: float = RELOAD_CHECK_SECONDS) -> None:
+        """
+        Vigila en segundo plano el fichero de contenido y lo recarga cuando cambia.
+
+        Args:
+            interval (float): Segundos entre comprobaciones
+        """
+        if self._watcher is not None and self._watcher.is_alive():
+            return
+        self._watcher_stop.clear()
+        self._watcher = threading.Thread(target=self._watch, args=(interval,),
+                                         name="knowledge-watcher", daemon=True)
+        self._watcher.start()
+
+    def stop_watcher(self, timeout: Optional[float] = None) -> None:
+        """Detiene la vigilancia del fichero de contenido."""
+        self._watcher_stop.set()
+        if self._watcher is not None:
+            self._watcher.join(timeout)
+
+    def _watch(self, interval: float) -> None:
+        while not self._watcher_stop.wait(interval):
+            self.reload_if_changed(force_check=True)
+
+    def import_seed(self, seed: Dict[str, Any]) -> bool:
+        """
+        Sustituye todo el contenido de la base por el indicado.
+
+        Args:
+            seed (Dict[str, Any]): Diccionario con 'games', 'vocabulary' y 'responses'
+
+        Returns:
+            bool: True si la importación fue exitosa
+        """
+        try:
+            connection = self._db()
+            payload = json.dumps(seed, ensure_ascii=False, sort_keys=True).encode('utf-8')
+            seed_hash = _seed_hash(payload)
+            self._import(connection, seed, seed_hash)
+            self._activate(connection, seed_hash)
+            return True
+        except Exception as e:
+            logger.error(f"Error al importar la base de conocimiento: {str(e)}")
+            return False
+
+    def _import(self, connection: sqlite3.Connection, seed: Dict[str, Any], seed_hash: str) -> None:
+        """Importa el contenido en una sola transacción (los lectores ven la versión anterior hasta el final)."""
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            # Otro proceso puede haber importado el mismo contenido mientras esperábamos
+            row = connection.execute(SQL_GET_META, ('seed_hash',)).fetchone()
+            if row is not None and row[0] == seed_hash:
+                connection.execute("COMMIT")
+                return
+
+            for table in ('games', 'vocabulary', 'responses'):
+                connection.execute(f"DELETE FROM {table}")
+            if FTS5_AVAILABLE:
+                connection.execute("DELETE FROM games_fts")
+
+            for title, info in seed.get('games', {}).items():
+                title = title.lower()
+                platforms = [str(p) for p in info.get('plataformas', [])]
+                cursor = connection.execute(
+                    "INSERT INTO games (title, description, info) VALUES (?, ?, ?)",
+                    (title, info.get('descripción', ''), json.dumps(info, ensure_ascii=False))
+                )
+                game_id = cursor.lastrowid
+                if FTS5_AVAILABLE:
+                    connection.execute(
+                        "INSERT INTO games_fts (rowid, title, description, developer, genre, platforms) "
+                        "VALUES (?, ?, ?, ?, ?, ?)",
+                        (game_id, ' '.join([title] + list(info.get('alias', []))),
+                         info.get('descripción', ''), info.get('desarrollador', ''),
+                         info.get('género', ''), ' '.join(platforms))
+                    )
+
+            connection.executemany(
+                "INSERT OR REPLACE INTO vocabulary (keyword, category) VALUES (?, ?)",
+                [(keyword.lower(), category) for keyword, category in seed.get('vocabulary', {}).items()]
+            )
+            connection.executemany(
+                "INSERT INTO responses (category, text) VALUES (?, ?)",
+                [(category, text) for category, texts in seed.get('responses', {}).items() for text in texts]
+            )
+            connection.execute(SQL_SET_META, ('seed_hash', seed_hash))
+            connection.execute(SQL_SET_META, ('sections', json.dumps(section_hashes(seed))))
+            connection.execute("COMMIT")
+        except Exception:
+            connection.execute("ROLLBACK")
+            raise
+
+        logger.info(f"Base de conocimiento importada en {self.db_path}: {len(seed.get('games', {}))} juegos, "
+                    f"{len(seed.get('vocabulary', {}))} palabras clave")
+
+    def _cached(self, key: Tuple, load):
+        """
+        Caché de lectura: devuelve el valor guardado o lo lee de la base y lo guarda.
+
+        La clave incluye la versión del contenido, así que un valor leído justo
+        antes de una recarga nunca se sirve después de ella.
+        """
+        key = (self.version,) + key
+        with self._cache_lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                return self._cache[key]
+
+        value = load()
+        with self._cache_lock:
+            self._cache[key] = value
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return value
+
+    def get_game(self, title: str) -> Optional[Dict[str, Any]]:
+        """
+        Ficha de un juego.
+
+        Args:
+            title (str): Título del juego (en minúsculas)
+
+        Returns:
+            Optional[Dict[str, Any]]: Ficha con el formato de GAME_INFO (copia
+            independiente), o None si el juego no existe
+        """
+        def load():
+            row = self._db().execute(SQL_GET_GAME, (title.lower(),)).fetchone()
+            return row[0] if row else None
+
+        info = self._cached(('game', title.lower()), load)
+        return json.loads(info) if info is not None else None
+
+    def game_titles(self) -> List[str]:
+        """Títulos de todos los juegos, en el orden de importación."""
+        return [row[0] for row in self._db().execute(SQL_GAME_TITLES)]
+
+    def games(self) -> Dict[str, Dict[str, Any]]:
+        """Todas las fichas de juegos por título (lee el catálogo completo)."""
+        return {title: json.loads(info) for title, info in self._db().execute(SQL_ALL_GAMES)}
+
+    def search_games(self, text: str, limit: int = 5) -> List[Tuple[str, float]]:
+        """
+        Búsqueda de texto completo en título, descripción, desarrollador,
+        género y plataformas.
+
+        Args:
+            text (str): Texto libre
+            limit (int): Número máximo de resultados
+
+        Returns:
+            List[Tuple[str, float]]: Tuplas (título, puntuación) de mayor a menor relevancia
+        """
+        words = [word for word in split_words(text) if len(word) > 2]
+        if not words:
+            return []
+
+        connection = self._db()
+        if FTS5_AVAILABLE:
+            query = ' OR '.join(f'"{word}"' for word in dict.fromkeys(words))
+            return [(title, round(-score, 4)) for title, score in connection.execute(SQL_SEARCH_FTS, (query, limit))]
+
+        # Sin FTS5: contar las palabras del texto que aparecen en cada ficha
+        results = []
+        for title, description in connection.execute(SQL_SEARCH_LIKE):
+            document = set(split_words(f"{title} {description}"))
+            score = sum(1 for word in words if word in document)
+            if score:
+                results.append((title, float(score)))
+        results.sort(key=lambda item: -item[1])
+        return results[:limit]
+
+    def keyword_category(self, keyword: str) -> Optional[str]:
+        """Categoría de una palabra clave del vocabulario, o None si no está."""
+        row = self._db().execute(SQL_KEYWORD_CATEGORY, (keyword.lower(),)).fetchone()
+        return row[0] if row else None
+
+    def vocabulary(self) -> Dict[str, str]:
+        """Vocabulario completo (palabra clave -> categoría), en el orden de importación."""
+        return dict(self._db().execute(SQL_ALL_VOCABULARY).fetchall())
+
+    def _responses(self, category: str) -> Tuple[str, ...]:
+        """Respuestas de una categoría, desde la caché de lectura."""
+        return self._cached(('responses', category),
+                            lambda: tuple(row[0] for row in self._db().execute(SQL_RESPONSES, (category,))))
+
+    def responses(self, category: str) -> List[str]:
+        """Respuestas temáticas de una categoría."""
+        return list(self._responses(category))
+
+    def response_categories(self) -> List[str]:
+        """Categorías de respuestas disponibles."""
+        return [row[0] for row in self._db().execute(SQL_RESPONSE_CATEGORIES)]
+
+    def random_response(self, category: str) -> Optional[str]:
+        """Respuesta al azar de una categoría, o None si la categoría está vacía."""
+        responses = self._responses(category)
+        return random.choice(responses) if responses else None
+
+    def stats(self) -> Dict[str, Any]:
+        """Tamaño de la base y estado de la caché."""
+        try:
+            connection = self._db()
+            stats = {name: connection.execute(sql).fetchone()[0] for name, sql in SQL_COUNT.items()}
+            stats.update({
+                'db_path': self.db_path,
+                'fts5': FTS5_AVAILABLE,
+                'version': self.version,
+                'cached_entries': len(self._cache),
+            })
+            return stats
+        except Exception as e:
+            logger.error(f"Error al leer la base de conocimiento: {str(e)}")
+            return {'error': str(e)}
+
+    def close(self) -> None:
+        """Cierra la conexión del hilo actual."""
+        connection = getattr(self._local, 'connection', None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
+
+
+# Instancia compartida por el proceso (se crea en la primera consulta)
+_shared_store = None
+_shared_lock = threading.Lock()
+
+
+def get_knowledge_store() -> KnowledgeStore:
+    """
+    Devuelve la base de conocimiento compartida por el proceso.
+
+    El contenido se lee de la ruta de GAMING_KNOWLEDGE_PATH, si está definida,
+    o de data/gaming_knowledge.json, y se vigila en segundo plano para
+    recargarlo cuando cambie.
+    """
+    global _shared_store
+
+    with _shared_lock:
+        if _shared_store is None:
+            store = KnowledgeStore(seed_path=os.environ.get(KNOWLEDGE_PATH_ENV, DEFAULT_SEED_PATH))
+            store.start_watcher()
+            _shared_store = store
+    return _shared_store
@@ -0,0 +1,177 @@
+/**
+ * Análisis de PLN por Reglas con el Léxico Compartido
+ * Tokenización, lematización, etiquetado POS y detección de videojuegos con
+ * el mismo léxico (data/nlp_lexicon.json) y las mismas reglas que
+ * scripts/nlp_processor_simple.py y lib/nlp_lexicon.py, para responder en el
+ * propio proceso de Node sin lanzar Python. El léxico se compila una vez al
+ * cargar el módulo; cualquier cambio en el fichero afecta por igual a las
+ * dos implementaciones.
+ */
+
+import lexiconData from '@/data/nlp_lexicon.json';
+
+// Formato del fichero de léxico que entiende este módulo
+export const LEXICON_FORMAT = 1;
+
+// Tokens distintos cuyo lema y categoría se conservan
+const TOKEN_CACHE_SIZE = 8192;
+
+// Caracteres que no forman parte de un token (equivale a [^\w\sáéíóúüñ] de Python)
+const NON_WORD_PATTERN = new RegExp('[^\\p{L}\\p{N}_\\s]', 'gu');
+
+interface LexiconRule {
+  suffix: string;
+  min_length?: number;
+  replace?: string;
+  pos?: string;
+  name?: string;
+}
+
+interface SuffixRule {
+  order: number;
+  suffix: string;
+  minLength: number;
+  value: string;
+}
+
+// Reglas en orden de prioridad (gana la primera que se cumple), agrupadas por longitud de sufijo
+class SuffixRules {
+  private lengths: number[];
+  private bySuffix = new Map<string, SuffixRule>();
+
+  constructor(rules: LexiconRule[], valueField: 'replace' | 'pos') {
+    const lengths = new Set<number>();
+    rules.forEach((rule, order) => {
+      if (this.bySuffix.has(rule.suffix)) {
+        throw new Error(`Sufijo repetido en el léxico: ${rule.suffix}`);
+      }
+      this.bySuffix.set(rule.suffix, {
+        order,
+        suffix: rule.suffix,
+        minLength: rule.min_length ?? 0,
+        value: rule[valueField] ?? '',
+      });
+      lengths.add(rule.suffix.length);
+    });
+    this.lengths = Array.from(lengths).sort((a, b) => a - b);
+  }
+
+  match(token: string): SuffixRule | null {
+    let best: SuffixRule | null = null;
+    const size = token.length;
+    for (const length of this.lengths) {
+      if (length > size) {
+        break;
+      }
+      const rule = this.bySuffix.get(token.slice(size - length));
+      if (rule && size >= rule.minLength && (best === null || rule.order < best.order)) {
+        best = rule;
+      }
+    }
+    return best;
+  }
+}
+
+if (lexiconData.format !== LEXICON_FORMAT) {
+  throw new Error(`Formato de léxico no soportado: ${lexiconData.format} (se esperaba ${LEXICON_FORMAT})`);
+}
+
+const lemmas: Record<string, string> = lexiconData.lemmas;
+const posTable: Record<string, string> = lexiconData.pos;
+const posDescriptions: Record<string, string> = lexiconData.pos_descriptions;
+const lemmaRules = new SuffixRules(lexiconData.lemma_rules, 'replace');
+const posRules = new SuffixRules(lexiconData.pos_rules, 'pos');
+
+export const LEXICON_VERSION: number = lexiconData.version;
+
+const lemmaCache = new Map<string, string>();
+const posCache = new Map<string, string>();
+
+function remember(cache: Map<string, string>, token: string, value: string): string {
+  if (cache.size >= TOKEN_CACHE_SIZE) {
+    cache.clear();
+  }
+  cache.set(token, value);
+  return value;
+}
+
+export function tokenizeText(text: string): string[] {
+  return text
+    .toLowerCase()
+    .replace(NON_WORD_PATTERN, ' ')
+    .split(/\s+/)
+    .filter((token) => token.length > 0);
+}
+
+export function getLemma(token: string): string {
+  const cached = lemmaCache.get(token);
+  if (cached !== undefined) {
+    return cached;
+  }
+  if (Object.prototype.hasOwnProperty.call(lemmas, token)) {
+    return remember(lemmaCache, token, lemmas[token]);
+  }
+  const rule = lemmaRules.match(token);
+  const lemma = rule ? token.slice(0, token.length - rule.suffix.length) + rule.value : token;
+  return remember(lemmaCache, token, lemma);
+}
+
+export function getPOSTag(token: string): string {
+  const cached = posCache.get(token);
+  if (cached !== undefined) {
+    return cached;
+  }
+  if (Object.prototype.hasOwnProperty.call(posTable, token)) {
+    return remember(posCache, token, posTable[token]);
+  }
+  const rule = posRules.match(token);
+  return remember(posCache, token, rule ? rule.value : lexiconData.default_pos);
+}
+
+export function getPOSDescription(pos: string): string {
+  return Object.prototype.hasOwnProperty.call(posDescriptions, pos)
+    ? posDescriptions[pos]
+    : lexiconData.unknown_pos_description;
+}
+
+export function analyzeGamingContent(text: string) {
+  const lowerText = text.toLowerCase();
+
+  const keywordsFound = lexiconData.gaming_keywords.filter((keyword) => lowerText.includes(keyword));
+  const gamesMentioned = lexiconData.popular_games.filter((game) => lowerText.includes(game));
+
+  return {
+    is_gaming_related: keywordsFound.length > 0,
+    keywords: keywordsFound.map((word) => ({ word, category: 'gaming' })),
+    games_mentioned: gamesMentioned,
+    categories: { gaming: keywordsFound.length },
+    semantic_analysis: {
+      gaming_words_found: keywordsFound,
+      total_similarities: keywordsFound.length,
+      similarities: [],
+      most_similar_pairs: [],
+      average_similarity: keywordsFound.length > 0 ? 0.8 : 0.0,
+    },
+    similar_terms: [],
+  };
+}
+
+export interface RuleBasedAnalysis {
+  tokens: string[];
+  lemmas: Array<{ word: string; lemma: string }>;
+  posTags: Array<{ word: string; pos: string; description: string }>;
+  gamingAnalysis: ReturnType<typeof analyzeGamingContent>;
+}
+
+export function analyzeText(text: string): RuleBasedAnalysis {
+  const tokens = tokenizeText(text);
+  return {
+    tokens,
+    lemmas: tokens.map((word) => ({ word, lemma: getLemma(word) })),
+    posTags: tokens.map((word) => {
+      const pos = getPOSTag(word);
+      return { word, pos, description: getPOSDescription(pos) };
+    }),
+    gamingAnalysis: analyzeGamingContent(text),
+  };
+}
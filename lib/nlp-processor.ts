@@ -8,11 +8,14 @@ interface NLPResult {
 }
 
 export async function processText(text: string): Promise<NLPResult> {
-  // Ejecutamos el script de Python que usa spaCy con embeddings
+  // Ejecutamos el script de Python que usa spaCy con embeddings.
+  // Solo se usan tokens, lemas y etiquetas POS: el perfil "lemmas+pos"
+  // no carga el parser ni el NER
   const pythonProcess = spawn('py', [
     '-3.12',
     path.join(process.cwd(), 'scripts', 'nlp_processor_with_embeddings.py'),
-    text
+    text,
+    'lemmas+pos'
   ]);
 
   return new Promise((resolve, reject) => {
@@ -0,0 +1,173 @@
+'''
+Léxico de Reglas para Lematización y Etiquetado POS Básicos
+Carga desde data/nlp_lexicon.json los diccionarios de lemas y categorías
+gramaticales, las reglas de sufijos y las palabras clave de videojuegos del
+procesador sin modelos (scripts/nlp_processor_simple.py), y los compila una
+sola vez:
+
+- Las reglas de sufijos se agrupan por longitud de sufijo, de modo que cada
+  token se resuelve con una búsqueda en diccionario por longitud en lugar
+  de recorrer una cadena de endswith
+- El lema y la categoría de cada token se memorizan en una caché acotada
+  (los mensajes repiten mucho las mismas palabras)
+
+El fichero lleva un número de formato, que el cargador comprueba, y un
+número de versión del contenido. lib/nlp-lexicon.ts carga el mismo fichero
+y aplica las mismas reglas en Node: cualquier cambio en el léxico afecta por
+igual a las dos implementaciones.
+'''
+
+import json
+import threading
+import logging
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Any, NamedTuple, Optional, Tuple
+
+# Configuración de logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Léxico por defecto (forma parte del código fuente)
+DEFAULT_LEXICON_PATH = str(Path(__file__).resolve().parent.parent / "data" / "nlp_lexicon.json")
+
+# Formato del fichero de léxico que entiende este módulo
+LEXICON_FORMAT = 1
+
+# Tokens distintos cuyo lema y categoría se conservan
+TOKEN_CACHE_SIZE = 8192
+
+
+class SuffixRule(NamedTuple):
+    """Regla de sufijo: se aplica a los tokens que terminan en suffix y tienen al menos min_length letras."""
+    order: int
+    suffix: str
+    min_length: int
+    value: str  # Terminación que sustituye al sufijo (lemas) o categoría (POS)
+    name: Optional[str]
+
+
+class SuffixRules:
+    """
+    Reglas de sufijos en orden de prioridad (gana la primera que se cumple),
+    agrupadas por longitud de sufijo.
+    """
+
+    def __init__(self, rules: List[Dict[str, Any]], value_field: str):
+        """
+        Args:
+            rules (List[Dict[str, Any]]): Reglas del léxico, en orden de prioridad
+            value_field (str): Campo con el valor de cada regla
+        """
+        self._by_length: Dict[int, Dict[str, SuffixRule]] = {}
+        for order, rule in enumerate(rules):
+            compiled = SuffixRule(order, rule['suffix'], rule.get('min_length', 0),
+                                  rule[value_field], rule.get('name'))
+            suffixes = self._by_length.setdefault(len(compiled.suffix), {})
+            if compiled.suffix in suffixes:
+                raise ValueError(f"Sufijo repetido en el léxico: {compiled.suffix}")
+            suffixes[compiled.suffix] = compiled
+        self._lengths: Tuple[int, ...] = tuple(sorted(self._by_length))
+
+    def match(self, token: str) -> Optional[SuffixRule]:
+        """
+        Regla de mayor prioridad que se cumple para un token.
+
+        Args:
+            token (str): Token en minúsculas
+
+        Returns:
+            Optional[SuffixRule]: Regla, o None si no se cumple ninguna
+        """
+        best = None
+        size = len(token)
+        for length in self._lengths:
+            if length > size:
+                break
+            rule = self._by_length[length].get(token[size - length:])
+            if rule is not None and size >= rule.min_length and (best is None or rule.order < best.order):
+                best = rule
+        return best
+
+
+class NLPLexicon:
+    """
+    Léxico compilado: lema y categoría gramatical de un token por diccionario
+    o, si no está en él, por reglas de sufijos.
+    """
+
+    def __init__(self, data: Dict[str, Any], cache_size: int = TOKEN_CACHE_SIZE):
+        """
+        Args:
+            data (Dict[str, Any]): Contenido del fichero de léxico
+            cache_size (int): Tokens cuyo resultado se memoriza
+        """
+        if data.get('format') != LEXICON_FORMAT:
+            raise ValueError(f"Formato de léxico no soportado: {data.get('format')} (se esperaba {LEXICON_FORMAT})")
+
+        self.version = data['version']
+        self.lemmas: Dict[str, str] = data['lemmas']
+        self.pos: Dict[str, str] = data['pos']
+        self.pos_descriptions: Dict[str, str] = data['pos_descriptions']
+        self.default_pos: str = data['default_pos']
+        self.unknown_pos_description: str = data['unknown_pos_description']
+        self.gaming_keywords: List[str] = data['gaming_keywords']
+        self.popular_games: List[str] = data['popular_games']
+        self.lemma_rules = SuffixRules(data['lemma_rules'], 'replace')
+        self.pos_rules = SuffixRules(data['pos_rules'], 'pos')
+
+        # Memoria por instancia (no retiene el léxico más allá de su vida)
+        self.lemma = lru_cache(maxsize=cache_size)(self._lemma)
+        self.pos_tag = lru_cache(maxsize=cache_size)(self._pos_tag)
+
+    def _lemma(self, token: str) -> str:
+        """Lema de un token en minúsculas."""
+        lemma = self.lemmas.get(token)
+        if lemma is not None:
+            return lemma
+        rule = self.lemma_rules.match(token)
+        if rule is None:
+            return token
+        return token[:len(token) - len(rule.suffix)] + rule.value
+
+    def _pos_tag(self, token: str) -> str:
+        """Categoría gramatical de un token en minúsculas."""
+        pos = self.pos.get(token)
+        if pos is not None:
+            return pos
+        rule = self.pos_rules.match(token)
+        return rule.value if rule is not None else self.default_pos
+
+    def describe_pos(self, pos: str) -> str:
+        """Descripción en español de una categoría gramatical."""
+        return self.pos_descriptions.get(pos, self.unknown_pos_description)
+
+
+def load_nlp_lexicon(path: str = DEFAULT_LEXICON_PATH) -> NLPLexicon:
+    """
+    Carga y compila un fichero de léxico.
+
+    Args:
+        path (str): Ruta del fichero JSON
+
+    Returns:
+        NLPLexicon: Léxico compilado
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        lexicon = NLPLexicon(json.load(f))
+    logger.debug(f"Léxico cargado (versión {lexicon.version}): {len(lexicon.lemmas)} lemas, {len(lexicon.pos)} categorías")
+    return lexicon
+
+
+_shared_lexicon = None
+_shared_lock = threading.Lock()
+
+
+def get_nlp_lexicon() -> NLPLexicon:
+    """Devuelve el léxico por defecto, compilado la primera vez que se pide."""
+    global _shared_lexicon
+
+    with _shared_lock:
+        if _shared_lexicon is None:
+            _shared_lexicon = load_nlp_lexicon()
+    return _shared_lexicon
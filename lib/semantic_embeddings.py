@@ -11,16 +11,33 @@ Funcionalidades:
 - Cálculo de similitudes entre términos
 - Búsqueda de términos más similares
 - Integración con el flujo de procesamiento del chatbot
+- Exportación de solo los vectores (.npy + vocabulario) para inferencia
+  con mapeo en memoria compartido entre procesos
+- Almacenamiento comprimido opcional (float16 / int8 con escala por fila)
+- Runtime de inferencia solo con NumPy (gensim solo se usa para entrenar)
+- Entrenamiento en streaming y multinúcleo desde ficheros de texto/JSONL
+- Actualización incremental del vocabulario con publicación atómica de versiones
+- Modelos completos versionados (directorio + manifiesto + puntero CURRENT)
+  y cambio en caliente de la versión sin interrumpir consultas en curso
 
 Autor: Asistente IA
 Fecha: 2024
 """
 
 import os
+import re
 import json
+import base64
+import time
+import shutil
 import pickle
+import hashlib
+import unicodedata
+import importlib.util
+import threading
+import multiprocessing
 import numpy as np
-from typing import List, Dict, Tuple, Any, Optional
+from typing import List, Dict, Tuple, Any, Optional, Iterable, NamedTuple, Set
 from collections import defaultdict
 import logging
 
@@ -28,30 +45,456 @@ import logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-try:
-    from gensim.models import Word2Vec
-    from gensim.models.word2vec import LineSentence
-    GENSIM_AVAILABLE = True
-except ImportError:
-    logger.warning("Gensim no está disponible. Instalando...")
-    GENSIM_AVAILABLE = False
+# Gensim solo se necesita para entrenar: se comprueba sin importarlo para que
+# los procesos de inferencia no paguen su coste de arranque (ni el de scipy)
+GENSIM_AVAILABLE = importlib.util.find_spec("gensim") is not None
+if not GENSIM_AVAILABLE:
+    logger.warning("Gensim no está disponible: solo se podrán cargar vectores exportados")
+
+# Artefacto de inferencia: solo los vectores (.npy) y el vocabulario (.json).
+# Cada exportación escribe un fichero de vectores nuevo y después reemplaza
+# vocab.json de forma atómica, que es el que apunta a la versión vigente.
+VECTORS_FILENAME = "vectors-{version:06d}.npy"
+VOCAB_FILENAME = "vocab.json"
+VECTORS_FORMAT_VERSION = 1
+KEEP_VECTOR_VERSIONS = 3        # Versiones de vectores que se conservan en disco
+RELOAD_CHECK_SECONDS = 5.0      # Intervalo mínimo entre comprobaciones de nueva versión
+
+# Modelos completos versionados: cada guardado crea un directorio nuevo
+# (v000001, v000002, ...) con el modelo y su manifiesto, y después reemplaza
+# de forma atómica el puntero CURRENT. Nunca se sobrescribe un modelo en uso.
+MODEL_VERSION_DIRNAME = "v{version:06d}"
+MODEL_FILENAME = "model.model"
+MANIFEST_FILENAME = "manifest.json"
+MODEL_POINTER_FILENAME = "CURRENT"
+MODEL_FORMAT_VERSION = 1
+KEEP_MODEL_VERSIONS = 3         # Versiones del modelo completo que se conservan en disco
+
+# Configuración por defecto del modelo Word2Vec
+DEFAULT_TRAINING_PARAMS = {
+    'vector_size': 100,        # Dimensión de los vectores
+    'window': 5,               # Ventana de contexto
+    'min_count': 1,            # Frecuencia mínima de palabras
+    'workers': 4,              # Número de hilos
+    'epochs': 100,             # Número de épocas de entrenamiento
+    'sg': 1,                   # Skip-gram (1) o CBOW (0)
+    'negative': 5,             # Muestreo negativo
+    'ns_exponent': 0.75,       # Exponente para muestreo negativo
+    'alpha': 0.025,            # Tasa de aprendizaje inicial
+    'min_alpha': 0.0001,       # Tasa de aprendizaje mínima
+    'seed': 42                 # Semilla para reproducibilidad
+}
+
+# Campos de get_similar_terms: por defecto no se incluye el vector de cada término
+SIMILAR_TERM_FIELDS = ('rank', 'word', 'similarity', 'similarity_percentage', 'vector')
+DEFAULT_SIMILAR_TERM_FIELDS = ('rank', 'word', 'similarity', 'similarity_percentage')
+VECTOR_ENCODINGS = ('list', 'base64-float32', 'base64-float16')
+
+# Preprocesado de corpus en disco
+TOKENIZER_VERSION = 1                      # Cambiarlo invalida los fragmentos en caché
+SHARD_BYTES = 64 * 1024 * 1024             # Tamaño de cada fragmento de entrada
+TOKEN_PATTERN = re.compile(r"[^\W_]+")    # Letras (con tildes y ñ) y dígitos
+
+# Almacenamiento comprimido opcional de los vectores en memoria
+STORAGE_TYPES = ('float32', 'float16', 'int8')
+RESCORE_FACTOR = 4          # Candidatos por resultado que se reevalúan en float32
+QUANTIZE_CHUNK_ROWS = 16384 # Filas procesadas por bloque para acotar la memoria
+
+
+def tokenize_for_embeddings(text: str) -> List[str]:
+    """
+    Tokeniza un texto para entrenar embeddings: minúsculas, normalización
+    Unicode NFC (para que "á" compuesta y descompuesta sean el mismo token)
+    y conservación de tildes y eñes.
+    
+    Args:
+        text (str): Texto a tokenizar
+        
+    Returns:
+        List[str]: Tokens
+    """
+    return TOKEN_PATTERN.findall(unicodedata.normalize('NFC', text).lower())
+
+
+def _extract_text(line: str, text_field: Optional[str]) -> Optional[str]:
+    """Obtiene el texto de una línea de un fichero de texto plano o JSONL."""
+    if text_field is None:
+        return line
+    try:
+        record = json.loads(line)
+    except ValueError:
+        return None
+    value = record.get(text_field) if isinstance(record, dict) else None
+    return value if isinstance(value, str) else None
+
+
+def _preprocess_shard(task: Tuple[str, int, int, Optional[str], str]) -> Tuple[str, int, int]:
+    """
+    Preprocesa un rango de bytes de un fichero de corpus y lo escribe como
+    fragmento en formato LineSentence (una oración tokenizada por línea).
+    
+    El rango contiene las líneas que empiezan en [start, end).
+    
+    Args:
+        task: (ruta de origen, inicio, fin, campo de texto JSONL o None, ruta del fragmento)
+        
+    Returns:
+        Tuple[str, int, int]: (ruta del fragmento, oraciones, palabras)
+    """
+    source_path, start, end, text_field, shard_path = task
+    sentences = 0
+    words = 0
+    tmp_path = f"{shard_path}.{os.getpid()}.tmp"
+    
+    with open(source_path, 'rb') as source, open(tmp_path, 'w', encoding='utf-8') as shard:
+        if start > 0:
+            source.seek(start - 1)
+            source.readline()
+        
+        while source.tell() < end:
+            raw_line = source.readline()
+            if not raw_line:
+                break
+            text = _extract_text(raw_line.decode('utf-8', errors='replace'), text_field)
+            if not text:
+                continue
+            tokens = tokenize_for_embeddings(text)
+            if tokens:
+                shard.write(' '.join(tokens) + '\n')
+                sentences += 1
+                words += len(tokens)
+    
+    os.replace(tmp_path, shard_path)
+    return shard_path, sentences, words
+
+
+def preprocess_corpus_files(paths: Iterable[str], cache_dir: str = "data/corpus_shards",
+                            workers: Optional[int] = None,
+                            text_field: str = 'text') -> Dict[str, Any]:
+    """
+    Preprocesa ficheros de corpus (texto plano o JSONL) en paralelo y sin
+    cargarlos en memoria, dejando fragmentos tokenizados en caché.
+    
+    Cada fichero se divide en rangos de SHARD_BYTES que se procesan en un
+    pool de procesos. Los fragmentos se identifican por ruta, tamaño y fecha
+    del fichero de origen, así que solo se regeneran si este cambia.
+    
+    Args:
+        paths (Iterable[str]): Ficheros .txt (una oración por línea) o .jsonl
+        cache_dir (str): Directorio de los fragmentos preprocesados
+        workers (Optional[int]): Procesos del pool (por defecto, todos los núcleos)
+        text_field (str): Campo con el texto en los ficheros .jsonl
+        
+    Returns:
+        Dict[str, Any]: Fragmentos generados (en orden), oraciones y palabras
+        de los fragmentos nuevos y tiempo empleado
+    """
+    os.makedirs(cache_dir, exist_ok=True)
+    start_time = time.perf_counter()
+    
+    shards = []
+    tasks = []
+    for path in paths:
+        stat = os.stat(path)
+        field = text_field if path.endswith(('.jsonl', '.json')) else None
+        key = hashlib.sha1(
+            f"{os.path.abspath(path)}|{stat.st_size}|{stat.st_mtime_ns}|{field}|{SHARD_BYTES}|{TOKENIZER_VERSION}".encode('utf-8')
+        ).hexdigest()[:16]
+        
+        for i, offset in enumerate(range(0, max(stat.st_size, 1), SHARD_BYTES)):
+            shard_path = os.path.join(cache_dir, f"{key}-{i:05d}.txt")
+            shards.append(shard_path)
+            if not os.path.exists(shard_path):
+                tasks.append((path, offset, min(offset + SHARD_BYTES, stat.st_size), field, shard_path))
+    
+    sentences = 0
+    words = 0
+    if tasks:
+        logger.info(f"Preprocesando {len(tasks)} fragmentos de corpus...")
+        if len(tasks) == 1 or workers == 1:
+            results = [_preprocess_shard(task) for task in tasks]
+        else:
+            with multiprocessing.Pool(processes=workers) as pool:
+                results = pool.map(_preprocess_shard, tasks, chunksize=1)
+        sentences = sum(r[1] for r in results)
+        words = sum(r[2] for r in results)
+    
+    return {
+        'shards': shards,
+        'new_shards': len(tasks),
+        'cached_shards': len(shards) - len(tasks),
+        'sentences': sentences,
+        'words': words,
+        'seconds': round(time.perf_counter() - start_time, 3)
+    }
+
+
+def _merge_shards(shards: List[str], cache_dir: str) -> str:
+    """
+    Une los fragmentos en un único fichero LineSentence, que es lo que
+    necesita el modo corpus_file de gensim para repartir el trabajo por hilos.
+    """
+    key = hashlib.sha1('|'.join(os.path.basename(p) for p in shards).encode('utf-8')).hexdigest()[:16]
+    corpus_path = os.path.join(cache_dir, f"corpus-{key}.txt")
+    if os.path.exists(corpus_path):
+        return corpus_path
+    
+    tmp_path = f"{corpus_path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'wb') as merged:
+        for shard in shards:
+            with open(shard, 'rb') as f:
+                shutil.copyfileobj(f, merged)
+    os.replace(tmp_path, corpus_path)
+    return corpus_path
+
+
+def _write_text_atomic(path: str, text: str) -> None:
+    """Escribe un fichero de texto en un temporal y lo renombra sobre el destino."""
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+
+
+def encode_vector(vector: np.ndarray, encoding: str = 'list') -> Any:
+    """
+    Serializa un vector para incluirlo en una respuesta JSON.
+    
+    Args:
+        vector (np.ndarray): Vector a serializar
+        encoding (str): 'list' (lista de números), 'base64-float32' o
+            'base64-float16' (bytes little-endian codificados en base64)
+        
+    Returns:
+        Any: Lista de floats o cadena base64
+    """
+    if encoding == 'list':
+        return np.asarray(vector, dtype=np.float32).tolist()
+    if encoding == 'base64-float32':
+        return base64.b64encode(np.asarray(vector, dtype='<f4').tobytes()).decode('ascii')
+    if encoding == 'base64-float16':
+        return base64.b64encode(np.asarray(vector, dtype='<f2').tobytes()).decode('ascii')
+    raise ValueError(f"Codificación no soportada: {encoding}. Opciones: {VECTOR_ENCODINGS}")
+
+
+def _unitvec(vec: np.ndarray) -> np.ndarray:
+    """Normaliza un vector (L2) conservando su tipo, igual que gensim.matutils.unitvec."""
+    # gensim calcula la norma y el escalado en doble precisión (dnrm2 / dscal)
+    vec64 = np.asarray(vec, dtype=np.float64)
+    veclen = np.sqrt(np.dot(vec64, vec64))
+    if veclen > 0.0:
+        return (vec64 * (1.0 / veclen)).astype(vec.dtype)
+    return vec
+
+
+def _argsort_desc(values: np.ndarray, topn: int) -> np.ndarray:
+    """Índices de los `topn` mayores valores en orden descendente (como gensim.matutils.argsort)."""
+    values = -values
+    if topn >= values.size:
+        return np.argsort(values)[:topn]
+    most_extreme = np.argpartition(values, topn)[:topn]
+    return most_extreme.take(np.argsort(values.take(most_extreme)))
+
+
+class NumpyKeyedVectors:
+    """
+    Runtime de inferencia con la parte de la interfaz de gensim KeyedVectors
+    que usa SemanticEmbeddings, implementado solo con NumPy.
+    
+    Reproduce los mismos cálculos que gensim para que los resultados sean
+    idénticos con o sin gensim instalado.
+    """
+    
+    def __init__(self, vectors: np.ndarray, index_to_key: List[str]):
+        """
+        Args:
+            vectors (np.ndarray): Matriz de vectores (puede estar mapeada en memoria)
+            index_to_key (List[str]): Palabras en el orden de las filas
+        """
+        self.vectors = vectors
+        self.index_to_key = list(index_to_key)
+        self.key_to_index = {key: i for i, key in enumerate(self.index_to_key)}
+        self.vector_size = int(vectors.shape[1])
+        self.norms = None
+    
+    @classmethod
+    def from_gensim(cls, wv) -> 'NumpyKeyedVectors':
+        """Crea el runtime a partir de unos KeyedVectors de gensim (sin copiar los vectores)."""
+        return cls(wv.vectors, wv.index_to_key)
+    
+    def __contains__(self, key: str) -> bool:
+        return key in self.key_to_index
+    
+    def __getitem__(self, key: str) -> np.ndarray:
+        return self.vectors[self.key_to_index[key]]
+    
+    def fill_norms(self) -> None:
+        """Calcula (una sola vez) la norma de cada vector."""
+        if self.norms is None:
+            self.norms = np.linalg.norm(self.vectors, axis=1)
+    
+    def similarity(self, key1: str, key2: str) -> float:
+        """Similitud coseno entre dos palabras."""
+        return np.dot(_unitvec(self[key1]), _unitvec(self[key2]))
+    
+    def most_similar(self, key: str, topn: int = 10) -> List[Tuple[str, float]]:
+        """
+        Palabras más similares a una palabra dada, excluyendo la propia palabra.
+        
+        Args:
+            key (str): Palabra de referencia
+            topn (int): Número de resultados
+            
+        Returns:
+            List[Tuple[str, float]]: Lista de tuplas (palabra, similitud)
+        """
+        if topn < 1:
+            return []
+        
+        self.fill_norms()
+        index = self.key_to_index[key]
+        mean = _unitvec((self.vectors[index] / self.norms[index]).astype(self.vectors.dtype))
+        
+        dists = np.dot(self.vectors, mean) / self.norms
+        best = _argsort_desc(dists, topn + 1)
+        result = [(self.index_to_key[i], float(dists[i])) for i in best if i != index]
+        return result[:topn]
+
+
+class QuantizedVectors:
+    """
+    Vectores normalizados almacenados en float16 o en int8 con una escala por fila.
+    
+    Las puntuaciones se calculan por bloques directamente sobre la forma
+    comprimida, así que nunca se materializa una copia float32 de la matriz.
+    """
+    
+    def __init__(self, data: np.ndarray, scales: Optional[np.ndarray] = None):
+        """
+        Args:
+            data (np.ndarray): Matriz comprimida (float16 o int8)
+            scales (Optional[np.ndarray]): Escala por fila (solo para int8)
+        """
+        self.data = data
+        self.scales = scales
+        self.storage = 'int8' if data.dtype == np.int8 else 'float16'
+    
+    @classmethod
+    def from_vectors(cls, vectors: np.ndarray, storage: str) -> 'QuantizedVectors':
+        """
+        Comprime una matriz de vectores float32.
+        
+        Args:
+            vectors (np.ndarray): Matriz original (n, dimensión)
+            storage (str): 'float16' o 'int8'
+            
+        Returns:
+            QuantizedVectors: Vectores normalizados y comprimidos
+        """
+        if storage not in ('float16', 'int8'):
+            raise ValueError(f"Almacenamiento no soportado: {storage}")
+        
+        n_rows = vectors.shape[0]
+        dtype = np.float16 if storage == 'float16' else np.int8
+        data = np.empty(vectors.shape, dtype=dtype)
+        scales = np.empty(n_rows, dtype=np.float32) if storage == 'int8' else None
+        
+        for start in range(0, n_rows, QUANTIZE_CHUNK_ROWS):
+            end = min(start + QUANTIZE_CHUNK_ROWS, n_rows)
+            block = np.asarray(vectors[start:end], dtype=np.float32)
+            norms = np.linalg.norm(block, axis=1, keepdims=True)
+            block = block / np.maximum(norms, 1e-12)
+            
+            if storage == 'float16':
+                data[start:end] = block.astype(np.float16)
+            else:
+                block_scales = np.abs(block).max(axis=1) / 127.0
+                block_scales[block_scales == 0] = 1.0
+                data[start:end] = np.rint(block / block_scales[:, None]).astype(np.int8)
+                scales[start:end] = block_scales
+        
+        return cls(data, scales)
+    
+    @property
+    def nbytes(self) -> int:
+        """Memoria ocupada por la forma comprimida (incluidas las escalas)."""
+        return int(self.data.nbytes + (self.scales.nbytes if self.scales is not None else 0))
+    
+    def scores(self, query: np.ndarray) -> np.ndarray:
+        """
+        Similitud coseno aproximada de todas las filas con un vector unitario.
+        
+        Args:
+            query (np.ndarray): Vector de consulta normalizado
+            
+        Returns:
+            np.ndarray: Puntuaciones float32 (una por fila)
+        """
+        query = np.asarray(query, dtype=np.float32)
+        n_rows = self.data.shape[0]
+        result = np.empty(n_rows, dtype=np.float32)
+        
+        for start in range(0, n_rows, QUANTIZE_CHUNK_ROWS):
+            end = min(start + QUANTIZE_CHUNK_ROWS, n_rows)
+            result[start:end] = self.data[start:end].astype(np.float32) @ query
+        
+        if self.scales is not None:
+            result *= self.scales
+        return result
+
+
+class EmbeddingState(NamedTuple):
+    """
+    Instantánea de los vectores en uso. Al cargar una versión nueva se
+    construye una instantánea completa y se sustituye con una sola
+    asignación, de modo que cada consulta trabaja de principio a fin con
+    una única versión (vectores, vocabulario y copia comprimida coherentes).
+    """
+    wv: Any
+    vocabulary: Set[str]
+    training_info: Dict[str, Any]
+    quantized: Optional[QuantizedVectors]
+    vectors_version: Optional[int]
+    vocab_stamp: Optional[Tuple[int, int]]
+
 
 class SemanticEmbeddings:
     """
     Clase para manejar embeddings semánticos de videojuegos usando Word2Vec.
     """
     
-    def __init__(self, model_path: str = "models/gaming_word2vec.model"):
+    def __init__(self, model_path: str = "models/gaming_word2vec.model",
+                 vectors_dir: Optional[str] = None, storage: str = 'float32',
+                 inference_only: bool = False):
         """
         Inicializa el módulo de embeddings semánticos.
         
         Args:
-            model_path (str): Ruta donde se guardará/cargará el modelo
+            model_path (str): Ruta base del modelo completo. Las versiones se
+                guardan en el directorio "<ruta sin extensión>_models"; si aún
+                no hay ninguna, se carga el fichero antiguo de esta ruta.
+            vectors_dir (Optional[str]): Directorio del artefacto de inferencia
+                (vectores + vocabulario). Por defecto, junto al modelo.
+            storage (str): Almacenamiento para la búsqueda de similares:
+                'float32', 'float16' o 'int8' (con escala por fila)
+            inference_only (bool): Cargar únicamente el artefacto de vectores,
+                sin recurrir nunca al modelo completo ni a gensim
         """
+        if storage not in STORAGE_TYPES:
+            raise ValueError(f"Almacenamiento no soportado: {storage}. Opciones: {STORAGE_TYPES}")
+        
+        self.storage = storage
+        self.inference_only = inference_only
         self.model_path = model_path
-        self.model = None
-        self.vocabulary = set()
-        self.is_trained = False
+        self.models_dir = os.path.splitext(model_path)[0] + "_models"
+        self.vectors_dir = vectors_dir or os.path.splitext(model_path)[0] + "_vectors"
+        self.model = None          # Word2Vec completo (solo para entrenamiento)
+        self.model_version = None  # Versión del modelo completo cargado
+        self._state = None         # EmbeddingState usado en inferencia
+        self._last_reload_check = 0.0
+        self._reload_lock = threading.Lock()
+        self._watcher_stop = threading.Event()
+        self._watcher = None
         
         # Crear directorio de modelos si no existe
         os.makedirs(os.path.dirname(model_path), exist_ok=True)
@@ -59,6 +502,36 @@ class SemanticEmbeddings:
         # Cargar modelo existente si está disponible
         self._load_model()
     
+    @property
+    def wv(self):
+        """KeyedVectors usados en inferencia (None si no hay modelo)."""
+        state = self._state
+        return state.wv if state is not None else None
+    
+    @property
+    def vocabulary(self) -> Set[str]:
+        state = self._state
+        return state.vocabulary if state is not None else set()
+    
+    @property
+    def training_info(self) -> Dict[str, Any]:
+        state = self._state
+        return state.training_info if state is not None else {}
+    
+    @property
+    def quantized(self) -> Optional[QuantizedVectors]:
+        state = self._state
+        return state.quantized if state is not None else None
+    
+    @property
+    def vectors_version(self) -> Optional[int]:
+        state = self._state
+        return state.vectors_version if state is not None else None
+    
+    @property
+    def is_trained(self) -> bool:
+        return self._state is not None
+    
     def _create_gaming_corpus(self) -> List[List[str]]:
         """
         Crea un corpus de texto relacionado con videojuegos para entrenar el modelo.
@@ -219,12 +692,13 @@ class SemanticEmbeddings:
         logger.info(f"Corpus creado con {len(gaming_sentences)} oraciones")
         return gaming_sentences
     
-    def train_model(self, sentences: Optional[List[List[str]]] = None) -> bool:
+    def train_model(self, sentences: Optional[List[List[str]]] = None, **params) -> bool:
         """
         Entrena el modelo Word2Vec con el corpus de videojuegos.
         
         Args:
             sentences (Optional[List[List[str]]]): Oraciones para entrenar. Si es None, usa el corpus por defecto.
+            **params: Parámetros de Word2Vec que sustituyen a DEFAULT_TRAINING_PARAMS
             
         Returns:
             bool: True si el entrenamiento fue exitoso
@@ -234,33 +708,25 @@ class SemanticEmbeddings:
             return False
         
         try:
+            from gensim.models import Word2Vec
+            
             if sentences is None:
                 sentences = self._create_gaming_corpus()
             
             logger.info("Iniciando entrenamiento del modelo Word2Vec...")
             
             # Configuración del modelo Word2Vec
-            self.model = Word2Vec(
-                sentences=sentences,
-                vector_size=100,        # Dimensión de los vectores
-                window=5,              # Ventana de contexto
-                min_count=1,          # Frecuencia mínima de palabras
-                workers=4,            # Número de hilos
-                epochs=100,           # Número de épocas de entrenamiento
-                sg=1,                 # Skip-gram (1) o CBOW (0)
-                negative=5,           # Muestreo negativo
-                ns_exponent=0.75,     # Exponente para muestreo negativo
-                alpha=0.025,         # Tasa de aprendizaje inicial
-                min_alpha=0.0001,     # Tasa de aprendizaje mínima
-                seed=42               # Semilla para reproducibilidad
-            )
+            self.model = Word2Vec(sentences=sentences, **{**DEFAULT_TRAINING_PARAMS, **params})
             
             # Construir vocabulario
-            self.vocabulary = set(self.model.wv.key_to_index.keys())
-            self.is_trained = True
+            self._set_keyed_vectors(
+                NumpyKeyedVectors.from_gensim(self.model.wv),
+                self._get_training_info(self.model)
+            )
             
-            # Guardar modelo
+            # Guardar modelo completo y exportar los vectores para inferencia
             self._save_model()
+            self.export_vectors()
             
             logger.info(f"Modelo entrenado exitosamente. Vocabulario: {len(self.vocabulary)} palabras")
             return True
@@ -269,42 +735,636 @@ class SemanticEmbeddings:
             logger.error(f"Error durante el entrenamiento: {str(e)}")
             return False
     
+    def train_model_from_files(self, paths: List[str], cache_dir: str = "data/corpus_shards",
+                               preprocess_workers: Optional[int] = None,
+                               text_field: str = 'text', **params) -> Dict[str, Any]:
+        """
+        Entrena el modelo Word2Vec a partir de ficheros de corpus grandes
+        (logs de chat, volcados de foros) sin cargarlos en memoria.
+        
+        Los ficheros se preprocesan en paralelo en fragmentos en caché y el
+        entrenamiento usa el modo corpus_file de gensim, que reparte el
+        fichero entre todos los hilos. Si esa extensión de gensim no está
+        compilada, se entrena en streaming con LineSentence.
+        
+        Args:
+            paths (List[str]): Ficheros .txt (una oración por línea) o .jsonl
+            cache_dir (str): Directorio de los fragmentos preprocesados
+            preprocess_workers (Optional[int]): Procesos para el preprocesado
+            text_field (str): Campo con el texto en los ficheros .jsonl
+            **params: Parámetros de Word2Vec que sustituyen a DEFAULT_TRAINING_PARAMS
+            
+        Returns:
+            Dict[str, Any]: Informe del entrenamiento, con palabras/segundo por época
+        """
+        if not GENSIM_AVAILABLE:
+            logger.error("Gensim no está disponible. Instala con: pip install gensim")
+            return {'success': False, 'error': 'Gensim no está disponible'}
+        
+        try:
+            from gensim.models import Word2Vec
+            from gensim.models.word2vec import LineSentence, CORPUSFILE_VERSION
+            from gensim.models.callbacks import CallbackAny2Vec
+            
+            preprocessing = preprocess_corpus_files(paths, cache_dir, preprocess_workers, text_field)
+            corpus_path = _merge_shards(preprocessing['shards'], cache_dir)
+            
+            epoch_stats = []
+            
+            class EpochTimer(CallbackAny2Vec):
+                """Mide la duración y el rendimiento de cada época."""
+                
+                def on_epoch_begin(self, model):
+                    self.start = time.perf_counter()
+                
+                def on_epoch_end(self, model):
+                    seconds = time.perf_counter() - self.start
+                    words = model.corpus_total_words
+                    epoch_stats.append({
+                        'epoch': len(epoch_stats) + 1,
+                        'seconds': round(seconds, 3),
+                        'words_per_sec': round(words / seconds, 1) if seconds > 0 else None
+                    })
+                    logger.info(f"Época {len(epoch_stats)}: {epoch_stats[-1]['words_per_sec']} palabras/s")
+            
+            training_params = {**DEFAULT_TRAINING_PARAMS, **params}
+            use_corpus_file = CORPUSFILE_VERSION != -1
+            
+            logger.info("Iniciando entrenamiento del modelo Word2Vec desde ficheros...")
+            start_time = time.perf_counter()
+            if use_corpus_file:
+                self.model = Word2Vec(corpus_file=corpus_path, callbacks=[EpochTimer()], **training_params)
+            else:
+                self.model = Word2Vec(sentences=LineSentence(corpus_path), callbacks=[EpochTimer()], **training_params)
+            training_seconds = time.perf_counter() - start_time
+            
+            self._set_keyed_vectors(
+                NumpyKeyedVectors.from_gensim(self.model.wv),
+                self._get_training_info(self.model)
+            )
+            self._save_model()
+            self.export_vectors()
+            
+            total_words = self.model.corpus_total_words * self.model.epochs
+            logger.info(f"Modelo entrenado exitosamente. Vocabulario: {len(self.vocabulary)} palabras")
+            return {
+                'success': True,
+                'mode': 'corpus_file' if use_corpus_file else 'streaming',
+                'corpus_file': corpus_path,
+                'preprocessing': {k: v for k, v in preprocessing.items() if k != 'shards'},
+                'corpus_words': int(self.model.corpus_total_words),
+                'vocabulary_size': len(self.vocabulary),
+                'training_seconds': round(training_seconds, 3),
+                'words_per_sec': round(total_words / training_seconds, 1) if training_seconds > 0 else None,
+                'epochs': epoch_stats,
+                'params': training_params
+            }
+            
+        except Exception as e:
+            logger.error(f"Error durante el entrenamiento desde ficheros: {str(e)}")
+            return {'success': False, 'error': str(e)}
+    
+    def update_model(self, sentences: List[List[str]], epochs: int = 5) -> bool:
+        """
+        Actualiza el modelo de forma incremental: añade las palabras nuevas al
+        vocabulario (build_vocab con update=True) y entrena unas pocas épocas
+        sobre las oraciones nuevas, sin reentrenar desde cero.
+        
+        Al terminar guarda el modelo completo y publica una versión nueva de
+        los vectores que los procesos en ejecución cargan con reload_if_updated.
+        
+        Args:
+            sentences (List[List[str]]): Oraciones tokenizadas nuevas
+            epochs (int): Épocas de entrenamiento sobre las oraciones nuevas
+            
+        Returns:
+            bool: True si la actualización fue exitosa
+        """
+        if not GENSIM_AVAILABLE:
+            logger.error("Gensim no está disponible. Instala con: pip install gensim")
+            return False
+        
+        sentences = [sentence for sentence in sentences if sentence]
+        if not sentences:
+            logger.info("No hay oraciones nuevas para actualizar el modelo")
+            return False
+        
+        try:
+            # Partir siempre de la versión vigente: otro proceso puede haber
+            # publicado un modelo más nuevo que el que tenemos en memoria
+            current_version = self._read_current_model_version()
+            if self.model is None or (current_version is not None and current_version != self.model_version):
+                if self._resolve_model_file()[0] is None:
+                    logger.error(f"No existe el modelo completo en: {self.models_dir}")
+                    return False
+                self._load_full_model()
+            
+            previous_size = len(self.model.wv.index_to_key)
+            self.model.build_vocab(sentences, update=True)
+            self.model.train(sentences, total_examples=len(sentences), epochs=epochs)
+            
+            self._set_keyed_vectors(
+                NumpyKeyedVectors.from_gensim(self.model.wv),
+                self._get_training_info(self.model)
+            )
+            self._save_model()
+            self.export_vectors()
+            
+            logger.info(
+                f"Modelo actualizado con {len(sentences)} oraciones. "
+                f"Palabras nuevas: {len(self.vocabulary) - previous_size}"
+            )
+            return True
+            
+        except Exception as e:
+            logger.error(f"Error durante la actualización incremental: {str(e)}")
+            return False
+    
     def _save_model(self) -> bool:
         """
-        Guarda el modelo entrenado en disco.
+        Guarda el modelo entrenado en disco como una versión nueva.
+        
+        El modelo se escribe en un directorio propio que nadie está leyendo,
+        después se escribe el manifiesto (ficheros y tamaños) y por último se
+        reemplaza el puntero CURRENT de forma atómica. Un proceso que cargue
+        en paralelo ve la versión anterior completa o la nueva completa.
         
         Returns:
             bool: True si se guardó exitosamente
         """
+        if self.model is None:
+            return False
+        
         try:
-            if self.model is not None:
-                self.model.save(self.model_path)
-                logger.info(f"Modelo guardado en: {self.model_path}")
+            version, version_dir = self._claim_model_version()
+            self.model.save(os.path.join(version_dir, MODEL_FILENAME))
+            
+            manifest = {
+                'format_version': MODEL_FORMAT_VERSION,
+                'version': version,
+                'model_file': MODEL_FILENAME,
+                'files': {
+                    name: os.path.getsize(os.path.join(version_dir, name))
+                    for name in sorted(os.listdir(version_dir))
+                },
+                'created_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+                'vocabulary_size': len(self.model.wv.index_to_key),
+                'vector_size': int(self.model.wv.vector_size),
+                'training_info': self._get_training_info(self.model),
+            }
+            _write_text_atomic(os.path.join(version_dir, MANIFEST_FILENAME),
+                               json.dumps(manifest, ensure_ascii=False, indent=2))
+            
+            # El puntero se escribe al final: es el que publica la versión
+            _write_text_atomic(os.path.join(self.models_dir, MODEL_POINTER_FILENAME),
+                               os.path.basename(version_dir) + '\n')
+            
+            self.model_version = version
+            self._remove_old_model_versions(version)
+            logger.info(f"Modelo guardado en: {version_dir} (versión {version})")
+            return True
+        except Exception as e:
+            logger.error(f"Error al guardar el modelo: {str(e)}")
+            return False
+    
+    def _list_model_versions(self) -> List[int]:
+        """Versiones del modelo completo presentes en disco."""
+        if not os.path.isdir(self.models_dir):
+            return []
+        versions = []
+        for name in os.listdir(self.models_dir):
+            match = re.fullmatch(r"v(\d+)", name)
+            if match:
+                versions.append(int(match.group(1)))
+        return sorted(versions)
+    
+    def _claim_model_version(self) -> Tuple[int, str]:
+        """
+        Reserva el siguiente número de versión creando su directorio. La
+        creación es atómica, así que dos procesos que guarden a la vez
+        nunca escriben en el mismo directorio.
+        """
+        os.makedirs(self.models_dir, exist_ok=True)
+        version = max(self._list_model_versions(), default=0) + 1
+        while True:
+            version_dir = os.path.join(self.models_dir, MODEL_VERSION_DIRNAME.format(version=version))
+            try:
+                os.mkdir(version_dir)
+                return version, version_dir
+            except FileExistsError:
+                version += 1
+    
+    def _read_current_model_version(self) -> Optional[int]:
+        """Versión del modelo completo a la que apunta CURRENT (None si no hay)."""
+        try:
+            with open(os.path.join(self.models_dir, MODEL_POINTER_FILENAME), 'r', encoding='utf-8') as f:
+                match = re.fullmatch(r"v(\d+)", f.read().strip())
+            return int(match.group(1)) if match else None
+        except OSError:
+            return None
+    
+    def _resolve_model_file(self) -> Tuple[Optional[str], Optional[int]]:
+        """
+        Localiza el modelo completo vigente y comprueba su manifiesto.
+        
+        Returns:
+            Tuple[Optional[str], Optional[int]]: (ruta del modelo, versión).
+            Si la versión vigente está dañada se usa la más reciente que esté
+            completa; si no hay versiones publicadas, el fichero antiguo de
+            model_path (versión None); si tampoco existe, (None, None).
+        """
+        current = self._read_current_model_version()
+        if current is not None:
+            candidates = [current] + [v for v in reversed(self._list_model_versions()) if v < current]
+            for version in candidates:
+                model_file = self._check_model_version(version)
+                if model_file is not None:
+                    if version != current:
+                        logger.warning(f"Usando la versión {version} del modelo en lugar de la {current}")
+                    return model_file, version
+        
+        if os.path.exists(self.model_path):
+            return self.model_path, None
+        return None, None
+    
+    def _check_model_version(self, version: int) -> Optional[str]:
+        """Ruta del modelo de una versión si su manifiesto existe y todos sus ficheros están completos."""
+        version_dir = os.path.join(self.models_dir, MODEL_VERSION_DIRNAME.format(version=version))
+        try:
+            with open(os.path.join(version_dir, MANIFEST_FILENAME), 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+            complete = manifest.get('format_version') == MODEL_FORMAT_VERSION and all(
+                os.path.getsize(os.path.join(version_dir, name)) == size
+                for name, size in manifest['files'].items()
+            )
+            if complete:
+                return os.path.join(version_dir, manifest['model_file'])
+            logger.error(f"La versión {version} del modelo está incompleta: {version_dir}")
+        except (OSError, ValueError, KeyError) as e:
+            logger.error(f"Manifiesto del modelo inválido en {version_dir}: {str(e)}")
+        return None
+    
+    def _remove_old_model_versions(self, current_version: int) -> None:
+        """Borra los directorios de versiones antiguas, conservando las últimas KEEP_MODEL_VERSIONS."""
+        oldest_kept = current_version - KEEP_MODEL_VERSIONS + 1
+        for version in self._list_model_versions():
+            if version < oldest_kept:
+                shutil.rmtree(os.path.join(self.models_dir, MODEL_VERSION_DIRNAME.format(version=version)),
+                              ignore_errors=True)
+    
+    def export_vectors(self) -> bool:
+        """
+        Exporta solo los KeyedVectors del modelo (sin estado de entrenamiento
+        como syn1neg) a un array .npy y un fichero de vocabulario.
+        
+        Los ficheros se escriben primero en temporales y se renombran, de modo
+        que un proceso que cargue en paralelo nunca ve un artefacto a medias.
+        
+        Returns:
+            bool: True si se exportó exitosamente
+        """
+        state = self._state
+        if state is None:
+            return False
+        
+        try:
+            os.makedirs(self.vectors_dir, exist_ok=True)
+            
+            version = (self._read_published_version() or 0) + 1
+            vectors_file = VECTORS_FILENAME.format(version=version)
+            vectors_path = os.path.join(self.vectors_dir, vectors_file)
+            tmp_path = f"{vectors_path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                np.save(f, np.ascontiguousarray(state.wv.vectors, dtype=np.float32))
+            os.replace(tmp_path, vectors_path)
+            
+            # El vocabulario se escribe al final: es el punto de entrada del artefacto
+            vocab = {
+                'format_version': VECTORS_FORMAT_VERSION,
+                'version': version,
+                'vectors_file': vectors_file,
+                'vector_size': int(state.wv.vector_size),
+                'words': list(state.wv.index_to_key),
+                'training_info': state.training_info,
+                'model_version': self.model_version,
+            }
+            vocab_path = os.path.join(self.vectors_dir, VOCAB_FILENAME)
+            tmp_path = f"{vocab_path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(vocab, f, ensure_ascii=False)
+            os.replace(tmp_path, vocab_path)
+            
+            # Los vectores en memoria ya son los publicados: no hace falta recargarlos
+            self._state = state._replace(vectors_version=version, vocab_stamp=self._get_vocab_stamp())
+            self._remove_old_vector_versions(version)
+            logger.info(f"Vectores exportados en: {self.vectors_dir} (versión {version})")
+            return True
+        except Exception as e:
+            logger.error(f"Error al exportar los vectores: {str(e)}")
+            return False
+    
+    def _read_published_version(self) -> Optional[int]:
+        """Versión de vectores publicada actualmente en disco (None si no hay)."""
+        try:
+            with open(os.path.join(self.vectors_dir, VOCAB_FILENAME), 'r', encoding='utf-8') as f:
+                return int(json.load(f).get('version', 0))
+        except (OSError, ValueError):
+            return None
+    
+    def _remove_old_vector_versions(self, current_version: int) -> None:
+        """
+        Borra los ficheros de versiones antiguas, conservando las últimas
+        KEEP_VECTOR_VERSIONS. Los procesos que aún las tengan mapeadas siguen
+        leyéndolas sin problema hasta que recarguen.
+        """
+        oldest_kept = current_version - KEEP_VECTOR_VERSIONS + 1
+        for filename in os.listdir(self.vectors_dir):
+            match = re.match(r"vectors-(\d+)\.", filename)
+            if match and int(match.group(1)) < oldest_kept:
+                try:
+                    os.remove(os.path.join(self.vectors_dir, filename))
+                except OSError:
+                    pass
+    
+    def _get_vocab_stamp(self) -> Optional[Tuple[int, int]]:
+        """Identifica la versión publicada de vocab.json sin leerlo."""
+        try:
+            stat = os.stat(os.path.join(self.vectors_dir, VOCAB_FILENAME))
+            return (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            return None
+    
+    def reload_if_updated(self, force_check: bool = False) -> bool:
+        """
+        Carga la nueva versión de los vectores si se ha publicado otra.
+        
+        La comprobación es un simple stat y se hace como mucho una vez cada
+        RELOAD_CHECK_SECONDS, así que puede llamarse en cada consulta.
+        
+        Args:
+            force_check (bool): Comprobar aunque no haya pasado el intervalo
+            
+        Returns:
+            bool: True si se cargó una versión nueva
+        """
+        now = time.monotonic()
+        if not force_check and now - self._last_reload_check < RELOAD_CHECK_SECONDS:
+            return False
+        
+        # Si otro hilo ya está cargando la versión nueva, no se espera por él
+        if not self._reload_lock.acquire(blocking=False):
+            return False
+        try:
+            self._last_reload_check = now
+            
+            state = self._state
+            stamp = self._get_vocab_stamp()
+            if stamp is None or (state is not None and stamp == state.vocab_stamp):
+                return False
+            
+            previous_version = self.vectors_version
+            if self._load_vectors() and self.vectors_version != previous_version:
+                logger.info(f"Vectores actualizados a la versión {self.vectors_version}")
                 return True
             return False
+        finally:
+            self._reload_lock.release()
+    
+    def start_watcher(self, interval: float = RELOAD_CHECK_SECONDS) -> None:
+        """
+        Vigila en segundo plano la publicación de versiones nuevas y las carga.
+        
+        La versión nueva se carga entera en el hilo vigilante y se activa con
+        una sola asignación; las consultas en curso terminan con la anterior
+        y las siguientes usan la nueva, sin pagar el coste de la carga.
+        
+        Args:
+            interval (float): Segundos entre comprobaciones
+        """
+        if self._watcher is not None and self._watcher.is_alive():
+            return
+        self._watcher_stop.clear()
+        self._watcher = threading.Thread(target=self._watch, args=(interval,),
+                                         name="embeddings-watcher", daemon=True)
+        self._watcher.start()
+    
+    def stop_watcher(self, timeout: Optional[float] = None) -> None:
+        """Detiene la vigilancia de versiones nuevas."""
+        self._watcher_stop.set()
+        if self._watcher is not None:
+            self._watcher.join(timeout)
+    
+    def _watch(self, interval: float) -> None:
+        while not self._watcher_stop.wait(interval):
+            try:
+                self.reload_if_updated(force_check=True)
+            except Exception as e:
+                logger.error(f"Error al comprobar versiones nuevas: {str(e)}")
+    
+    def _load_vectors(self) -> bool:
+        """
+        Carga el artefacto de inferencia mapeando los vectores en memoria
+        (solo lectura), de forma que todos los procesos comparten la misma
+        copia en la caché de páginas del sistema.
+        
+        Returns:
+            bool: True si se cargó exitosamente
+        """
+        vocab_path = os.path.join(self.vectors_dir, VOCAB_FILENAME)
+        if not os.path.exists(vocab_path):
+            return False
+        
+        try:
+            stamp = self._get_vocab_stamp()
+            with open(vocab_path, 'r', encoding='utf-8') as f:
+                vocab = json.load(f)
+            
+            vectors = np.load(os.path.join(self.vectors_dir, vocab['vectors_file']), mmap_mode='r')
+            words = vocab['words']
+            if vectors.shape != (len(words), vocab['vector_size']):
+                logger.error(f"Artefacto de vectores inconsistente en: {self.vectors_dir}")
+                return False
+            
+            self._set_keyed_vectors(
+                NumpyKeyedVectors(vectors, words),
+                vocab.get('training_info', {}),
+                vocab['vectors_file'],
+                vocab.get('version'),
+                stamp
+            )
+            logger.info(f"Vectores mapeados desde: {self.vectors_dir}")
+            return True
         except Exception as e:
-            logger.error(f"Error al guardar el modelo: {str(e)}")
+            logger.error(f"Error al cargar los vectores: {str(e)}")
             return False
     
     def _load_model(self) -> bool:
         """
         Carga un modelo previamente entrenado desde disco.
         
+        Usa el artefacto de vectores si existe; si no, carga el modelo
+        completo y exporta el artefacto para las siguientes cargas.
+        
         Returns:
             bool: True si se cargó exitosamente
         """
+        if self._load_vectors():
+            return True
+        
+        if self.inference_only or not GENSIM_AVAILABLE:
+            return False
+        
         try:
-            if os.path.exists(self.model_path):
-                self.model = Word2Vec.load(self.model_path)
-                self.vocabulary = set(self.model.wv.key_to_index.keys())
-                self.is_trained = True
-                logger.info(f"Modelo cargado desde: {self.model_path}")
+            if self._resolve_model_file()[0] is not None:
+                self._load_full_model()
+                self.export_vectors()
                 return True
             return False
         except Exception as e:
             logger.error(f"Error al cargar el modelo: {str(e)}")
             return False
     
+    def _load_full_model(self) -> None:
+        """Carga la versión vigente del modelo Word2Vec completo, necesario para seguir entrenando."""
+        from gensim.models import Word2Vec
+        
+        model_file, version = self._resolve_model_file()
+        if model_file is None:
+            raise FileNotFoundError(f"No existe el modelo completo en: {self.models_dir}")
+        
+        self.model = Word2Vec.load(model_file)
+        self.model_version = version
+        logger.info(f"Modelo cargado desde: {model_file}")
+        self._set_keyed_vectors(
+            NumpyKeyedVectors.from_gensim(self.model.wv),
+            self._get_training_info(self.model)
+        )
+    
+    def _set_keyed_vectors(self, wv, training_info: Dict[str, Any],
+                           vectors_file: Optional[str] = None,
+                           vectors_version: Optional[int] = None,
+                           vocab_stamp: Optional[Tuple[int, int]] = None) -> None:
+        """
+        Establece los vectores usados en inferencia y su vocabulario.
+        
+        Todo se prepara antes de la asignación final de self._state, así que
+        las consultas en curso nunca ven una versión a medio cargar.
+        """
+        quantized = None
+        if self.storage != 'float32':
+            quantized = self._load_quantized(wv.vectors, vectors_file)
+            logger.info(
+                f"Vectores comprimidos en {self.storage}: "
+                f"{quantized.nbytes} bytes (float32: {wv.vectors.nbytes} bytes)"
+            )
+        
+        self._state = EmbeddingState(
+            wv=wv,
+            vocabulary=set(wv.key_to_index.keys()),
+            training_info=training_info,
+            quantized=quantized,
+            vectors_version=vectors_version,
+            vocab_stamp=vocab_stamp
+        )
+    
+    def _load_quantized(self, vectors: np.ndarray, vectors_file: Optional[str] = None) -> QuantizedVectors:
+        """
+        Obtiene la forma comprimida de los vectores.
+        
+        Si los vectores vienen del artefacto exportado, se reutiliza (mapeada
+        en memoria) la copia comprimida guardada junto a esa versión; si no
+        existe, se calcula y se guarda.
+        
+        Args:
+            vectors (np.ndarray): Matriz float32 original
+            vectors_file (Optional[str]): Fichero de vectores del artefacto
+            
+        Returns:
+            QuantizedVectors: Vectores comprimidos
+        """
+        if vectors_file is None:
+            return QuantizedVectors.from_vectors(vectors, self.storage)
+        
+        stem = os.path.splitext(vectors_file)[0]
+        data_path = os.path.join(self.vectors_dir, f"{stem}.{self.storage}.npy")
+        scales_path = os.path.join(self.vectors_dir, f"{stem}.scales.npy")
+        source_path = os.path.join(self.vectors_dir, vectors_file)
+        
+        try:
+            if (os.path.exists(data_path) and os.path.exists(source_path)
+                    and os.path.getmtime(data_path) >= os.path.getmtime(source_path)):
+                data = np.load(data_path, mmap_mode='r')
+                scales = np.load(scales_path, mmap_mode='r') if self.storage == 'int8' else None
+                if data.shape == vectors.shape:
+                    return QuantizedVectors(data, scales)
+        except Exception as e:
+            logger.warning(f"No se pudieron cargar los vectores comprimidos: {str(e)}")
+        
+        quantized = QuantizedVectors.from_vectors(vectors, self.storage)
+        
+        if os.path.exists(source_path):
+            try:
+                # Las escalas primero: la matriz es la que marca la copia como válida
+                for path, array in ((scales_path, quantized.scales), (data_path, quantized.data)):
+                    if array is None:
+                        continue
+                    tmp_path = f"{path}.{os.getpid()}.tmp"
+                    with open(tmp_path, 'wb') as f:
+                        np.save(f, array)
+                    os.replace(tmp_path, path)
+            except Exception as e:
+                logger.warning(f"No se pudieron guardar los vectores comprimidos: {str(e)}")
+        
+        return quantized
+    
+    @staticmethod
+    def _most_similar_quantized(state: EmbeddingState, word: str, topn: int) -> List[Tuple[str, float]]:
+        """
+        Busca los vecinos más cercanos sobre los vectores comprimidos y
+        reevalúa en float32 solo los mejores candidatos.
+        
+        Args:
+            state (EmbeddingState): Instantánea de vectores de la consulta
+            word (str): Palabra de referencia (ya en minúsculas y en el vocabulario)
+            topn (int): Número de palabras similares a devolver
+            
+        Returns:
+            List[Tuple[str, float]]: Lista de tuplas (palabra, similitud)
+        """
+        vectors = state.wv.vectors
+        index = state.wv.key_to_index[word]
+        query = np.asarray(vectors[index], dtype=np.float32)
+        norm = np.linalg.norm(query)
+        if norm == 0:
+            return []
+        query = query / norm
+        
+        scores = state.quantized.scores(query)
+        scores[index] = -np.inf
+        
+        n_candidates = min(topn * RESCORE_FACTOR, len(scores) - 1)
+        if n_candidates <= 0:
+            return []
+        candidates = np.argpartition(-scores, n_candidates - 1)[:n_candidates]
+        candidates.sort()
+        
+        # Reevaluación exacta en float32 solo sobre los candidatos
+        candidate_vectors = np.asarray(vectors[candidates], dtype=np.float32)
+        exact = candidate_vectors @ query / np.linalg.norm(candidate_vectors, axis=1)
+        order = np.argsort(-exact, kind='stable')[:topn]
+        
+        return [(state.wv.index_to_key[candidates[i]], float(exact[i])) for i in order]
+    
+    @staticmethod
+    def _get_training_info(model) -> Dict[str, Any]:
+        """Extrae los parámetros de entrenamiento que se publican con los vectores."""
+        return {
+            'total_words': int(model.corpus_total_words),
+            'epochs': int(model.epochs),
+            'window': int(model.window),
+            'min_count': int(model.min_count)
+        }
+    
     def get_word_vector(self, word: str) -> Optional[np.ndarray]:
         """
         Obtiene el vector de una palabra específica.
@@ -315,13 +1375,14 @@ class SemanticEmbeddings:
         Returns:
             Optional[np.ndarray]: Vector de la palabra o None si no existe
         """
-        if not self.is_trained or self.model is None:
+        state = self._state
+        if state is None:
             logger.warning("Modelo no entrenado")
             return None
         
         word_lower = word.lower()
-        if word_lower in self.vocabulary:
-            return self.model.wv[word_lower]
+        if word_lower in state.vocabulary:
+            return state.wv[word_lower]
         else:
             logger.warning(f"Palabra '{word}' no encontrada en el vocabulario")
             return None
@@ -337,19 +1398,25 @@ class SemanticEmbeddings:
         Returns:
             Optional[float]: Similitud coseno (0-1) o None si hay error
         """
-        if not self.is_trained or self.model is None:
+        state = self._state
+        if state is None:
             logger.warning("Modelo no entrenado")
             return None
         
+        return self._calculate_similarity(state, word1, word2)
+    
+    @staticmethod
+    def _calculate_similarity(state: EmbeddingState, word1: str, word2: str) -> Optional[float]:
+        """Similitud coseno entre dos palabras con una instantánea de vectores concreta."""
         try:
             word1_lower = word1.lower()
             word2_lower = word2.lower()
             
-            if word1_lower not in self.vocabulary or word2_lower not in self.vocabulary:
+            if word1_lower not in state.vocabulary or word2_lower not in state.vocabulary:
                 logger.warning(f"Una o ambas palabras no están en el vocabulario: {word1}, {word2}")
                 return None
             
-            similarity = self.model.wv.similarity(word1_lower, word2_lower)
+            similarity = state.wv.similarity(word1_lower, word2_lower)
             return float(similarity)
             
         except Exception as e:
@@ -367,45 +1434,75 @@ class SemanticEmbeddings:
         Returns:
             List[Tuple[str, float]]: Lista de tuplas (palabra, similitud)
         """
-        if not self.is_trained or self.model is None:
+        state = self._state
+        if state is None:
             logger.warning("Modelo no entrenado")
             return []
         
+        return self._get_most_similar(state, word, topn)
+    
+    def _get_most_similar(self, state: EmbeddingState, word: str, topn: int) -> List[Tuple[str, float]]:
+        """Palabras más similares con una instantánea de vectores concreta."""
         try:
             word_lower = word.lower()
-            if word_lower not in self.vocabulary:
+            if word_lower not in state.vocabulary:
                 logger.warning(f"Palabra '{word}' no encontrada en el vocabulario")
                 return []
             
-            similar_words = self.model.wv.most_similar(word_lower, topn=topn)
+            if state.quantized is not None:
+                return self._most_similar_quantized(state, word_lower, topn)
+            
+            similar_words = state.wv.most_similar(word_lower, topn=topn)
             return [(word, float(similarity)) for word, similarity in similar_words]
             
         except Exception as e:
             logger.error(f"Error al obtener palabras similares: {str(e)}")
             return []
     
-    def get_similar_terms(self, word: str, topn: int = 5) -> List[Dict[str, Any]]:
+    def get_similar_terms(self, word: str, topn: int = 5,
+                          fields: Optional[Iterable[str]] = None,
+                          vector_encoding: str = 'list') -> List[Dict[str, Any]]:
         """
         Obtiene términos similares con información adicional.
         
         Args:
             word (str): Palabra de referencia
             topn (int): Número de términos similares a devolver
+            fields (Optional[Iterable[str]]): Campos de cada término (de
+                SIMILAR_TERM_FIELDS). Por defecto, todos menos 'vector'.
+            vector_encoding (str): Formato del vector si se pide: 'list',
+                'base64-float32' o 'base64-float16'
             
         Returns:
             List[Dict[str, Any]]: Lista de diccionarios con información de términos similares
         """
-        similar_words = self.get_most_similar(word, topn)
+        fields = DEFAULT_SIMILAR_TERM_FIELDS if fields is None else tuple(fields)
+        unknown = set(fields) - set(SIMILAR_TERM_FIELDS)
+        if unknown:
+            raise ValueError(f"Campos no soportados: {sorted(unknown)}. Opciones: {SIMILAR_TERM_FIELDS}")
+        if vector_encoding not in VECTOR_ENCODINGS:
+            raise ValueError(f"Codificación no soportada: {vector_encoding}. Opciones: {VECTOR_ENCODINGS}")
+        
+        state = self._state
+        if state is None:
+            logger.warning("Modelo no entrenado")
+            return []
+        
+        similar_words = self._get_most_similar(state, word, topn)
+        wv = state.wv
         
         results = []
         for i, (similar_word, similarity) in enumerate(similar_words, 1):
-            results.append({
+            values = {
                 'rank': i,
                 'word': similar_word,
                 'similarity': similarity,
-                'similarity_percentage': round(similarity * 100, 2),
-                'vector': self.get_word_vector(similar_word).tolist() if self.get_word_vector(similar_word) is not None else None
-            })
+            }
+            if 'similarity_percentage' in fields:
+                values['similarity_percentage'] = round(similarity * 100, 2)
+            if 'vector' in fields:
+                values['vector'] = encode_vector(wv[similar_word], vector_encoding)
+            results.append({field: values[field] for field in fields})
         
         return results
     
@@ -419,7 +1516,8 @@ class SemanticEmbeddings:
         Returns:
             Dict[str, Any]: Análisis de similitudes semánticas
         """
-        if not self.is_trained or self.model is None:
+        state = self._state
+        if state is None:
             return {
                 'error': 'Modelo no entrenado',
                 'similarities': [],
@@ -428,7 +1526,7 @@ class SemanticEmbeddings:
         
         # Tokenizar el texto
         words = text.lower().split()
-        gaming_words = [word for word in words if word in self.vocabulary]
+        gaming_words = [word for word in words if word in state.vocabulary]
         
         if len(gaming_words) < 2:
             return {
@@ -442,7 +1540,7 @@ class SemanticEmbeddings:
         similarities = []
         for i, word1 in enumerate(gaming_words):
             for j, word2 in enumerate(gaming_words[i+1:], i+1):
-                similarity = self.calculate_similarity(word1, word2)
+                similarity = self._calculate_similarity(state, word1, word2)
                 if similarity is not None:
                     similarities.append({
                         'word1': word1,
@@ -472,7 +1570,8 @@ class SemanticEmbeddings:
         Returns:
             Dict[str, Any]: Información del modelo
         """
-        if not self.is_trained or self.model is None:
+        state = self._state
+        if state is None:
             return {
                 'is_trained': False,
                 'model_path': self.model_path,
@@ -483,15 +1582,153 @@ class SemanticEmbeddings:
         return {
             'is_trained': True,
             'model_path': self.model_path,
-            'vocabulary_size': len(self.vocabulary),
-            'vector_size': self.model.wv.vector_size,
-            'total_words': self.model.corpus_total_words,
-            'epochs': self.model.epochs,
-            'window': self.model.window,
-            'min_count': self.model.min_count
+            'model_version': self.model_version,
+            'vectors_version': state.vectors_version,
+            'vocabulary_size': len(state.vocabulary),
+            'vector_size': state.wv.vector_size,
+            'storage': self.storage,
+            'total_words': state.training_info.get('total_words'),
+            'epochs': state.training_info.get('epochs'),
+            'window': state.training_info.get('window'),
+            'min_count': state.training_info.get('min_count')
         }
 
 
+class IncrementalUpdater:
+    """
+    Actualiza periódicamente los embeddings con los mensajes de chat recogidos.
+    
+    Los mensajes se acumulan en un fichero de texto (uno por línea) con
+    collect_chat_message. En cada ciclo se leen solo las líneas nuevas desde
+    el último desplazamiento procesado, se actualiza el modelo y se publica
+    la nueva versión de los vectores.
+    """
+    
+    def __init__(self, embeddings: SemanticEmbeddings,
+                 spool_path: str = "data/chat_sentences.txt",
+                 interval: float = 3600.0, epochs: int = 5, min_sentences: int = 50):
+        """
+        Args:
+            embeddings (SemanticEmbeddings): Instancia a actualizar
+            spool_path (str): Fichero donde se acumulan los mensajes
+            interval (float): Segundos entre actualizaciones
+            epochs (int): Épocas por actualización
+            min_sentences (int): Mínimo de oraciones nuevas para actualizar
+        """
+        self.embeddings = embeddings
+        self.spool_path = spool_path
+        self.offset_path = spool_path + ".offset"
+        self.interval = interval
+        self.epochs = epochs
+        self.min_sentences = min_sentences
+        self._stop_event = threading.Event()
+        self._thread = None
+    
+    def _read_offset(self) -> int:
+        """Desplazamiento (en bytes) hasta el que ya se procesó el fichero."""
+        try:
+            with open(self.offset_path, 'r', encoding='utf-8') as f:
+                return int(f.read().strip() or 0)
+        except (OSError, ValueError):
+            return 0
+    
+    def _write_offset(self, offset: int) -> None:
+        tmp_path = f"{self.offset_path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(str(offset))
+        os.replace(tmp_path, self.offset_path)
+    
+    def _read_new_sentences(self) -> Tuple[List[List[str]], int]:
+        """Lee y tokeniza las líneas completas añadidas desde el último ciclo."""
+        offset = self._read_offset()
+        sentences = []
+        if not os.path.exists(self.spool_path):
+            return sentences, offset
+        
+        with open(self.spool_path, 'rb') as f:
+            f.seek(offset)
+            for raw_line in f:
+                if not raw_line.endswith(b'\n'):
+                    break  # Línea aún a medio escribir: se procesa en el siguiente ciclo
+                offset += len(raw_line)
+                tokens = tokenize_for_embeddings(raw_line.decode('utf-8', errors='replace'))
+                if tokens:
+                    sentences.append(tokens)
+        return sentences, offset
+    
+    def run_once(self) -> Dict[str, Any]:
+        """
+        Ejecuta un ciclo de actualización.
+        
+        Returns:
+            Dict[str, Any]: Resultado del ciclo (oraciones, versión publicada)
+        """
+        sentences, offset = self._read_new_sentences()
+        if len(sentences) < self.min_sentences:
+            return {'updated': False, 'sentences': len(sentences),
+                    'message': f"Se necesitan al menos {self.min_sentences} oraciones nuevas"}
+        
+        updated = self.embeddings.update_model(sentences, epochs=self.epochs)
+        if updated:
+            self._write_offset(offset)
+        return {
+            'updated': updated,
+            'sentences': len(sentences),
+            'version': self.embeddings.vectors_version,
+            'vocabulary_size': len(self.embeddings.vocabulary)
+        }
+    
+    def _run(self) -> None:
+        while not self._stop_event.wait(self.interval):
+            try:
+                result = self.run_once()
+                logger.info(f"Ciclo de actualización incremental: {result}")
+            except Exception as e:
+                logger.error(f"Error en la actualización incremental: {str(e)}")
+    
+    def start(self) -> None:
+        """Arranca las actualizaciones periódicas en un hilo en segundo plano."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="embeddings-updater", daemon=True)
+        self._thread.start()
+    
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Detiene las actualizaciones periódicas."""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+
+def collect_chat_message(text: str, spool_path: str = "data/chat_sentences.txt") -> bool:
+    """
+    Añade un mensaje de chat al fichero que consume IncrementalUpdater.
+    
+    Es de mejor esfuerzo: un error de escritura se registra y no se propaga,
+    para que nunca impida responder al mensaje.
+    
+    Args:
+        text (str): Mensaje del usuario
+        spool_path (str): Fichero donde se acumulan los mensajes
+        
+    Returns:
+        bool: True si el mensaje se ha añadido
+    """
+    line = ' '.join(text.split())
+    if not line:
+        return False
+    try:
+        os.makedirs(os.path.dirname(spool_path) or '.', exist_ok=True)
+        # Una sola escritura en modo append: las líneas de procesos concurrentes no se mezclan
+        with open(spool_path, 'a', encoding='utf-8') as f:
+            f.write(line + '\n')
+        return True
+    except OSError as e:
+        logger.warning(f"No se pudo guardar el mensaje de chat: {str(e)}")
+        return False
+
+
 def create_semantic_embeddings() -> SemanticEmbeddings:
     """
     Función de conveniencia para crear una instancia de SemanticEmbeddings.
@@ -502,25 +1739,72 @@ def create_semantic_embeddings() -> SemanticEmbeddings:
     return SemanticEmbeddings()
 
 
-def get_similar_terms_for_word(word: str, topn: int = 5) -> List[Dict[str, Any]]:
+_shared_embeddings = None
+_shared_lock = threading.Lock()
+
+
+def get_shared_embeddings() -> SemanticEmbeddings:
+    """
+    Devuelve la instancia de embeddings compartida por el proceso.
+    
+    Se crea (y, si no hay modelo, se entrena) la primera vez y arranca un
+    hilo que vigila y carga las versiones nuevas que se publiquen.
+    
+    Returns:
+        SemanticEmbeddings: Instancia compartida
+    """
+    global _shared_embeddings
+    
+    with _shared_lock:
+        if _shared_embeddings is None:
+            embeddings = create_semantic_embeddings()
+            
+            # Si el modelo no está entrenado, entrenarlo
+            if not embeddings.is_trained:
+                logger.info("Modelo no encontrado, entrenando...")
+                embeddings.train_model()
+            
+            # Las versiones nuevas se cargan en segundo plano y se activan
+            # sin interrumpir las consultas en curso
+            embeddings.start_watcher()
+            _shared_embeddings = embeddings
+    
+    return _shared_embeddings
+
+
+def load_inference_embeddings(vectors_dir: str = "models/gaming_word2vec_vectors",
+                              storage: str = 'float32') -> SemanticEmbeddings:
+    """
+    Carga los embeddings solo para inferencia a partir del artefacto exportado
+    (vectores .npy + vocabulario), usando únicamente NumPy.
+    
+    Args:
+        vectors_dir (str): Directorio del artefacto de vectores
+        storage (str): Almacenamiento para la búsqueda de similares
+        
+    Returns:
+        SemanticEmbeddings: Instancia lista para consultas (is_trained es False
+        si el artefacto no existe)
+    """
+    return SemanticEmbeddings(vectors_dir=vectors_dir, storage=storage, inference_only=True)
+
+
+def get_similar_terms_for_word(word: str, topn: int = 5,
+                               fields: Optional[Iterable[str]] = None,
+                               vector_encoding: str = 'list') -> List[Dict[str, Any]]:
     """
     Función de conveniencia para obtener términos similares a una palabra.
     
     Args:
         word (str): Palabra de referencia
         topn (int): Número de términos similares a devolver
+        fields (Optional[Iterable[str]]): Campos de cada término (sin vector por defecto)
+        vector_encoding (str): Formato del vector si se pide
         
     Returns:
         List[Dict[str, Any]]: Lista de términos similares
     """
-    embeddings = create_semantic_embeddings()
-    
-    # Si el modelo no está entrenado, entrenarlo
-    if not embeddings.is_trained:
-        logger.info("Modelo no encontrado, entrenando...")
-        embeddings.train_model()
-    
-    return embeddings.get_similar_terms(word, topn)
+    return get_shared_embeddings().get_similar_terms(word, topn, fields, vector_encoding)
 
 
 def analyze_gaming_text_similarities(text: str) -> Dict[str, Any]:
@@ -533,14 +1817,7 @@ def analyze_gaming_text_similarities(text: str) -> Dict[str, Any]:
     Returns:
         Dict[str, Any]: Análisis de similitudes semánticas
     """
-    embeddings = create_semantic_embeddings()
-    
-    # Si el modelo no está entrenado, entrenarlo
-    if not embeddings.is_trained:
-        logger.info("Modelo no encontrado, entrenando...")
-        embeddings.train_model()
-    
-    return embeddings.analyze_text_similarities(text)
+    return get_shared_embeddings().analyze_text_similarities(text)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,280 @@
+'''
+Morfología del Español por Trie de Sufijos Invertidos
+Reglas de lematización y etiquetado POS por sufijos del procesador mejorado
+(scripts/nlp_processor_enhanced.py), compiladas en un trie que se recorre
+desde la última letra de la palabra hacia atrás.
+
+Un solo recorrido encuentra a la vez la regla de lema, la de categoría
+gramatical y la de confianza más largas que se cumplen, en lugar de probar
+los sufijos uno a uno (-mente, -ando, -iendo, -ado, -ido, plurales,
+femeninos y cada diminutivo). Las reglas se escriben en orden de prioridad,
+como la cadena de if que sustituyen; al compilarlas se descartan las que
+nunca llegaban a aplicarse (-oso ya era -so, -ita ya era -a), de modo que la
+regla más larga es siempre la primera que se cumplía.
+'''
+
+import logging
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+# Configuración de logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Palabras analizadas que se conservan en memoria
+ANALYSIS_CACHE_SIZE = 16384
+
+# Reglas de lema en orden de prioridad: (sufijo, terminación que lo sustituye,
+# longitud mínima de la palabra, nombre de la regla). Una terminación None
+# deja la palabra como está.
+LEMMA_RULES = [
+    ('amente', 'o', 0, 'adverbio_mente'),       # rápidamente -> rápido
+    ('mente', '', 0, 'adverbio_mente'),
+    ('ando', 'ar', 0, 'gerundio'),              # hablando -> hablar
+    ('iendo', 'er', 0, 'gerundio'),             # comiendo -> comer
+    ('ado', 'ar', 0, 'participio'),             # hablado -> hablar
+    ('ido', 'er', 0, 'participio'),             # comido -> comer
+    ('es', '', 4, 'plural'),                    # profesores -> profesor
+    ('ss', None, 0, 'sin_cambio'),
+    ('s', '', 3, 'plural'),                     # libros -> libro
+    ('a', 'o', 3, 'femenino_masculino'),        # pequeña -> pequeño
+    # Diminutivos
+    ('ito', '', 0, 'regla_personalizada'),
+    ('ita', '', 0, 'regla_personalizada'),
+    ('itos', '', 0, 'regla_personalizada'),
+    ('itas', '', 0, 'regla_personalizada'),
+    ('illo', '', 0, 'regla_personalizada'),
+    ('illa', '', 0, 'regla_personalizada'),
+    ('illos', '', 0, 'regla_personalizada'),
+    ('illas', '', 0, 'regla_personalizada'),
+]
+
+# Regla que se informa cuando ninguna cambia la palabra
+NO_CHANGE_RULE = 'sin_cambio'
+
+# Reglas de categoría gramatical en orden de prioridad: (sufijos, categoría)
+POS_RULES = [
+    (('mente',), 'ADV'),                                                     # Adverbios
+    (('ando', 'iendo'), 'VERB'),                                             # Gerundios
+    (('ado', 'ido', 'to', 'so', 'cho'), 'VERB'),                             # Participios
+    (('ción', 'sión', 'dad', 'tad', 'eza', 'ura', 'ismo', 'ista'), 'NOUN'),  # Sufijos de sustantivo
+    (('ar', 'er', 'ir'), 'VERB'),                                            # Infinitivos
+    (('oso', 'osa', 'ivo', 'iva', 'able', 'ible'), 'ADJ'),                   # Sufijos de adjetivo
+]
+
+# Categoría por defecto
+DEFAULT_POS = 'NOUN'
+
+# Palabras comunes con categoría fija (se consultan antes que las reglas)
+COMMON_WORDS = {
+    # Determinantes
+    'el': 'DET', 'la': 'DET', 'los': 'DET', 'las': 'DET',
+    'un': 'DET', 'una': 'DET', 'unos': 'DET', 'unas': 'DET',
+    'este': 'DET', 'esta': 'DET', 'estos': 'DET', 'estas': 'DET',
+    'mi': 'DET', 'tu': 'DET', 'su': 'DET', 'nuestro': 'DET',
+
+    # Pronombres
+    'yo': 'PRON', 'tú': 'PRON', 'él': 'PRON', 'ella': 'PRON',
+    'nosotros': 'PRON', 'vosotros': 'PRON', 'ellos': 'PRON', 'ellas': 'PRON',
+    'me': 'PRON', 'te': 'PRON', 'se': 'PRON', 'nos': 'PRON', 'les': 'PRON',
+
+    # Preposiciones
+    'de': 'ADP', 'en': 'ADP', 'con': 'ADP', 'por': 'ADP', 'para': 'ADP',
+    'sin': 'ADP', 'sobre': 'ADP', 'bajo': 'ADP', 'desde': 'ADP', 'hasta': 'ADP',
+
+    # Conjunciones
+    'y': 'CCONJ', 'o': 'CCONJ', 'pero': 'CCONJ', 'aunque': 'SCONJ',
+    'porque': 'SCONJ', 'si': 'SCONJ', 'cuando': 'SCONJ', 'donde': 'SCONJ',
+
+    # Adverbios comunes
+    'muy': 'ADV', 'más': 'ADV', 'menos': 'ADV', 'bien': 'ADV', 'mal': 'ADV',
+    'aquí': 'ADV', 'allí': 'ADV', 'ahora': 'ADV', 'después': 'ADV', 'antes': 'ADV',
+
+    # Verbos auxiliares y copulativos
+    'ser': 'AUX', 'estar': 'AUX', 'haber': 'AUX', 'tener': 'VERB',
+    'es': 'AUX', 'está': 'AUX', 'son': 'AUX', 'están': 'AUX'
+}
+
+# Confianza de la categoría: palabras muy comunes, terminaciones claras y por defecto
+HIGH_CONFIDENCE_WORDS = {'el', 'la', 'de', 'en', 'y', 'es', 'que', 'se', 'no', 'un', 'por', 'con'}
+HIGH_CONFIDENCE = 0.95
+CONFIDENCE_RULES = [
+    ('mente', 0.9),   # Adverbios
+    ('ción', 0.85),   # Sustantivos
+    ('ando', 0.9),    # Gerundios
+    ('iendo', 0.9),   # Gerundios
+]
+DEFAULT_CONFIDENCE = 0.6
+
+
+class MorphAnalysis(NamedTuple):
+    """Lema, categoría gramatical, regla de lema aplicada y confianza de la categoría."""
+    lemma: str
+    pos: str
+    rule: str
+    confidence: float
+
+
+class _Rule(NamedTuple):
+    """Regla compilada: se cumple si la palabra tiene al menos min_length letras."""
+    order: int
+    suffix: str
+    min_length: int
+    value: object
+    name: Optional[str] = None
+
+
+def _reachable(rules: List[_Rule]) -> List[_Rule]:
+    """
+    Descarta las reglas que una regla anterior con un sufijo más corto
+    siempre adelanta, y comprueba que las demás se resuelven bien por el
+    sufijo más largo.
+    """
+    kept = []
+    for rule in rules:
+        shadowed = False
+        for earlier in rules[:rule.order]:
+            if earlier.suffix != rule.suffix and rule.suffix.endswith(earlier.suffix):
+                if earlier.min_length <= max(rule.min_length, len(rule.suffix)):
+                    shadowed = True
+                    break
+                raise ValueError(f"La regla '{rule.suffix}' depende de la longitud de '{earlier.suffix}'")
+        if not shadowed:
+            kept.append(rule)
+    return kept
+
+
+class SpanishMorphology:
+    """
+    Trie de sufijos invertidos con las reglas de lema, categoría y confianza.
+    """
+
+    def __init__(self, lemma_rules=LEMMA_RULES, pos_rules=POS_RULES, common_words=COMMON_WORDS,
+                 confidence_rules=CONFIDENCE_RULES, cache_size: int = ANALYSIS_CACHE_SIZE):
+        """
+        Args:
+            lemma_rules: Reglas de lema en orden de prioridad
+            pos_rules: Reglas de categoría en orden de prioridad
+            common_words (Dict[str, str]): Palabras con categoría fija
+            confidence_rules: Terminaciones con su confianza, en orden de prioridad
+            cache_size (int): Palabras analizadas que se conservan
+        """
+        self.common_words = common_words
+        self.cache_size = cache_size
+        self._cache: Dict[str, MorphAnalysis] = {}
+
+        # Nodo -> hijos por letra; cada nodo guarda la regla de cada tipo que acaba en él
+        self._children: List[Dict[str, int]] = [{}]
+        self._rules: List[List[Optional[_Rule]]] = [[None, None, None]]
+
+        compiled_lemma = [_Rule(i, suffix, min_length, replacement, name)
+                          for i, (suffix, replacement, min_length, name) in enumerate(lemma_rules)]
+        compiled_pos = [_Rule(i, suffix, 0, pos)
+                        for i, (suffix, pos) in enumerate((suffix, pos) for suffixes, pos in pos_rules for suffix in suffixes)]
+        compiled_confidence = [_Rule(i, suffix, 0, confidence)
+                               for i, (suffix, confidence) in enumerate(confidence_rules)]
+
+        for kind, rules in enumerate((compiled_lemma, compiled_pos, compiled_confidence)):
+            kept = _reachable(rules)
+            for rule in kept:
+                self._insert(kind, rule)
+            logger.debug(f"Reglas de tipo {kind}: {len(kept)} de {len(rules)} alcanzables")
+
+    def _insert(self, kind: int, rule: _Rule) -> None:
+        """Añade una regla al nodo de su sufijo (recorrido desde la última letra)."""
+        node = 0
+        for char in reversed(rule.suffix):
+            child = self._children[node].get(char)
+            if child is None:
+                child = len(self._children)
+                self._children[node][char] = child
+                self._children.append({})
+                self._rules.append([None, None, None])
+            node = child
+        if self._rules[node][kind] is None:
+            self._rules[node][kind] = rule
+
+    def _analyze(self, word: str) -> MorphAnalysis:
+        """Análisis sin caché: un recorrido del trie desde la última letra."""
+        size = len(word)
+        children = self._children
+        node_rules = self._rules
+        lemma_rule = pos_rule = confidence_rule = None
+
+        node = 0
+        for i in range(size - 1, -1, -1):
+            node = children[node].get(word[i])
+            if node is None:
+                break
+            lemma, pos, confidence = node_rules[node]
+            if lemma is not None and size >= lemma.min_length:
+                lemma_rule = lemma
+            if pos is not None:
+                pos_rule = pos
+            if confidence is not None:
+                confidence_rule = confidence
+
+        if lemma_rule is None or lemma_rule.value is None:
+            lemma, rule = word, NO_CHANGE_RULE
+        else:
+            lemma, rule = word[:size - len(lemma_rule.suffix)] + lemma_rule.value, lemma_rule.name
+
+        pos = self.common_words.get(word)
+        if pos is None:
+            pos = pos_rule.value if pos_rule is not None else DEFAULT_POS
+
+        if word in HIGH_CONFIDENCE_WORDS:
+            confidence = HIGH_CONFIDENCE
+        else:
+            confidence = confidence_rule.value if confidence_rule is not None else DEFAULT_CONFIDENCE
+
+        return MorphAnalysis(lemma, pos, rule, confidence)
+
+    def analyze(self, word: str) -> MorphAnalysis:
+        """
+        Lema, categoría, regla aplicada y confianza de una palabra.
+
+        Args:
+            word (str): Palabra (las reglas esperan minúsculas)
+
+        Returns:
+            MorphAnalysis: Análisis de la palabra
+        """
+        analysis = self._cache.get(word)
+        if analysis is None:
+            analysis = self._analyze(word)
+            if len(self._cache) >= self.cache_size:
+                self._cache.clear()
+            self._cache[word] = analysis
+        return analysis
+
+    def analyze_tokens(self, tokens: Sequence[str]) -> List[MorphAnalysis]:
+        """
+        Analiza una lista de tokens de una vez (las palabras repetidas se
+        analizan una sola vez).
+
+        Args:
+            tokens (Sequence[str]): Tokens
+
+        Returns:
+            List[MorphAnalysis]: Análisis de cada token, en el mismo orden
+        """
+        cache = self._cache
+        results = []
+        for token in tokens:
+            analysis = cache.get(token)
+            if analysis is None:
+                analysis = self.analyze(token)
+            results.append(analysis)
+        return results
+
+
+_shared_morphology = None
+
+
+def get_spanish_morphology() -> SpanishMorphology:
+    """Devuelve el analizador con las reglas por defecto, compilado la primera vez que se pide."""
+    global _shared_morphology
+
+    if _shared_morphology is None:
+        _shared_morphology = SpanishMorphology()
+    return _shared_morphology
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Análisis por Lotes de Mensajes de Videojuegos
+=============================================
+
+Aplica analyze_gaming_content a un fichero JSONL de mensajes (un objeto por
+línea con el texto en --text-field) y escribe otro JSONL con cada registro
+y su análisis en el campo 'gaming_analysis', en el mismo orden:
+
+- Lectura y escritura en streaming
+- Pool de procesos que cargan los embeddings una sola vez cada uno
+- Reanudación desde el último punto de control con --resume
+- Informe con mensajes/segundo
+
+Uso:
+    python scripts/analyze_gaming_batch.py chats.jsonl --output analisis.jsonl --workers 8
+    python scripts/analyze_gaming_batch.py chats.jsonl --output analisis.jsonl --resume --report informe.json
+"""
+
+import sys
+import json
+import argparse
+import logging
+from pathlib import Path
+
+# Configuración de logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# Agregar el directorio lib al path
+sys.path.append(str(Path(__file__).parent.parent / "lib"))
+
+from gaming_batch import analyze_gaming_file, DEFAULT_CHUNKSIZE, DEFAULT_CHECKPOINT_EVERY
+
+
+def main():
+    """Función principal del script."""
+    parser = argparse.ArgumentParser(description="Analiza un fichero JSONL de mensajes de videojuegos")
+    parser.add_argument('input', help="Fichero .jsonl de entrada")
+    parser.add_argument('--output', required=True, help="Fichero .jsonl de salida")
+    parser.add_argument('--text-field', default='text', help="Campo con el texto en cada línea")
+    parser.add_argument('--workers', type=int, default=None, help="Procesos del pool (por defecto, todos los núcleos)")
+    parser.add_argument('--chunksize', type=int, default=DEFAULT_CHUNKSIZE, help="Mensajes por envío a cada proceso")
+    parser.add_argument('--checkpoint-every', type=int, default=DEFAULT_CHECKPOINT_EVERY,
+                        help="Mensajes entre dos puntos de control")
+    parser.add_argument('--resume', action='store_true', help="Continuar desde el último punto de control")
+    parser.add_argument('--report', help="Fichero JSON donde guardar el informe")
+    args = parser.parse_args()
+
+    if args.checkpoint_every <= 0:
+        parser.error("--checkpoint-every debe ser mayor que 0")
+    if args.chunksize <= 0:
+        parser.error("--chunksize debe ser mayor que 0")
+
+    logging.getLogger('semantic_embeddings').setLevel(logging.ERROR)
+
+    if not Path(args.input).is_file():
+        logger.error(f"Fichero no encontrado: {args.input}")
+        return False
+
+    report = analyze_gaming_file(
+        args.input,
+        args.output,
+        workers=args.workers,
+        chunksize=args.chunksize,
+        text_field=args.text_field,
+        resume=args.resume,
+        checkpoint_every=args.checkpoint_every,
+    )
+
+    output = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.report:
+        Path(args.report).write_text(output, encoding='utf-8')
+    print(output)
+
+    return report.get('success', False)
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
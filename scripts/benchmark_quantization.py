@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Informe de Compresión de Embeddings
+===================================
+
+Compara la búsqueda de términos similares con los vectores en float32 frente
+al almacenamiento comprimido (float16 e int8 con escala por fila):
+
+- Memoria ocupada por la matriz de vectores
+- Concordancia de rangos con los resultados float32 sobre un conjunto fijo de consultas
+- Latencia media de get_most_similar
+
+Uso:
+    python scripts/benchmark_quantization.py [--topn 10] [--output informe.json]
+"""
+
+import sys
+import json
+import time
+import argparse
+import logging
+from pathlib import Path
+from typing import Dict, List, Any
+
+# Configuración de logging
+logging.basicConfig(level=logging.WARNING, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# Agregar el directorio lib al path
+sys.path.append(str(Path(__file__).parent.parent / "lib"))
+
+from semantic_embeddings import SemanticEmbeddings
+
+# Conjunto fijo de consultas para que los informes sean comparables entre ejecuciones
+QUERY_WORDS = [
+    "rpg", "acción", "estrategia", "shooter", "aventura", "terror", "puzzle",
+    "pc", "playstation", "xbox", "nintendo", "switch", "android",
+    "sony", "microsoft", "ubisoft", "capcom", "valve", "bethesda",
+    "minecraft", "fortnite", "overwatch", "halo", "valorant", "roblox",
+    "fps", "gráficos", "latencia", "ping", "lag", "mods", "shaders",
+    "multijugador", "inventario", "misiones", "loot", "pvp", "speedrun",
+]
+
+
+def rank_agreement(reference: List[str], candidate: List[str]) -> Dict[str, float]:
+    """
+    Mide la concordancia entre dos listas ordenadas de resultados.
+
+    Args:
+        reference (List[str]): Resultados de referencia (float32)
+        candidate (List[str]): Resultados a evaluar
+
+    Returns:
+        Dict[str, float]: Solapamiento top-k, acierto del primero y
+        proporción de posiciones idénticas
+    """
+    if not reference:
+        return {'overlap': 1.0, 'top1': 1.0, 'same_position': 1.0}
+
+    overlap = len(set(reference) & set(candidate)) / len(reference)
+    top1 = 1.0 if candidate and candidate[0] == reference[0] else 0.0
+    same_position = sum(1 for a, b in zip(reference, candidate) if a == b) / len(reference)
+    return {'overlap': overlap, 'top1': top1, 'same_position': same_position}
+
+
+def run_queries(embeddings: SemanticEmbeddings, words: List[str], topn: int) -> Dict[str, Any]:
+    """Ejecuta el conjunto de consultas y mide la latencia media."""
+    results = {}
+    start = time.perf_counter()
+    for word in words:
+        results[word] = embeddings.get_most_similar(word, topn=topn)
+    elapsed = time.perf_counter() - start
+    return {
+        'results': results,
+        'avg_latency_ms': round(elapsed / max(len(words), 1) * 1000, 4)
+    }
+
+
+def build_report(topn: int) -> Dict[str, Any]:
+    """Genera el informe comparando cada almacenamiento con float32."""
+    reference = SemanticEmbeddings(storage='float32')
+    if not reference.is_trained:
+        raise RuntimeError("No hay modelo entrenado. Ejecuta scripts/setup_embeddings.py primero")
+
+    words = [word for word in QUERY_WORDS if word in reference.vocabulary]
+    baseline = run_queries(reference, words, topn)
+    float32_bytes = int(reference.wv.vectors.nbytes)
+
+    report = {
+        'vocabulary_size': len(reference.vocabulary),
+        'vector_size': int(reference.wv.vector_size),
+        'queries': len(words),
+        'topn': topn,
+        'storages': {
+            'float32': {
+                'bytes': float32_bytes,
+                'memory_saved_pct': 0.0,
+                'avg_latency_ms': baseline['avg_latency_ms'],
+            }
+        }
+    }
+
+    for storage in ('float16', 'int8'):
+        embeddings = SemanticEmbeddings(storage=storage)
+        run = run_queries(embeddings, words, topn)
+
+        agreements = [
+            rank_agreement(
+                [w for w, _ in baseline['results'][word]],
+                [w for w, _ in run['results'][word]]
+            )
+            for word in words
+        ]
+        count = max(len(agreements), 1)
+
+        report['storages'][storage] = {
+            'bytes': embeddings.quantized.nbytes,
+            'memory_saved_pct': round((1 - embeddings.quantized.nbytes / float32_bytes) * 100, 2),
+            'avg_latency_ms': run['avg_latency_ms'],
+            'overlap_at_k': round(sum(a['overlap'] for a in agreements) / count, 4),
+            'top1_agreement': round(sum(a['top1'] for a in agreements) / count, 4),
+            'same_position': round(sum(a['same_position'] for a in agreements) / count, 4),
+        }
+
+    return report
+
+
+def main():
+    """Función principal del script."""
+    parser = argparse.ArgumentParser(description="Informe de compresión de embeddings")
+    parser.add_argument('--topn', type=int, default=10, help="Resultados por consulta")
+    parser.add_argument('--output', help="Fichero JSON donde guardar el informe")
+    args = parser.parse_args()
+
+    report = build_report(args.topn)
+    output = json.dumps(report, ensure_ascii=False, indent=2)
+
+    if args.output:
+        Path(args.output).write_text(output, encoding='utf-8')
+    print(output)
+
+
+if __name__ == "__main__":
+    main()
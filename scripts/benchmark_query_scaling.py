@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""
+Escalabilidad de las Consultas de Embeddings
+============================================
+
+Mide cómo se comportan las consultas de SemanticEmbeddings al crecer el
+vocabulario y la longitud de los mensajes, sin red ni modelo entrenado:
+
+- Vocabularios sintéticos de 1k, 10k, 100k y 1M palabras (vectores aleatorios
+  con semilla fija, publicados como artefacto .npy + vocab.json y mapeados
+  en memoria igual que en producción)
+- Mensajes de 5, 20 y 50 palabras muestreadas con una distribución de Zipf
+- Distribución de latencias (media, p50, p90, p99, máximo) y memoria asignada
+  por llamada para cada método público y para las funciones del módulo
+- Tiempo de carga, primera consulta y memoria residente del proceso
+
+Uso:
+    python scripts/benchmark_query_scaling.py
+    python scripts/benchmark_query_scaling.py --sizes 1000 100000 --words-per-message 10 --output informe.json
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import logging
+import tempfile
+import tracemalloc
+from pathlib import Path
+from typing import Dict, List, Any, Callable, Optional
+
+import numpy as np
+
+# Configuración de logging
+logging.basicConfig(level=logging.WARNING, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# Agregar el directorio lib al path
+sys.path.append(str(Path(__file__).parent.parent / "lib"))
+
+import semantic_embeddings
+from semantic_embeddings import SemanticEmbeddings, NumpyKeyedVectors
+
+DEFAULT_SIZES = [1000, 10000, 100000, 1000000]
+DEFAULT_WORDS_PER_MESSAGE = [5, 20, 50]
+SEED = 42
+
+
+def _current_rss_bytes() -> Optional[int]:
+    """Memoria residente actual del proceso, si la plataforma lo permite."""
+    try:
+        import psutil
+        return int(psutil.Process().memory_info().rss)
+    except ImportError:
+        pass
+    try:
+        with open('/proc/self/statm', 'r') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def latency_stats(samples: List[float]) -> Dict[str, float]:
+    """Resumen de una lista de latencias en segundos, en milisegundos."""
+    values = np.asarray(samples) * 1000
+    return {
+        'mean_ms': round(float(values.mean()), 4),
+        'p50_ms': round(float(np.percentile(values, 50)), 4),
+        'p90_ms': round(float(np.percentile(values, 90)), 4),
+        'p99_ms': round(float(np.percentile(values, 99)), 4),
+        'max_ms': round(float(values.max()), 4),
+    }
+
+
+def build_synthetic_embeddings(vocabulary_size: int, vector_size: int, work_dir: str,
+                               storage: str) -> SemanticEmbeddings:
+    """
+    Publica un artefacto de vectores sintético y lo carga como en producción.
+
+    Args:
+        vocabulary_size (int): Número de palabras
+        vector_size (int): Dimensión de los vectores
+        work_dir (str): Directorio temporal para el artefacto
+        storage (str): Almacenamiento para la búsqueda de similares
+
+    Returns:
+        SemanticEmbeddings: Instancia de solo inferencia sobre los vectores mapeados
+    """
+    rng = np.random.default_rng(SEED)
+    vectors = rng.standard_normal((vocabulary_size, vector_size), dtype=np.float32)
+    words = [f"w{i:07d}" for i in range(vocabulary_size)]
+
+    model_path = os.path.join(work_dir, "synthetic.model")
+    vectors_dir = os.path.join(work_dir, "synthetic_vectors")
+    writer = SemanticEmbeddings(model_path=model_path, vectors_dir=vectors_dir, inference_only=True)
+    writer._set_keyed_vectors(NumpyKeyedVectors(vectors, words), {'synthetic': True})
+    writer.export_vectors()
+
+    return SemanticEmbeddings(model_path=model_path, vectors_dir=vectors_dir,
+                              storage=storage, inference_only=True)
+
+
+def make_messages(vocabulary_size: int, words_per_message: int, count: int) -> List[str]:
+    """Mensajes con palabras del vocabulario sintético muestreadas con una distribución de Zipf."""
+    rng = np.random.default_rng(SEED + words_per_message)
+    ranks = np.minimum(rng.zipf(1.2, size=(count, words_per_message)), vocabulary_size) - 1
+    return [' '.join(f"w{i:07d}" for i in row) for row in ranks]
+
+
+def measure(call: Callable[[Any], Any], inputs: List[Any], memory_samples: int) -> Dict[str, Any]:
+    """
+    Mide la latencia de una llamada sobre cada entrada y la memoria asignada
+    en unas pocas llamadas adicionales (tracemalloc ralentiza las llamadas,
+    así que no se mezcla con las latencias).
+    """
+    samples = []
+    for value in inputs:
+        start = time.perf_counter()
+        call(value)
+        samples.append(time.perf_counter() - start)
+
+    peaks = []
+    for value in inputs[:memory_samples]:
+        tracemalloc.start()
+        call(value)
+        peaks.append(tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+
+    result = latency_stats(samples)
+    result['calls'] = len(samples)
+    result['peak_alloc_bytes'] = int(max(peaks)) if peaks else None
+    return result
+
+
+def benchmark_vocabulary(vocabulary_size: int, args: argparse.Namespace) -> Dict[str, Any]:
+    """Ejecuta todas las mediciones para un tamaño de vocabulario."""
+    with tempfile.TemporaryDirectory(prefix="w2v_scaling_") as work_dir:
+        rss_before = _current_rss_bytes()
+        start = time.perf_counter()
+        embeddings = build_synthetic_embeddings(vocabulary_size, args.vector_size, work_dir, args.storage)
+        load_seconds = time.perf_counter() - start
+
+        # Las funciones del módulo usan la instancia compartida del proceso
+        semantic_embeddings._shared_embeddings = embeddings
+
+        rng = np.random.default_rng(SEED)
+        words = [f"w{i:07d}" for i in rng.integers(0, vocabulary_size, size=args.queries)]
+        pairs = list(zip(words, reversed(words)))
+
+        start = time.perf_counter()
+        embeddings.get_most_similar(words[0], args.topn)
+        first_query_ms = (time.perf_counter() - start) * 1000
+
+        methods = {
+            'get_word_vector': measure(embeddings.get_word_vector, words, args.memory_samples),
+            'calculate_similarity': measure(lambda pair: embeddings.calculate_similarity(*pair), pairs, args.memory_samples),
+            'get_most_similar': measure(lambda word: embeddings.get_most_similar(word, args.topn), words, args.memory_samples),
+            'get_similar_terms': measure(lambda word: embeddings.get_similar_terms(word, args.topn), words, args.memory_samples),
+            'get_model_info': measure(lambda _: embeddings.get_model_info(), words, args.memory_samples),
+            'get_similar_terms_for_word': measure(
+                lambda word: semantic_embeddings.get_similar_terms_for_word(word, args.topn), words, args.memory_samples),
+        }
+
+        messages = {}
+        for words_per_message in args.words_per_message:
+            texts = make_messages(vocabulary_size, words_per_message, args.queries)
+            messages[str(words_per_message)] = {
+                'analyze_text_similarities': measure(embeddings.analyze_text_similarities, texts, args.memory_samples),
+                'analyze_gaming_text_similarities': measure(
+                    semantic_embeddings.analyze_gaming_text_similarities, texts, args.memory_samples),
+            }
+
+        rss_after = _current_rss_bytes()
+        result = {
+            'vocabulary_size': vocabulary_size,
+            'vectors_bytes': int(embeddings.wv.vectors.nbytes),
+            'load_seconds': round(load_seconds, 3),
+            'first_query_ms': round(first_query_ms, 3),
+            'rss_before_bytes': rss_before,
+            'rss_after_bytes': rss_after,
+            'methods': methods,
+            'messages': messages,
+        }
+
+        semantic_embeddings._shared_embeddings = None
+        del embeddings
+        return result
+
+
+def main():
+    """Función principal del script."""
+    parser = argparse.ArgumentParser(description="Escalabilidad de las consultas de embeddings")
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES, help="Tamaños de vocabulario")
+    parser.add_argument('--words-per-message', type=int, nargs='+', default=DEFAULT_WORDS_PER_MESSAGE,
+                        help="Palabras por mensaje para el análisis de texto")
+    parser.add_argument('--vector-size', type=int, default=100, help="Dimensión de los vectores")
+    parser.add_argument('--storage', default='float32', choices=['float32', 'float16', 'int8'],
+                        help="Almacenamiento para la búsqueda de similares")
+    parser.add_argument('--queries', type=int, default=50, help="Consultas por método")
+    parser.add_argument('--memory-samples', type=int, default=3, help="Llamadas medidas con tracemalloc")
+    parser.add_argument('--topn', type=int, default=5, help="Resultados por consulta")
+    parser.add_argument('--output', help="Fichero JSON donde guardar el informe")
+    args = parser.parse_args()
+
+    logging.getLogger('semantic_embeddings').setLevel(logging.ERROR)
+
+    report = {
+        'vector_size': args.vector_size,
+        'storage': args.storage,
+        'queries': args.queries,
+        'topn': args.topn,
+        'results': [],
+    }
+    for vocabulary_size in args.sizes:
+        print(f"Vocabulario de {vocabulary_size} palabras...", file=sys.stderr)
+        report['results'].append(benchmark_vocabulary(vocabulary_size, args))
+
+    output = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        Path(args.output).write_text(output, encoding='utf-8')
+    print(output)
+    return True
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
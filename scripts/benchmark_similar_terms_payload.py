@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Comparativa de Carga Útil de get_similar_terms
+==============================================
+
+Mide el tamaño del JSON y el tiempo de serialización de los términos
+similares para cada forma de respuesta:
+
+- inline_list: el formato anterior, con el vector de 100 floats en cada término
+- default: solo rank, word, similarity y similarity_percentage
+- base64-float32 / base64-float16: con el vector codificado en base64
+
+Uso:
+    python scripts/benchmark_similar_terms_payload.py [--topn 3] [--repeat 200] [--output informe.json]
+"""
+
+import sys
+import json
+import time
+import argparse
+import logging
+from pathlib import Path
+from typing import Dict, Any, List
+
+# Configuración de logging
+logging.basicConfig(level=logging.WARNING, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# Agregar el directorio lib al path
+sys.path.append(str(Path(__file__).parent.parent / "lib"))
+
+from semantic_embeddings import SemanticEmbeddings, SIMILAR_TERM_FIELDS, DEFAULT_SIMILAR_TERM_FIELDS
+
+# Palabras clave típicas de un mensaje analizado por analyze_gaming_content
+KEYWORDS = ["rpg", "acción", "nintendo", "switch", "minecraft", "multijugador", "pc", "shooter"]
+
+VARIANTS = {
+    'inline_list': {'fields': SIMILAR_TERM_FIELDS, 'vector_encoding': 'list'},
+    'default': {'fields': DEFAULT_SIMILAR_TERM_FIELDS, 'vector_encoding': 'list'},
+    'base64-float32': {'fields': SIMILAR_TERM_FIELDS, 'vector_encoding': 'base64-float32'},
+    'base64-float16': {'fields': SIMILAR_TERM_FIELDS, 'vector_encoding': 'base64-float16'},
+}
+
+
+def measure(embeddings: SemanticEmbeddings, words: List[str], topn: int,
+            repeat: int, options: Dict[str, Any]) -> Dict[str, Any]:
+    """Construye la lista similar_terms de un mensaje y mide su serialización."""
+    build_start = time.perf_counter()
+    for _ in range(repeat):
+        terms = []
+        for word in words:
+            terms.extend(embeddings.get_similar_terms(word, topn=topn, **options))
+    build_ms = (time.perf_counter() - build_start) / repeat * 1000
+
+    serialize_start = time.perf_counter()
+    for _ in range(repeat):
+        payload = json.dumps({'similar_terms': terms}, ensure_ascii=False)
+    serialize_ms = (time.perf_counter() - serialize_start) / repeat * 1000
+
+    return {
+        'payload_bytes': len(payload.encode('utf-8')),
+        'build_ms': round(build_ms, 4),
+        'serialize_ms': round(serialize_ms, 4),
+    }
+
+
+def main():
+    """Función principal del script."""
+    parser = argparse.ArgumentParser(description="Comparativa de carga útil de get_similar_terms")
+    parser.add_argument('--topn', type=int, default=3, help="Términos similares por palabra clave")
+    parser.add_argument('--repeat', type=int, default=200, help="Repeticiones por variante")
+    parser.add_argument('--output', help="Fichero JSON donde guardar el informe")
+    args = parser.parse_args()
+
+    embeddings = SemanticEmbeddings()
+    if not embeddings.is_trained:
+        logger.error("No hay modelo entrenado. Ejecuta scripts/setup_embeddings.py primero")
+        return False
+
+    words = [word for word in KEYWORDS if word in embeddings.vocabulary]
+    results = {name: measure(embeddings, words, args.topn, args.repeat, options)
+               for name, options in VARIANTS.items()}
+
+    baseline = results['inline_list']['payload_bytes']
+    for result in results.values():
+        result['size_vs_inline_list'] = round(result['payload_bytes'] / baseline, 3)
+
+    report = {'keywords': len(words), 'topn': args.topn, 'variants': results}
+    output = json.dumps(report, ensure_ascii=False, indent=2)
+
+    if args.output:
+        Path(args.output).write_text(output, encoding='utf-8')
+    print(output)
+    return True
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""
+Benchmark del Procesamiento spaCy por Lotes
+===========================================
+
+Compara, sobre un corpus fijo, el bucle de un texto cada vez
+(process_text_with_spacy) con el procesamiento por lotes con nlp.pipe
+(process_texts_with_spacy) para varias combinaciones de batch_size y
+n_process, y registra para cada una:
+
+- Tiempo total y textos/segundo
+- Aceleración frente al bucle de un texto cada vez
+- Si los resultados coinciden exactamente con los del bucle
+
+Además mide, para cada perfil de análisis (SPACY_PROFILES), el tiempo de
+carga del modelo con solo los componentes del perfil y el tiempo por
+documento, texto a texto y por lotes.
+
+El corpus por defecto se genera de forma determinista a partir de la base de
+conocimiento (descripciones de juegos, respuestas y mensajes de plantilla);
+también puede leerse de un fichero de texto (una línea por mensaje) o JSONL.
+
+Uso:
+    python scripts/benchmark_spacy_batch.py
+    python scripts/benchmark_spacy_batch.py --texts 5000 --batch-size 64 256 1000 --n-process 1 2 4
+    python scripts/benchmark_spacy_batch.py --corpus mensajes.jsonl --output informe.json
+    python scripts/benchmark_spacy_batch.py --profiles tokens lemmas+pos --n-process 1
+"""
+
+import sys
+import json
+import time
+import random
+import argparse
+import logging
+from pathlib import Path
+from typing import Dict, List, Any, Optional
+
+# Configuración de logging
+logging.basicConfig(level=logging.WARNING, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# Agregar el directorio lib al path
+sys.path.append(str(Path(__file__).parent.parent / "lib"))
+
+from nlp_processor_with_embeddings import (
+    SPACY_AVAILABLE, SPACY_PROFILES, DEFAULT_BATCH_SIZE,
+    load_spacy_model, process_text_with_spacy, process_texts_with_spacy
+)
+
+DEFAULT_TEXTS = 2000
+DEFAULT_BATCH_SIZES = [32, 256, 1000]
+DEFAULT_N_PROCESS = [1, 2]
+SEED = 42
+
+SEED_PATH = Path(__file__).parent.parent / "data" / "gaming_knowledge.json"
+
+TEMPLATES = [
+    "¿Qué opinas de {game}?",
+    "Estoy jugando a {game} en {platform} y me encanta.",
+    "Busco juegos de {genre} para {platform}, ¿alguna recomendación?",
+    "¿Quién desarrolló {game} y en qué año salió?",
+    "Ayer estuve toda la tarde con {game}, los gráficos son increíbles.",
+]
+
+
+def build_corpus(size: int, seed: int = SEED) -> List[str]:
+    """
+    Corpus fijo de mensajes a partir de la base de conocimiento.
+
+    Args:
+        size (int): Número de mensajes
+        seed (int): Semilla del generador
+
+    Returns:
+        List[str]: Mensajes (siempre los mismos para el mismo tamaño y semilla)
+    """
+    knowledge = json.loads(SEED_PATH.read_text(encoding='utf-8'))
+    games = knowledge['games']
+    texts = [info['descripción'] for info in games.values()]
+    for responses in knowledge['responses'].values():
+        texts.extend(responses)
+
+    rng = random.Random(seed)
+    titles = sorted(games)
+    corpus = []
+    while len(corpus) < size:
+        if rng.random() < 0.3:
+            corpus.append(rng.choice(texts))
+            continue
+        title = rng.choice(titles)
+        info = games[title]
+        corpus.append(rng.choice(TEMPLATES).format(
+            game=title.title(),
+            platform=rng.choice(info['plataformas']),
+            genre=info['género'].split(',')[0].strip().lower(),
+        ))
+    return corpus
+
+
+def read_corpus(path: str, text_field: str, limit: Optional[int]) -> List[str]:
+    """Mensajes de un fichero de texto (una línea por mensaje) o JSONL."""
+    texts = []
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            if path.endswith('.jsonl'):
+                line = json.loads(line).get(text_field) or ''
+            texts.append(line)
+            if limit and len(texts) >= limit:
+                break
+    return texts
+
+
+def measure(run) -> Dict[str, Any]:
+    """Ejecuta una variante y devuelve sus resultados y el tiempo empleado."""
+    start = time.perf_counter()
+    results = list(run())
+    return {'results': results, 'seconds': time.perf_counter() - start}
+
+
+def benchmark_profile(profile: str, texts: List[str], batch_size: int) -> Dict[str, Any]:
+    """
+    Carga el modelo con los componentes de un perfil y mide el tiempo por documento.
+
+    Args:
+        profile (str): Perfil de análisis
+        texts (List[str]): Corpus
+        batch_size (int): Textos por lote en nlp.pipe
+
+    Returns:
+        Dict[str, Any]: Componentes cargados, tiempo de carga y milisegundos
+        por documento texto a texto y por lotes
+    """
+    start = time.perf_counter()
+    nlp = load_spacy_model(profile)
+    load_seconds = time.perf_counter() - start
+
+    list(process_texts_with_spacy(texts[:50], nlp, profile=profile))
+    loop = measure(lambda: (process_text_with_spacy(text, nlp, profile) for text in texts))
+    pipe = measure(lambda: process_texts_with_spacy(texts, nlp, batch_size=batch_size, profile=profile))
+    return {
+        'profile': profile,
+        'components': list(nlp.pipe_names),
+        'load_seconds': round(load_seconds, 3),
+        'loop_ms_per_doc': round(loop['seconds'] * 1000 / len(texts), 4),
+        'pipe_ms_per_doc': round(pipe['seconds'] * 1000 / len(texts), 4),
+        'identical': loop['results'] == pipe['results'],
+    }
+
+
+def main():
+    """Función principal del script."""
+    parser = argparse.ArgumentParser(description="Benchmark de spaCy por lotes (nlp.pipe) frente al bucle por texto")
+    parser.add_argument('--texts', type=int, default=DEFAULT_TEXTS, help="Mensajes del corpus")
+    parser.add_argument('--corpus', help="Fichero de texto o JSONL con los mensajes (por defecto, corpus generado)")
+    parser.add_argument('--text-field', default='text', help="Campo con el texto en cada línea JSONL")
+    parser.add_argument('--batch-size', type=int, nargs='+', default=DEFAULT_BATCH_SIZES, help="Valores de batch_size")
+    parser.add_argument('--n-process', type=int, nargs='+', default=DEFAULT_N_PROCESS, help="Valores de n_process")
+    parser.add_argument('--profiles', nargs='*', default=list(SPACY_PROFILES), choices=list(SPACY_PROFILES),
+                        help="Perfiles de análisis a medir (ninguno para omitir la comparativa)")
+    parser.add_argument('--output', help="Fichero JSON donde guardar el informe")
+    args = parser.parse_args()
+
+    if not SPACY_AVAILABLE:
+        logger.error("spaCy no está disponible")
+        return False
+    nlp = load_spacy_model()
+    if nlp is None:
+        logger.error("No se pudo cargar ningún modelo de spaCy")
+        return False
+
+    texts = read_corpus(args.corpus, args.text_field, args.texts) if args.corpus else build_corpus(args.texts)
+
+    # Calentamiento: la primera llamada inicializa tablas y cachés del modelo
+    list(process_texts_with_spacy(texts[:50], nlp))
+
+    print(f"Bucle por texto ({len(texts)} mensajes)...", file=sys.stderr)
+    baseline = measure(lambda: (process_text_with_spacy(text, nlp) for text in texts))
+
+    variants = [{
+        'method': 'loop',
+        'seconds': round(baseline['seconds'], 3),
+        'texts_per_sec': round(len(texts) / baseline['seconds'], 1),
+        'speedup': 1.0,
+        'identical': True,
+    }]
+    for n_process in args.n_process:
+        for batch_size in args.batch_size:
+            print(f"nlp.pipe batch_size={batch_size} n_process={n_process}...", file=sys.stderr)
+            result = measure(lambda: process_texts_with_spacy(texts, nlp, batch_size=batch_size, n_process=n_process))
+            variants.append({
+                'method': 'pipe',
+                'batch_size': batch_size,
+                'n_process': n_process,
+                'seconds': round(result['seconds'], 3),
+                'texts_per_sec': round(len(texts) / result['seconds'], 1),
+                'speedup': round(baseline['seconds'] / result['seconds'], 2),
+                'identical': result['results'] == baseline['results'],
+            })
+
+    profiles = []
+    for profile in args.profiles:
+        print(f"Perfil {profile}...", file=sys.stderr)
+        profiles.append(benchmark_profile(profile, texts, DEFAULT_BATCH_SIZE))
+
+    fastest = max(variants, key=lambda variant: variant['texts_per_sec'])
+    report = {
+        'model': nlp.meta.get('name'),
+        'texts': len(texts),
+        'tokens': sum(len(result['tokens']) for result in baseline['results']),
+        'variants': variants,
+        'fastest': fastest,
+        'profiles': profiles,
+    }
+
+    output = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        Path(args.output).write_text(output, encoding='utf-8')
+    print(output)
+    return all(result['identical'] for result in variants + profiles)
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
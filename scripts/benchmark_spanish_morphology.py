@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""
+Regresión y Benchmark de la Morfología del Español
+==================================================
+
+Comprueba que el trie de sufijos de lib/spanish_morphology.py da los mismos
+lemas, categorías, reglas y confianzas que las reglas originales del
+procesador mejorado (cadenas de endswith, reproducidas aquí como
+referencia) y compara su velocidad en tokens/segundo.
+
+El corpus de regresión reúne:
+
+- Las palabras del léxico (data/nlp_lexicon.json) y de la base de
+  conocimiento (data/gaming_knowledge.json)
+- Combinaciones de raíces con todos los sufijos de las reglas
+- Cadenas aleatorias con semilla fija sobre un alfabeto rico en sufijos
+
+Uso:
+    python scripts/benchmark_spanish_morphology.py
+    python scripts/benchmark_spanish_morphology.py --random-words 100000 --repeat 5 --output informe.json
+"""
+
+import sys
+import json
+import time
+import random
+import argparse
+import logging
+from pathlib import Path
+from typing import Dict, List, Any
+
+# Configuración de logging
+logging.basicConfig(level=logging.WARNING, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# Agregar el directorio lib al path
+sys.path.append(str(Path(__file__).parent.parent / "lib"))
+
+from keyword_matcher import split_words
+from spanish_morphology import (
+    SpanishMorphology, MorphAnalysis, LEMMA_RULES, POS_RULES, COMMON_WORDS, CONFIDENCE_RULES
+)
+
+DATA_DIR = Path(__file__).parent.parent / "data"
+DEFAULT_RANDOM_WORDS = 20000
+SEED = 42
+
+STEMS = ['', 'a', 's', 'x', 'habl', 'com', 'rápid', 'gat', 'libr', 'casa', 'nuev', 'jug', 'ciud', 'cancion', 'pasi']
+
+
+# Reglas originales de EnhancedNLPProcessor, tal como estaban antes del trie
+
+DIMINUTIVES = ['ito', 'ita', 'itos', 'itas', 'illo', 'illa', 'illos', 'illas']
+
+
+def reference_lemma(word: str) -> str:
+    """_apply_spanish_morphology_rules original."""
+    if word.endswith('mente'):
+        base = word[:-5]
+        if base.endswith('a'):
+            return base[:-1] + 'o'
+        return base
+    if word.endswith('ando'):
+        return word[:-4] + 'ar'
+    if word.endswith('iendo'):
+        return word[:-5] + 'er'
+    if word.endswith('ado'):
+        return word[:-3] + 'ar'
+    if word.endswith('ido'):
+        return word[:-3] + 'er'
+    if word.endswith('es') and len(word) > 3:
+        return word[:-2]
+    if word.endswith('s') and len(word) > 2 and not word.endswith('ss'):
+        return word[:-1]
+    if word.endswith('a') and len(word) > 2:
+        masculine = word[:-1] + 'o'
+        if masculine != word:
+            return masculine
+    for dim in DIMINUTIVES:
+        if word.endswith(dim):
+            return word[:-len(dim)]
+    return word
+
+
+def reference_rule(original: str, lemma: str) -> str:
+    """_get_applied_rule original."""
+    if original == lemma:
+        return "sin_cambio"
+    if original.endswith('mente'):
+        return "adverbio_mente"
+    if original.endswith('ando') or original.endswith('iendo'):
+        return "gerundio"
+    if original.endswith('ado') or original.endswith('ido'):
+        return "participio"
+    if original.endswith('s') or original.endswith('es'):
+        return "plural"
+    if original.endswith('a') and lemma.endswith('o'):
+        return "femenino_masculino"
+    return "regla_personalizada"
+
+
+def reference_pos(word: str) -> str:
+    """_spanish_pos_rules original."""
+    if word in COMMON_WORDS:
+        return COMMON_WORDS[word]
+    if word.endswith('mente'):
+        return 'ADV'
+    if word.endswith(('ando', 'iendo')):
+        return 'VERB'
+    if word.endswith(('ado', 'ido', 'to', 'so', 'cho')):
+        return 'VERB'
+    if word.endswith(('ción', 'sión', 'dad', 'tad', 'eza', 'ura', 'ismo', 'ista')):
+        return 'NOUN'
+    if word.endswith(('ar', 'er', 'ir')):
+        return 'VERB'
+    if word.endswith(('oso', 'osa', 'ivo', 'iva', 'able', 'ible')):
+        return 'ADJ'
+    return 'NOUN'
+
+
+def reference_confidence(word: str) -> float:
+    """_get_pos_confidence original."""
+    if word in {'el', 'la', 'de', 'en', 'y', 'es', 'que', 'se', 'no', 'un', 'por', 'con'}:
+        return 0.95
+    for ending, confidence in {'mente': 0.9, 'ción': 0.85, 'ando': 0.9, 'iendo': 0.9}.items():
+        if word.endswith(ending):
+            return confidence
+    return 0.6
+
+
+def reference_analyze(word: str) -> MorphAnalysis:
+    """Análisis completo con las reglas originales."""
+    lemma = reference_lemma(word)
+    return MorphAnalysis(lemma, reference_pos(word), reference_rule(word, lemma), reference_confidence(word))
+
+
+def build_corpus(random_words: int, seed: int = SEED) -> List[str]:
+    """
+    Corpus de regresión (ver la cabecera del script).
+
+    Args:
+        random_words (int): Cadenas aleatorias que se añaden
+        seed (int): Semilla del generador
+
+    Returns:
+        List[str]: Palabras distintas, ordenadas
+    """
+    words = set(COMMON_WORDS)
+
+    lexicon = json.loads((DATA_DIR / "nlp_lexicon.json").read_text(encoding='utf-8'))
+    words.update(lexicon['lemmas'])
+    words.update(lexicon['lemmas'].values())
+    words.update(lexicon['pos'])
+
+    knowledge = json.loads((DATA_DIR / "gaming_knowledge.json").read_text(encoding='utf-8'))
+    words.update(split_words(json.dumps(knowledge, ensure_ascii=False)))
+
+    suffixes = {suffix for suffix, _, _, _ in LEMMA_RULES}
+    suffixes.update(suffix for group, _ in POS_RULES for suffix in group)
+    suffixes.update(suffix for suffix, _ in CONFIDENCE_RULES)
+    suffixes.update(DIMINUTIVES)
+    suffixes.update(['', 'o', 'e', 'ss', 'sses', 'as', 'os'])
+    for stem in STEMS:
+        for suffix in suffixes:
+            words.add(stem + suffix)
+            words.add(stem + suffix + 's')
+
+    alphabet = 'aeiousndmrtclóbxyí'
+    rng = random.Random(seed)
+    for _ in range(random_words):
+        words.add(''.join(rng.choice(alphabet) for _ in range(rng.randint(1, 10))))
+    return sorted(words)
+
+
+def throughput(analyze, tokens: List[str], repeat: int) -> Dict[str, Any]:
+    """Mejor tiempo de varias pasadas sobre los tokens."""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        analyze(tokens)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return {'seconds': round(best, 4), 'tokens_per_sec': round(len(tokens) / best, 1)}
+
+
+def main():
+    """Función principal del script."""
+    parser = argparse.ArgumentParser(description="Regresión y benchmark de la morfología del español por trie de sufijos")
+    parser.add_argument('--random-words', type=int, default=DEFAULT_RANDOM_WORDS, help="Cadenas aleatorias del corpus")
+    parser.add_argument('--tokens', type=int, default=200000, help="Tokens de la medición de velocidad")
+    parser.add_argument('--repeat', type=int, default=3, help="Pasadas por medición (se toma la mejor)")
+    parser.add_argument('--output', help="Fichero JSON donde guardar el informe")
+    args = parser.parse_args()
+
+    corpus = build_corpus(args.random_words)
+
+    # Regresión: sin caché, para comparar el recorrido del trie
+    morphology = SpanishMorphology()
+    mismatches = []
+    for word in corpus:
+        expected = reference_analyze(word)
+        actual = morphology._analyze(word)
+        if actual != expected:
+            mismatches.append({'word': word, 'expected': expected._asdict(), 'actual': actual._asdict()})
+
+    # Velocidad: tokens con repeticiones (distribución de Zipf sobre el corpus)
+    rng = random.Random(SEED)
+    weights = [1 / rank for rank in range(1, len(corpus) + 1)]
+    shuffled = corpus[:]
+    rng.shuffle(shuffled)
+    tokens = rng.choices(shuffled, weights=weights, k=args.tokens)
+
+    results = {
+        'reference_rules': throughput(lambda words: [reference_analyze(word) for word in words], tokens, args.repeat),
+        'trie_uncached': throughput(lambda words: [morphology._analyze(word) for word in words], tokens, args.repeat),
+        'trie_bulk': throughput(SpanishMorphology().analyze_tokens, tokens, args.repeat),
+    }
+    baseline = results['reference_rules']['seconds']
+    for result in results.values():
+        result['speedup'] = round(baseline / result['seconds'], 2)
+
+    report = {
+        'corpus_words': len(corpus),
+        'mismatches': len(mismatches),
+        'mismatch_examples': mismatches[:20],
+        'tokens': len(tokens),
+        'distinct_tokens': len(set(tokens)),
+        'results': results,
+    }
+
+    output = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        Path(args.output).write_text(output, encoding='utf-8')
+    print(output)
+    return not mismatches
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
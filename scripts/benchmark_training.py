@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+Benchmark de Entrenamiento de Embeddings
+========================================
+
+Entrena SemanticEmbeddings con una rejilla de configuraciones (vector_size,
+workers, epochs, skip-gram/CBOW y negative) sobre un corpus configurable y
+registra para cada una:
+
+- Tiempo total y palabras/segundo
+- Pico de memoria residente (RSS)
+- Tamaño del modelo completo y de los vectores exportados
+- Una puntuación de cordura de similitudes (pares relacionados frente a no relacionados)
+
+Cada configuración se entrena en un proceso nuevo, para que el pico de memoria
+sea el de esa configuración, y en un directorio temporal, para no tocar el
+modelo en uso. El informe JSON indica la configuración más rápida que supera
+la puntuación mínima.
+
+Uso:
+    python scripts/benchmark_training.py --vector-size 50 100 --workers 1 4 --epochs 20 100
+    python scripts/benchmark_training.py --corpus chats.jsonl --sg 0 1 --output informe.json
+"""
+
+import os
+import sys
+import json
+import time
+import glob
+import platform
+import argparse
+import itertools
+import logging
+import tempfile
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Tuple
+
+# Configuración de logging
+logging.basicConfig(level=logging.WARNING, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# Agregar el directorio lib al path
+sys.path.append(str(Path(__file__).parent.parent / "lib"))
+
+from semantic_embeddings import SemanticEmbeddings, DEFAULT_TRAINING_PARAMS
+
+# Pares de palabras para la puntuación de cordura: los relacionados deberían
+# ser más similares que los no relacionados
+RELATED_PAIRS = [
+    ("playstation", "xbox"), ("pc", "consola"), ("rpg", "aventura"), ("shooter", "fps"),
+    ("sony", "microsoft"), ("lag", "ping"), ("gráficos", "resolución"), ("minecraft", "fortnite"),
+]
+UNRELATED_PAIRS = [
+    ("playstation", "misiones"), ("rpg", "latencia"), ("sony", "terror"), ("lag", "historia"),
+    ("gráficos", "capcom"), ("minecraft", "resolución"), ("shooter", "android"), ("pc", "inventario"),
+]
+
+# Parámetros que se pueden variar desde la línea de comandos
+GRID_PARAMS = ('vector_size', 'workers', 'epochs', 'sg', 'negative')
+
+
+def _peak_rss_bytes() -> Optional[int]:
+    """Pico de memoria residente del proceso actual, si la plataforma lo permite."""
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Linux lo devuelve en KiB y macOS en bytes
+        return int(peak) if sys.platform == 'darwin' else int(peak) * 1024
+    except ImportError:
+        pass
+    try:
+        import psutil
+        info = psutil.Process().memory_info()
+        return int(getattr(info, 'peak_wset', info.rss))
+    except ImportError:
+        return None
+
+
+def _files_size(pattern: str) -> int:
+    """Suma del tamaño de los ficheros que coinciden con un patrón."""
+    return sum(os.path.getsize(path) for path in glob.glob(pattern) if os.path.isfile(path))
+
+
+def sanity_score(embeddings: SemanticEmbeddings) -> Dict[str, Any]:
+    """
+    Compara la similitud media de los pares relacionados con la de los no relacionados.
+
+    Returns:
+        Dict[str, Any]: Similitudes medias, diferencia (score) y pares evaluados
+    """
+    def mean_similarity(pairs: List[Tuple[str, str]]) -> Tuple[Optional[float], int]:
+        values = [embeddings.calculate_similarity(a, b) for a, b in pairs
+                  if a in embeddings.vocabulary and b in embeddings.vocabulary]
+        return (sum(values) / len(values), len(values)) if values else (None, 0)
+
+    related, related_count = mean_similarity(RELATED_PAIRS)
+    unrelated, unrelated_count = mean_similarity(UNRELATED_PAIRS)
+    score = related - unrelated if related is not None and unrelated is not None else None
+    return {
+        'related_mean': round(related, 4) if related is not None else None,
+        'unrelated_mean': round(unrelated, 4) if unrelated is not None else None,
+        'score': round(score, 4) if score is not None else None,
+        'pairs_evaluated': related_count + unrelated_count,
+    }
+
+
+def run_trial(params: Dict[str, Any], corpus: Optional[List[str]], text_field: str,
+              cache_dir: str) -> Dict[str, Any]:
+    """
+    Entrena una configuración en un directorio temporal y mide sus resultados.
+    Se ejecuta en un proceso propio.
+
+    Args:
+        params (Dict[str, Any]): Parámetros de Word2Vec de esta configuración
+        corpus (Optional[List[str]]): Ficheros de corpus, o None para el corpus por defecto
+        text_field (str): Campo con el texto en los ficheros .jsonl
+        cache_dir (str): Directorio de los fragmentos preprocesados (compartido)
+
+    Returns:
+        Dict[str, Any]: Resultado de la configuración
+    """
+    logging.getLogger('semantic_embeddings').setLevel(logging.WARNING)
+    logging.getLogger('gensim').setLevel(logging.WARNING)
+
+    with tempfile.TemporaryDirectory(prefix="w2v_bench_") as tmp_dir:
+        model_path = os.path.join(tmp_dir, "model.model")
+        embeddings = SemanticEmbeddings(model_path=model_path)
+
+        start = time.perf_counter()
+        if corpus:
+            report = embeddings.train_model_from_files(corpus, cache_dir=cache_dir,
+                                                       text_field=text_field, **params)
+            success = report.get('success', False)
+        else:
+            report = {}
+            success = embeddings.train_model(**params)
+        wall_seconds = time.perf_counter() - start
+
+        result = {'params': params, 'success': success}
+        if not success:
+            result['error'] = report.get('error', 'El entrenamiento falló')
+            return result
+
+        training_seconds = report.get('training_seconds', wall_seconds)
+        total_words = embeddings.model.corpus_total_words * embeddings.model.epochs
+        result.update({
+            'wall_seconds': round(wall_seconds, 3),
+            'training_seconds': round(training_seconds, 3),
+            'words_per_sec': round(total_words / training_seconds, 1) if training_seconds > 0 else None,
+            'corpus_words': int(embeddings.model.corpus_total_words),
+            'vocabulary_size': len(embeddings.vocabulary),
+            'peak_rss_bytes': _peak_rss_bytes(),
+            'model_bytes': _files_size(os.path.join(embeddings.models_dir, "*", "*")),
+            'vectors_bytes': _files_size(os.path.join(embeddings.vectors_dir, "*")),
+            'sanity': sanity_score(embeddings),
+        })
+        return result
+
+
+def build_grid(args: argparse.Namespace) -> List[Dict[str, Any]]:
+    """Producto cartesiano de los valores indicados para cada parámetro."""
+    values = [getattr(args, name) or [DEFAULT_TRAINING_PARAMS[name]] for name in GRID_PARAMS]
+    return [dict(zip(GRID_PARAMS, combination)) for combination in itertools.product(*values)]
+
+
+def pick_fastest(trials: List[Dict[str, Any]], min_sanity: float) -> Optional[Dict[str, Any]]:
+    """Configuración con más palabras/segundo entre las que superan la puntuación mínima."""
+    acceptable = [
+        trial for trial in trials
+        if trial.get('success') and trial['sanity']['score'] is not None
+        and trial['sanity']['score'] >= min_sanity and trial['words_per_sec']
+    ]
+    return max(acceptable, key=lambda trial: trial['words_per_sec']) if acceptable else None
+
+
+def main():
+    """Función principal del script."""
+    parser = argparse.ArgumentParser(description="Benchmark de entrenamiento de embeddings")
+    parser.add_argument('--corpus', nargs='+', help="Ficheros .txt o .jsonl (por defecto, el corpus integrado)")
+    parser.add_argument('--text-field', default='text', help="Campo con el texto en los ficheros .jsonl")
+    parser.add_argument('--cache-dir', default="data/corpus_shards", help="Directorio de fragmentos preprocesados")
+    parser.add_argument('--vector-size', type=int, nargs='+', help="Dimensiones de los vectores")
+    parser.add_argument('--workers', type=int, nargs='+', help="Hilos de entrenamiento")
+    parser.add_argument('--epochs', type=int, nargs='+', help="Épocas de entrenamiento")
+    parser.add_argument('--sg', type=int, nargs='+', choices=[0, 1], help="Skip-gram (1) o CBOW (0)")
+    parser.add_argument('--negative', type=int, nargs='+', help="Muestras negativas")
+    parser.add_argument('--min-sanity', type=float, default=0.1, help="Puntuación de cordura mínima aceptable")
+    parser.add_argument('--output', help="Fichero JSON donde guardar el informe")
+    args = parser.parse_args()
+
+    if args.corpus:
+        missing = [path for path in args.corpus if not Path(path).is_file()]
+        if missing:
+            logger.error(f"Ficheros no encontrados: {missing}")
+            return False
+
+    grid = build_grid(args)
+    context = multiprocessing.get_context('spawn')
+    trials = []
+    for number, params in enumerate(grid, 1):
+        print(f"[{number}/{len(grid)}] {params}", file=sys.stderr)
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+            trials.append(executor.submit(run_trial, params, args.corpus, args.text_field, args.cache_dir).result())
+
+    fastest = pick_fastest(trials, args.min_sanity)
+    report = {
+        'hardware': {
+            'cpu_count': os.cpu_count(),
+            'platform': platform.platform(),
+            'python': platform.python_version(),
+        },
+        'corpus': args.corpus or 'integrado',
+        'min_sanity': args.min_sanity,
+        'trials': trials,
+        'fastest_acceptable': fastest['params'] if fastest else None,
+    }
+
+    output = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        Path(args.output).write_text(output, encoding='utf-8')
+    print(output)
+
+    return all(trial.get('success') for trial in trials)
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -2,20 +2,76 @@
 # -*- coding: utf-8 -*-
 """
 Procesador GPT-2 en español para el chatbot
+
+Antes de cargar GPT-2 se consulta la base de conocimiento de videojuegos:
+si el mensaje nombra un juego o solo pide juegos por atributos ("juegos de
+PC de mundo abierto"), se devuelve su respuesta estructurada y GPT-2 (y
+torch) no llegan a cargarse; el resto de mensajes los responde GPT-2. El campo "answered_by" de la salida indica qué ruta
+ha respondido: "knowledge_base", "gpt2" o "fallback".
+
+Cada mensaje se añade además a data/chat_sentences.txt, del que
+scripts/update_embeddings.py toma las oraciones nuevas para actualizar el
+vocabulario de los embeddings. La escritura va en otro hilo y sus errores
+solo se registran: nunca afectan a la respuesta.
 """
 
 import sys
 import json
-import torch
-from transformers import AutoTokenizer, AutoModelForCausalLM
 import io
+import threading
+from pathlib import Path
+
+# Agregar el directorio lib al path
+sys.path.append(str(Path(__file__).parent.parent / "lib"))
+
+try:
+    from gaming_knowledge import get_knowledge_answer
+    KNOWLEDGE_AVAILABLE = True
+except ImportError:
+    KNOWLEDGE_AVAILABLE = False
+
+try:
+    from semantic_embeddings import collect_chat_message
+    CHAT_SPOOL_AVAILABLE = True
+except ImportError:
+    CHAT_SPOOL_AVAILABLE = False
+
+# Mensajes que consume la actualización incremental de embeddings (scripts/update_embeddings.py)
+CHAT_SPOOL_PATH = str(Path(__file__).parent.parent / "data" / "chat_sentences.txt")
 
 # Configurar stdout para UTF-8
 sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
 
+def route_knowledge_answer(prompt):
+    """Respuesta de la base de conocimiento si el mensaje la tiene con seguridad (None si no)"""
+    if not KNOWLEDGE_AVAILABLE:
+        return None
+    try:
+        return get_knowledge_answer(prompt)
+    except Exception as e:
+        print(f"Error consultando la base de conocimiento: {e}", file=sys.stderr)
+        return None
+
+def spool_chat_message(prompt):
+    """Guarda el mensaje para la actualización incremental de embeddings en otro hilo, sin retrasar ni romper la respuesta"""
+    if not CHAT_SPOOL_AVAILABLE:
+        return None
+    
+    def collect():
+        try:
+            collect_chat_message(prompt, CHAT_SPOOL_PATH)
+        except Exception as e:
+            print(f"Error guardando el mensaje de chat: {e}", file=sys.stderr)
+    
+    thread = threading.Thread(target=collect, name="chat-spool")
+    thread.start()
+    return thread
+
 def load_gpt2_model():
     """Carga el modelo GPT-2 en español"""
     try:
+        from transformers import AutoTokenizer, AutoModelForCausalLM
+        
         nombre_modelo = "datificate/gpt2-small-spanish"
         
         # Cargar el tokenizer y el modelo
@@ -34,6 +90,8 @@ def load_gpt2_model():
 def generate_response(tokenizer, model, prompt, max_length=120, temperature=0.1, top_p=0.9):
     """Genera una respuesta usando GPT-2 con control de repeticiones"""
     try:
+        import torch
+        
         # Agregar contexto conversacional para que GPT-2 entienda que es un chat
         conversational_prompt = f"Pregunta: {prompt}\nRespuesta corta:"
         
@@ -155,12 +213,39 @@ def main():
     temperature = float(sys.argv[3]) if len(sys.argv) > 3 else 0.1
     top_p = float(sys.argv[4]) if len(sys.argv) > 4 else 0.9
     
+    # Recoger el mensaje para el vocabulario de los embeddings (en paralelo con la respuesta)
+    spool_chat_message(prompt)
+    
+    parameters = {
+        "max_length": max_length,
+        "temperature": temperature,
+        "top_p": top_p
+    }
+    
+    # Títulos y preguntas por atributos: responder sin cargar GPT-2
+    answer = route_knowledge_answer(prompt)
+    if answer is not None:
+        result = {
+            "response": answer["response"],
+            "model": "gaming-knowledge-base",
+            "answered_by": "knowledge_base",
+            "route": answer["route"],
+            "games": answer["games"],
+            "corrections": answer["corrections"],
+            "parameters": parameters,
+            "prompt": prompt,
+            "timestamp": "2024-01-01T00:00:00"
+        }
+        print(json.dumps(result, ensure_ascii=False))
+        return
+    
     # Cargar modelo
     tokenizer, model = load_gpt2_model()
     
     if tokenizer is None or model is None:
         result = {
             "error": "No se pudo cargar el modelo GPT-2",
+            "answered_by": "fallback",
             "fallback_response": f"He recibido tu mensaje: '{prompt}'. Este es un ejemplo de respuesta."
         }
         print(json.dumps(result, ensure_ascii=False))
@@ -173,11 +258,8 @@ def main():
     result = {
         "response": response,
         "model": "gpt2-small-spanish",
-        "parameters": {
-            "max_length": max_length,
-            "temperature": temperature,
-            "top_p": top_p
-        },
+        "answered_by": "gpt2",
+        "parameters": parameters,
         "prompt": prompt,
         "timestamp": "2024-01-01T00:00:00"
     }
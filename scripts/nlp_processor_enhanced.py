@@ -19,8 +19,17 @@ from nltk.tokenize import word_tokenize, RegexpTokenizer, sent_tokenize
 from nltk.stem import WordNetLemmatizer
 from nltk.corpus import stopwords
 from nltk import pos_tag
+import sys
 import json
-from typing import Dict, List, Any
+from collections import OrderedDict
+from functools import cached_property
+from pathlib import Path
+from typing import Dict, List, Any, Tuple
+
+# Agregar el directorio lib al path
+sys.path.append(str(Path(__file__).parent.parent / "lib"))
+
+from spanish_morphology import get_spanish_morphology
 
 # Descargar recursos necesarios de NLTK
 required_nltk_data = [
@@ -39,6 +48,54 @@ for path, name in required_nltk_data:
         print(f"⬇ Descargando {name}...")
         nltk.download(name)
 
+# Textos analizados que se conservan entre llamadas (los menos usados salen primero)
+PARSE_CACHE_SIZE = 256
+
+class ParsedText:
+    """
+    Análisis compartido de un texto: cada parte (documento de spaCy,
+    tokenizaciones y oraciones de NLTK, etiquetas POS de NLTK) se calcula
+    la primera vez que una etapa la pide y las demás etapas la reutilizan.
+    """
+    
+    def __init__(self, text: str, nlp=None):
+        self.text = text
+        self.lower = text.lower()
+        self._nlp = nlp
+        self._nltk_tags: Dict[Tuple[str, ...], List[Tuple[str, str]]] = {}
+    
+    @cached_property
+    def doc(self):
+        """Documento de spaCy (None si spaCy no está disponible)"""
+        return self._nlp(self.text) if self._nlp is not None else None
+    
+    @cached_property
+    def regex_tokens(self) -> List[str]:
+        return re.findall(r'\b\w+\b', self.lower)
+    
+    @cached_property
+    def nltk_tokens(self) -> Tuple[List[str], bool]:
+        """Tokens de word_tokenize e indicador de si se usó el modelo español"""
+        try:
+            return word_tokenize(self.lower, language='spanish'), True
+        except:
+            return word_tokenize(self.lower), False
+    
+    @cached_property
+    def sentences(self) -> Tuple[List[str], bool]:
+        """Oraciones de sent_tokenize e indicador de si se usó el modelo español"""
+        try:
+            return sent_tokenize(self.text, language='spanish'), True
+        except:
+            return sent_tokenize(self.text), False
+    
+    def nltk_pos_tags(self, tokens: List[str]) -> List[Tuple[str, str]]:
+        """Etiquetas POS de NLTK para unos tokens del texto"""
+        key = tuple(tokens)
+        if key not in self._nltk_tags:
+            self._nltk_tags[key] = pos_tag(tokens)
+        return self._nltk_tags[key]
+
 class EnhancedNLPProcessor:
     """
     Clase mejorada para el procesamiento de lenguaje natural
@@ -82,6 +139,30 @@ class EnhancedNLPProcessor:
         # Reglas morfológicas del español
         self.spanish_morphology = self._load_spanish_morphology()
         print("✓ Reglas morfológicas del español cargadas")
+        
+        # Análisis de los textos vistos recientemente (un parseo por texto)
+        self._parse_cache: "OrderedDict[str, ParsedText]" = OrderedDict()
+    
+    def parse(self, text: str) -> ParsedText:
+        """
+        Análisis compartido de un texto, reutilizado entre etapas y llamadas
+        
+        Args:
+            text (str): Texto a analizar
+            
+        Returns:
+            ParsedText: Análisis (sus partes se calculan al pedirlas)
+        """
+        parsed = self._parse_cache.get(text)
+        if parsed is not None:
+            self._parse_cache.move_to_end(text)
+            return parsed
+        
+        parsed = ParsedText(text, self.nlp if self.spacy_available else None)
+        self._parse_cache[text] = parsed
+        while len(self._parse_cache) > PARSE_CACHE_SIZE:
+            self._parse_cache.popitem(last=False)
+        return parsed
     
     def _load_spanish_morphology(self) -> Dict[str, Any]:
         """Carga reglas morfológicas específicas del español"""
@@ -108,6 +189,7 @@ class EnhancedNLPProcessor:
         Returns:
             dict: Resultados completos de tokenización
         """
+        parsed = self.parse(text)
         results = {
             'original_text': text,
             'text_length': len(text),
@@ -123,7 +205,7 @@ class EnhancedNLPProcessor:
         }
         
         # Método 2: Expresiones regulares
-        tokens_regex = re.findall(r'\b\w+\b', text.lower())
+        tokens_regex = list(parsed.regex_tokens)
         results['methods']['regex'] = {
             'tokens': tokens_regex,
             'count': len(tokens_regex),
@@ -131,15 +213,15 @@ class EnhancedNLPProcessor:
         }
         
         # Método 3: NLTK word_tokenize
-        try:
-            tokens_nltk = word_tokenize(text.lower(), language='spanish')
+        tokens_nltk, spanish = parsed.nltk_tokens
+        tokens_nltk = list(tokens_nltk)
+        if spanish:
             results['methods']['nltk_word_tokenize'] = {
                 'tokens': tokens_nltk,
                 'count': len(tokens_nltk),
                 'description': 'Tokenización avanzada de NLTK para español'
             }
-        except:
-            tokens_nltk = word_tokenize(text.lower())
+        else:
             results['methods']['nltk_word_tokenize'] = {
                 'tokens': tokens_nltk,
                 'count': len(tokens_nltk),
@@ -147,7 +229,7 @@ class EnhancedNLPProcessor:
             }
         
         # Método 4: NLTK RegexpTokenizer
-        tokens_regexp_nltk = self.regexp_tokenizer.tokenize(text.lower())
+        tokens_regexp_nltk = self.regexp_tokenizer.tokenize(parsed.lower)
         results['methods']['nltk_regexp'] = {
             'tokens': tokens_regexp_nltk,
             'count': len(tokens_regexp_nltk),
@@ -156,7 +238,7 @@ class EnhancedNLPProcessor:
         
         # Método 5: spaCy (si está disponible)
         if self.spacy_available:
-            doc = self.nlp(text)
+            doc = parsed.doc
             tokens_spacy = [token.text.lower() for token in doc if not token.is_punct and not token.is_space]
             results['methods']['spacy'] = {
                 'tokens': tokens_spacy,
@@ -165,15 +247,15 @@ class EnhancedNLPProcessor:
             }
         
         # Tokenización de oraciones
-        try:
-            sentences = sent_tokenize(text, language='spanish')
+        sentences, spanish = parsed.sentences
+        sentences = list(sentences)
+        if spanish:
             results['sentence_tokenization'] = {
                 'sentences': sentences,
                 'count': len(sentences),
                 'description': 'División en oraciones usando NLTK'
             }
-        except:
-            sentences = sent_tokenize(text)
+        else:
             results['sentence_tokenization'] = {
                 'sentences': sentences,
                 'count': len(sentences),
@@ -199,8 +281,9 @@ class EnhancedNLPProcessor:
         Returns:
             dict: Resultados completos de lematización
         """
+        parsed = self.parse(text)
         if tokens is None:
-            tokens = re.findall(r'\b\w+\b', text.lower())
+            tokens = list(parsed.regex_tokens)
         
         results = {
             'original_text': text,
@@ -237,14 +320,13 @@ class EnhancedNLPProcessor:
             'limitations': 'Optimizado para inglés, limitaciones en español'
         }
         
-        # Método 2: Reglas morfológicas del español
+        # Método 2: Reglas morfológicas del español (trie de sufijos, todos los tokens a la vez)
         lemmas_rules = []
-        for token in tokens:
-            lemma = self._apply_spanish_morphology_rules(token)
+        for token, analysis in zip(tokens, get_spanish_morphology().analyze_tokens(tokens)):
             lemmas_rules.append({
                 'word': token,
-                'lemma': lemma,
-                'rule_applied': self._get_applied_rule(token, lemma)
+                'lemma': analysis.lemma,
+                'rule_applied': analysis.rule
             })
         
         results['methods']['spanish_rules'] = {
@@ -255,11 +337,12 @@ class EnhancedNLPProcessor:
         
         # Método 3: spaCy (si está disponible)
         if self.spacy_available:
-            doc = self.nlp(text)
+            doc = parsed.doc
             lemmas_spacy = []
+            token_set = set(tokens)
             
             for token in doc:
-                if not token.is_punct and not token.is_space and token.text.lower() in tokens:
+                if not token.is_punct and not token.is_space and token.text.lower() in token_set:
                     lemmas_spacy.append({
                         'word': token.text.lower(),
                         'lemma': token.lemma_,
@@ -284,62 +367,7 @@ class EnhancedNLPProcessor:
     
     def _apply_spanish_morphology_rules(self, word: str) -> str:
         """Aplica reglas morfológicas específicas del español"""
-        original_word = word
-        
-        # Regla 1: Adverbios terminados en -mente
-        if word.endswith('mente'):
-            base = word[:-5]  # Quitar 'mente'
-            if base.endswith('a'):
-                return base[:-1] + 'o'  # rápidamente -> rápido
-            return base
-        
-        # Regla 2: Gerundios
-        if word.endswith('ando'):
-            return word[:-4] + 'ar'  # hablando -> hablar
-        if word.endswith('iendo'):
-            return word[:-5] + 'er'  # comiendo -> comer
-        
-        # Regla 3: Participios
-        if word.endswith('ado'):
-            return word[:-3] + 'ar'  # hablado -> hablar
-        if word.endswith('ido'):
-            return word[:-3] + 'er'  # comido -> comer
-        
-        # Regla 4: Plurales
-        if word.endswith('es') and len(word) > 3:
-            return word[:-2]  # casas -> casa
-        if word.endswith('s') and len(word) > 2 and not word.endswith('ss'):
-            return word[:-1]  # libros -> libro
-        
-        # Regla 5: Femeninos
-        if word.endswith('a') and len(word) > 2:
-            # Verificar si es un adjetivo femenino
-            masculine = word[:-1] + 'o'
-            if masculine != word:  # pequeña -> pequeño
-                return masculine
-        
-        # Regla 6: Diminutivos
-        for dim in self.spanish_morphology['diminutives']:
-            if word.endswith(dim):
-                return word[:-len(dim)]
-        
-        return word
-    
-    def _get_applied_rule(self, original: str, lemma: str) -> str:
-        """Identifica qué regla morfológica se aplicó"""
-        if original == lemma:
-            return "sin_cambio"
-        if original.endswith('mente'):
-            return "adverbio_mente"
-        if original.endswith('ando') or original.endswith('iendo'):
-            return "gerundio"
-        if original.endswith('ado') or original.endswith('ido'):
-            return "participio"
-        if original.endswith('s') or original.endswith('es'):
-            return "plural"
-        if original.endswith('a') and lemma.endswith('o'):
-            return "femenino_masculino"
-        return "regla_personalizada"
+        return get_spanish_morphology().analyze(word).lemma
     
     def pos_tag_comprehensive(self, text: str, tokens: List[str] = None) -> Dict[str, Any]:
         """
@@ -352,8 +380,9 @@ class EnhancedNLPProcessor:
         Returns:
             dict: Resultados completos de etiquetado POS
         """
+        parsed = self.parse(text)
         if tokens is None:
-            tokens = re.findall(r'\b\w+\b', text.lower())
+            tokens = list(parsed.regex_tokens)
         
         results = {
             'original_text': text,
@@ -362,7 +391,7 @@ class EnhancedNLPProcessor:
         }
         
         # Método 1: NLTK POS Tagger
-        pos_nltk = pos_tag(tokens)
+        pos_nltk = parsed.nltk_pos_tags(tokens)
         tagged_nltk = []
         
         for word, tag in pos_nltk:
@@ -380,15 +409,14 @@ class EnhancedNLPProcessor:
             'limitations': 'Entrenado principalmente para inglés'
         }
         
-        # Método 2: Reglas heurísticas para español
+        # Método 2: Reglas heurísticas para español (trie de sufijos, todos los tokens a la vez)
         tagged_rules = []
-        for token in tokens:
-            pos_tag = self._spanish_pos_rules(token)
+        for token, analysis in zip(tokens, get_spanish_morphology().analyze_tokens(tokens)):
             tagged_rules.append({
                 'word': token,
-                'pos': pos_tag,
-                'description': self._get_spanish_pos_description(pos_tag),
-                'confidence': self._get_pos_confidence(token, pos_tag)
+                'pos': analysis.pos,
+                'description': self._get_spanish_pos_description(analysis.pos),
+                'confidence': analysis.confidence
             })
         
         results['methods']['spanish_heuristics'] = {
@@ -399,7 +427,7 @@ class EnhancedNLPProcessor:
         
         # Método 3: spaCy (si está disponible)
         if self.spacy_available:
-            doc = self.nlp(text)
+            doc = parsed.doc
             tagged_spacy = []
             
             for token in doc:
@@ -432,85 +460,11 @@ class EnhancedNLPProcessor:
     
     def _spanish_pos_rules(self, word: str) -> str:
         """Aplica reglas heurísticas para determinar POS en español"""
-        # Diccionario de palabras comunes
-        common_words = {
-            # Determinantes
-            'el': 'DET', 'la': 'DET', 'los': 'DET', 'las': 'DET',
-            'un': 'DET', 'una': 'DET', 'unos': 'DET', 'unas': 'DET',
-            'este': 'DET', 'esta': 'DET', 'estos': 'DET', 'estas': 'DET',
-            'mi': 'DET', 'tu': 'DET', 'su': 'DET', 'nuestro': 'DET',
-            
-            # Pronombres
-            'yo': 'PRON', 'tú': 'PRON', 'él': 'PRON', 'ella': 'PRON',
-            'nosotros': 'PRON', 'vosotros': 'PRON', 'ellos': 'PRON', 'ellas': 'PRON',
-            'me': 'PRON', 'te': 'PRON', 'se': 'PRON', 'nos': 'PRON', 'les': 'PRON',
-            
-            # Preposiciones
-            'de': 'ADP', 'en': 'ADP', 'con': 'ADP', 'por': 'ADP', 'para': 'ADP',
-            'sin': 'ADP', 'sobre': 'ADP', 'bajo': 'ADP', 'desde': 'ADP', 'hasta': 'ADP',
-            
-            # Conjunciones
-            'y': 'CCONJ', 'o': 'CCONJ', 'pero': 'CCONJ', 'aunque': 'SCONJ',
-            'porque': 'SCONJ', 'si': 'SCONJ', 'cuando': 'SCONJ', 'donde': 'SCONJ',
-            
-            # Adverbios comunes
-            'muy': 'ADV', 'más': 'ADV', 'menos': 'ADV', 'bien': 'ADV', 'mal': 'ADV',
-            'aquí': 'ADV', 'allí': 'ADV', 'ahora': 'ADV', 'después': 'ADV', 'antes': 'ADV',
-            
-            # Verbos auxiliares y copulativos
-            'ser': 'AUX', 'estar': 'AUX', 'haber': 'AUX', 'tener': 'VERB',
-            'es': 'AUX', 'está': 'AUX', 'son': 'AUX', 'están': 'AUX'
-        }
-        
-        if word in common_words:
-            return common_words[word]
-        
-        # Reglas morfológicas
-        if word.endswith('mente'):
-            return 'ADV'  # Adverbios terminados en -mente
-        
-        if word.endswith(('ando', 'iendo')):
-            return 'VERB'  # Gerundios
-        
-        if word.endswith(('ado', 'ido', 'to', 'so', 'cho')):
-            return 'VERB'  # Participios
-        
-        if word.endswith(('ción', 'sión', 'dad', 'tad', 'eza', 'ura', 'ismo', 'ista')):
-            return 'NOUN'  # Sustantivos con sufijos típicos
-        
-        if word.endswith(('ar', 'er', 'ir')):
-            return 'VERB'  # Infinitivos
-        
-        if word.endswith(('oso', 'osa', 'ivo', 'iva', 'able', 'ible')):
-            return 'ADJ'  # Adjetivos con sufijos típicos
-        
-        # Por defecto, asumir sustantivo
-        return 'NOUN'
+        return get_spanish_morphology().analyze(word).pos
     
     def _get_pos_confidence(self, word: str, pos: str) -> float:
         """Calcula la confianza en la etiqueta POS asignada"""
-        # Palabras muy comunes tienen alta confianza
-        high_confidence_words = {
-            'el', 'la', 'de', 'en', 'y', 'es', 'que', 'se', 'no', 'un', 'por', 'con'
-        }
-        
-        if word in high_confidence_words:
-            return 0.95
-        
-        # Palabras con terminaciones claras tienen confianza media-alta
-        clear_endings = {
-            'mente': 0.9,  # Adverbios
-            'ción': 0.85,  # Sustantivos
-            'ando': 0.9,   # Gerundios
-            'iendo': 0.9   # Gerundios
-        }
-        
-        for ending, confidence in clear_endings.items():
-            if word.endswith(ending):
-                return confidence
-        
-        # Confianza por defecto
-        return 0.6
+        return get_spanish_morphology().analyze(word).confidence
     
     def _get_spanish_pos_description(self, pos: str) -> str:
         """Obtiene descripción en español para etiquetas POS"""
@@ -7,7 +7,8 @@ Este script integra el procesamiento de PLN tradicional (tokenización, lematiza
 con embeddings semánticos usando Word2Vec para análisis de videojuegos.
 
 Funcionalidades:
-- Tokenización y lematización con spaCy
+- Tokenización y lematización con spaCy (también por lotes con nlp.pipe)
+- Perfiles de análisis que solo ejecutan los componentes de spaCy necesarios
 - POS tagging
 - Análisis de contenido de videojuegos
 - Embeddings semánticos con Word2Vec
@@ -22,6 +23,7 @@ import sys
 import json
 import logging
 from pathlib import Path
+from typing import Iterable, Iterator
 
 # Configuración de logging
 logging.basicConfig(level=logging.INFO)
@@ -45,81 +47,165 @@ except ImportError as e:
     logger.warning(f"Módulos de embeddings no disponibles: {e}")
     EMBEDDINGS_AVAILABLE = False
 
-def load_spacy_model():
-    """Carga el modelo de spaCy para procesamiento de PLN."""
+# Textos que spaCy procesa juntos en nlp.pipe
+DEFAULT_BATCH_SIZE = 256
+
+# Perfiles de análisis: qué partes del resultado se calculan y qué componentes
+# del pipeline sobran para ello (nombres de es_core_news_sm y en_core_web_sm).
+# El lematizador necesita las etiquetas POS, así que los lemas van con ellas.
+SPACY_PROFILES = {
+    'tokens': {
+        'lemmas': False, 'pos': False, 'sentences': False, 'dependencies': False,
+        'exclude': ('tok2vec', 'morphologizer', 'tagger', 'attribute_ruler', 'lemmatizer', 'parser', 'senter', 'ner'),
+    },
+    'lemmas+pos': {
+        'lemmas': True, 'pos': True, 'sentences': False, 'dependencies': False,
+        'exclude': ('parser', 'senter', 'ner'),
+    },
+    'full': {
+        'lemmas': True, 'pos': True, 'sentences': True, 'dependencies': True,
+        'exclude': (),
+    },
+}
+
+# Perfil por defecto (el resultado completo, con contexto de la oración y relaciones)
+DEFAULT_PROFILE = 'full'
+
+def load_spacy_model(profile: str = DEFAULT_PROFILE):
+    """
+    Carga el modelo de spaCy para procesamiento de PLN.
+    
+    Args:
+        profile (str): Perfil de análisis; los componentes que no necesita no
+            se cargan (el modelo solo sirve para ese perfil o uno menor)
+        
+    Returns:
+        Modelo de spaCy, o None si no se pudo cargar ninguno
+    """
+    exclude = list(SPACY_PROFILES[profile]['exclude'])
     try:
         # Intentar cargar el modelo de español
-        nlp = spacy.load("es_core_news_sm")
-        logger.info("Modelo spaCy español cargado exitosamente")
+        nlp = spacy.load("es_core_news_sm", exclude=exclude)
+        logger.info(f"Modelo spaCy español cargado exitosamente (perfil '{profile}': {', '.join(nlp.pipe_names) or 'solo tokenizador'})")
         return nlp
     except OSError:
         try:
             # Fallback al modelo de inglés si el español no está disponible
-            nlp = spacy.load("en_core_web_sm")
+            nlp = spacy.load("en_core_web_sm", exclude=exclude)
             logger.warning("Modelo español no disponible, usando modelo inglés")
             return nlp
         except OSError:
             logger.error("No se pudo cargar ningún modelo de spaCy")
             return None
 
-def process_text_with_spacy(text: str, nlp) -> dict:
+def _disabled_components(nlp, profile: str) -> list:
+    """Componentes cargados en el modelo que el perfil no necesita."""
+    return [name for name in SPACY_PROFILES[profile]['exclude'] if name in nlp.pipe_names]
+
+def process_text_with_spacy(text: str, nlp, profile: str = DEFAULT_PROFILE) -> dict:
     """
     Procesa texto usando spaCy para tokenización, lematización y POS tagging.
     
     Args:
         text (str): Texto a procesar
         nlp: Modelo de spaCy cargado
+        profile (str): Perfil de análisis (ver SPACY_PROFILES); los
+            componentes que no necesita no se ejecutan
         
     Returns:
         dict: Resultados del procesamiento
     """
     if nlp is None:
-        return {
-            'tokens': [],
-            'lemmas': [],
-            'pos_tags': [],
-            'error': 'Modelo spaCy no disponible'
-        }
+        return _spacy_error('Modelo spaCy no disponible')
     
     try:
-        doc = nlp(text)
-        
-        # Tokenización
-        tokens = [token.text for token in doc]
+        return _doc_to_result(nlp(text, disable=_disabled_components(nlp, profile)), profile)
+    except Exception as e:
+        logger.error(f"Error en procesamiento spaCy: {str(e)}")
+        return _spacy_error(str(e))
+
+def process_texts_with_spacy(texts: Iterable[str], nlp, batch_size: int = DEFAULT_BATCH_SIZE,
+                             n_process: int = 1, profile: str = DEFAULT_PROFILE) -> Iterator[dict]:
+    """
+    Procesa muchos textos con nlp.pipe, que agrupa los textos en lotes y
+    puede repartirlos entre varios procesos.
+    
+    Devuelve, en el mismo orden que la entrada, el mismo resultado que
+    process_text_with_spacy para cada texto.
+    
+    Args:
+        texts (Iterable[str]): Textos a procesar (pueden llegar como flujo)
+        nlp: Modelo de spaCy cargado
+        batch_size (int): Textos por lote
+        n_process (int): Procesos de spaCy (-1 usa todos los núcleos). Con
+            más de uno, el script que lo llame debe estar protegido por
+            if __name__ == "__main__"
+        profile (str): Perfil de análisis (ver SPACY_PROFILES)
         
-        # Lematización
-        lemmas = []
+    Returns:
+        Iterator[dict]: Resultados del procesamiento, uno por texto
+    """
+    if nlp is None:
+        for _ in texts:
+            yield _spacy_error('Modelo spaCy no disponible')
+        return
+    
+    disable = _disabled_components(nlp, profile)
+    for doc in nlp.pipe(texts, batch_size=batch_size, n_process=n_process, disable=disable):
+        try:
+            yield _doc_to_result(doc, profile)
+        except Exception as e:
+            logger.error(f"Error en procesamiento spaCy: {str(e)}")
+            yield _spacy_error(str(e))
+
+def _doc_to_result(doc, profile: str = DEFAULT_PROFILE) -> dict:
+    """Tokens, lemas y etiquetas POS de un documento de spaCy, según el perfil."""
+    options = SPACY_PROFILES[profile]
+    
+    # Tokenización
+    tokens = [token.text for token in doc]
+    
+    # Lematización (el contexto de la oración solo si el perfil segmenta oraciones)
+    lemmas = []
+    if options['lemmas']:
+        sentences = options['sentences'] and doc.has_annotation('SENT_START')
         for token in doc:
             lemmas.append({
                 'word': token.text,
                 'lemma': token.lemma_,
-                'context': token.sent.text if hasattr(token, 'sent') else None
+                'context': token.sent.text if sentences else None
             })
-        
-        # POS Tagging
-        pos_tags = []
+    
+    # POS Tagging (la relación de dependencia solo si el perfil ejecuta el parser)
+    pos_tags = []
+    if options['pos']:
+        dependencies = options['dependencies'] and doc.has_annotation('DEP')
+        descriptions = {}
         for token in doc:
+            pos = token.pos_
+            if pos not in descriptions:
+                descriptions[pos] = spacy.explain(pos) or 'Desconocido'
             pos_tags.append({
                 'word': token.text,
-                'pos': token.pos_,
-                'description': spacy.explain(token.pos_) or 'Desconocido',
-                'relationship': f"Head: {token.head.text}" if token.head != token else None
+                'pos': pos,
+                'description': descriptions[pos],
+                'relationship': f"Head: {token.head.text}" if dependencies and token.head != token else None
             })
-        
-        return {
-            'tokens': tokens,
-            'lemmas': lemmas,
-            'pos_tags': pos_tags
-        }
-        
-    except Exception as e:
-        logger.error(f"Error en procesamiento spaCy: {str(e)}")
-        return {
-            'tokens': [],
-            'lemmas': [],
-            'pos_tags': [],
-            'error': str(e)
-        }
+    
+    return {
+        'tokens': tokens,
+        'lemmas': lemmas,
+        'pos_tags': pos_tags
+    }
+
+def _spacy_error(message: str) -> dict:
+    """Resultado vacío con el error del procesamiento spaCy."""
+    return {
+        'tokens': [],
+        'lemmas': [],
+        'pos_tags': [],
+        'error': message
+    }
 
 def process_text_with_embeddings(text: str) -> dict:
     """
@@ -161,11 +247,19 @@ def main():
     if len(sys.argv) < 2:
         print(json.dumps({
             'error': 'Se requiere texto como argumento',
-            'usage': 'python nlp_processor_with_embeddings.py "texto a procesar"'
+            'usage': 'python nlp_processor_with_embeddings.py "texto a procesar" [tokens|lemmas+pos|full]'
         }))
         sys.exit(1)
     
     text = sys.argv[1]
+    profile = sys.argv[2] if len(sys.argv) > 2 else DEFAULT_PROFILE
+    
+    if profile not in SPACY_PROFILES:
+        print(json.dumps({
+            'error': f"Perfil desconocido: {profile}",
+            'profiles': list(SPACY_PROFILES)
+        }))
+        sys.exit(1)
     
     if not text.strip():
         print(json.dumps({
@@ -190,9 +284,9 @@ def main():
     
     # Procesamiento con spaCy
     if SPACY_AVAILABLE:
-        nlp = load_spacy_model()
+        nlp = load_spacy_model(profile)
         if nlp:
-            spacy_result = process_text_with_spacy(text, nlp)
+            spacy_result = process_text_with_spacy(text, nlp, profile)
             result.update({
                 'tokens': spacy_result.get('tokens', []),
                 'lemmas': spacy_result.get('lemmas', []),
@@ -224,6 +318,7 @@ def main():
     # Información adicional
     result['processing_info'] = {
         'spacy_available': SPACY_AVAILABLE,
+        'spacy_profile': profile,
         'embeddings_available': EMBEDDINGS_AVAILABLE,
         'total_tokens': len(result['tokens']),
         'gaming_related': result['gaming_analysis']['is_gaming_related'] if result['gaming_analysis'] else False
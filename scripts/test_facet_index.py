@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Script de Prueba para el Índice de Facetas
+==========================================
+
+Comprueba que los atributos de varias palabras ("mundo abierto", "epic
+games") solo se reconocen enteros, de modo que las frases corrientes con
+"juegos" no se toman por preguntas por atributos, y que las preguntas por
+atributos siguen encontrando sus juegos.
+"""
+
+import sys
+import logging
+from pathlib import Path
+
+# Configuración de logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# Agregar el directorio lib al path
+sys.path.append(str(Path(__file__).parent.parent / "lib"))
+
+# Mensajes con palabras sueltas de un atributo que no deben dar grupos de atributos
+GENERIC_SENTENCES = [
+    "cuáles son los mejores juegos del mundo",
+    "juegos abierto al público",
+    "los juegos de mesa están abiertos todo el día",
+    "títulos de los games más vendidos",
+    "juegos para jugar con los estudios terminados",
+]
+
+# Preguntas por atributos, con los grupos y los juegos que se esperan
+ATTRIBUTE_QUESTIONS = [
+    ("juegos de PC de mundo abierto", [['pc'], ['mundo abierto']], ['grand theft auto']),
+    ("juegos de Nintendo de 1986", [['nintendo'], ['1986']], ['the legend of zelda']),
+    ("títulos de epic games", [['epic games']], ['fortnite']),
+    ("juegos de sandbox o battle royale", [['sandbox', 'battle royale']], ['minecraft', 'fortnite']),
+]
+
+
+def get_facet_index():
+    """Índice de facetas de los juegos de la base de conocimiento."""
+    from gaming_knowledge import get_game_facets
+    return get_game_facets()
+
+
+def test_terms():
+    """Prueba que los valores de varias palabras se indexan enteros."""
+    logger.info("=== Probando Términos ===")
+
+    try:
+        facets = get_facet_index()
+        success = True
+        for term in ("mundo abierto", "epic games", "battle royale", "mojang studios", "activision"):
+            if term not in facets.term_facets:
+                logger.error(f"✗ Falta el término '{term}'")
+                success = False
+        for word in ("mundo", "abierto", "games", "battle", "royale", "studios", "estudios"):
+            if word in facets.term_facets:
+                logger.error(f"✗ La palabra suelta '{word}' es un término")
+                success = False
+        if success:
+            logger.info(f"✓ Términos indexados: {len(facets.term_facets)}")
+        return success
+
+    except Exception as e:
+        logger.error(f"✗ Error en los términos: {e}")
+        return False
+
+
+def test_generic_sentences():
+    """Prueba que las frases corrientes no dan grupos de atributos."""
+    logger.info("=== Probando Frases Corrientes ===")
+
+    try:
+        facets = get_facet_index()
+        success = True
+        for text in GENERIC_SENTENCES:
+            groups = facets.parse(text)
+            if groups:
+                logger.error(f"✗ '{text}' da grupos de atributos: {groups}")
+                success = False
+            else:
+                logger.info(f"✓ '{text}' no pregunta por atributos")
+        return success
+
+    except Exception as e:
+        logger.error(f"✗ Error en frases corrientes: {e}")
+        return False
+
+
+def test_attribute_questions():
+    """Prueba que las preguntas por atributos encuentran sus juegos."""
+    logger.info("=== Probando Preguntas por Atributos ===")
+
+    try:
+        facets = get_facet_index()
+        success = True
+        for text, groups, games in ATTRIBUTE_QUESTIONS:
+            result = facets.search(text)
+            if result['groups'] != groups or result['games'] != games:
+                logger.error(f"✗ '{text}': se esperaba {groups} -> {games}, se obtuvo {result}")
+                success = False
+            else:
+                logger.info(f"✓ '{text}' -> {games}")
+        return success
+
+    except Exception as e:
+        logger.error(f"✗ Error en preguntas por atributos: {e}")
+        return False
+
+
+def main():
+    """Función principal de pruebas."""
+    logger.info("🚀 Iniciando pruebas del índice de facetas")
+
+    tests = [
+        ("Términos", test_terms),
+        ("Frases Corrientes", test_generic_sentences),
+        ("Preguntas por Atributos", test_attribute_questions)
+    ]
+
+    passed = 0
+    total = len(tests)
+
+    for test_name, test_func in tests:
+        logger.info(f"\n--- {test_name} ---")
+        try:
+            if test_func():
+                logger.info(f"✓ {test_name}: PASÓ")
+                passed += 1
+            else:
+                logger.error(f"✗ {test_name}: FALLÓ")
+        except Exception as e:
+            logger.error(f"✗ {test_name}: ERROR - {e}")
+
+    logger.info(f"\n=== Resumen de Pruebas ===")
+    logger.info(f"Pruebas pasadas: {passed}/{total}")
+
+    if passed == total:
+        logger.info("🎉 ¡Todas las pruebas pasaron!")
+        return True
+    else:
+        logger.error(f"❌ {total-passed} pruebas fallaron. Revisa los errores anteriores.")
+        return False
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
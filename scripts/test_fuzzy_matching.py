@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Script de Prueba para la Corrección de Erratas
+==============================================
+
+Comprueba que las palabras corrientes del español no se corrigen hacia
+palabras clave o títulos parecidos ("marido" no es "mario") y que las
+erratas de verdad siguen corrigiéndose.
+"""
+
+import sys
+import logging
+from pathlib import Path
+
+# Configuración de logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# Agregar el directorio lib al path
+sys.path.append(str(Path(__file__).parent.parent / "lib"))
+
+# Frases cotidianas que no deben tratarse como mensajes de videojuegos
+EVERYDAY_SENTENCES = [
+    "mi marido trabaja mucho",
+    "nos vemos en marzo",
+    "el valle es precioso en primavera",
+    "el preso pasó la noche en la celda",
+    "pulsa el botón del ascensor",
+    "hago deporte todas las mañanas",
+    "trabajo en una cooperativa agrícola",
+    "vivimos en una casa grande",
+    "no me lo puedo creer",
+    "tengo el mando de la tele",
+    "fue un error del banco",
+    "toca la campana de la iglesia",
+    "cuélgalo en el marco de la puerta",
+    "me gusta el queso curado",
+]
+
+# Mensajes con erratas y la corrección que se espera en cada uno
+TYPO_SENTENCES = [
+    ("me gusta jugar al fornite", "fortnite"),
+    ("minecrat es genial", "minecraft"),
+    ("la histria de este juego es buena", "historia"),
+    ("busco juegos de accion", "acción"),
+]
+
+
+def test_common_words():
+    """Prueba la carga de la lista de palabras frecuentes."""
+    logger.info("=== Probando Palabras Frecuentes ===")
+
+    try:
+        from fuzzy_match import get_common_words
+
+        common_words = get_common_words()
+        missing = [word for word in ("marido", "marzo", "celda", "valle") if word not in common_words]
+        if missing:
+            logger.error(f"✗ Faltan palabras en la lista: {missing}")
+            return False
+        if "mario" in common_words:
+            logger.error("✗ La lista incluye el título 'mario'")
+            return False
+
+        logger.info(f"✓ Palabras frecuentes cargadas: {len(common_words)}")
+        return True
+
+    except Exception as e:
+        logger.error(f"✗ Error al cargar las palabras frecuentes: {e}")
+        return False
+
+
+def test_everyday_sentences():
+    """Prueba que las frases cotidianas no se corrigen ni se marcan como de videojuegos."""
+    logger.info("=== Probando Frases Cotidianas ===")
+
+    try:
+        from gaming_knowledge import analyze_gaming_content, scan_gaming_text
+
+        success = True
+        for text in EVERYDAY_SENTENCES:
+            hits = scan_gaming_text(text)
+            analysis = analyze_gaming_content(text)
+            if hits['corrections'] or analysis['is_gaming_related']:
+                corrections = [(c.word, c.correction) for c in hits['corrections']]
+                logger.error(f"✗ '{text}' se trata como de videojuegos: {corrections}")
+                success = False
+            else:
+                logger.info(f"✓ '{text}' no es de videojuegos")
+
+        return success
+
+    except Exception as e:
+        logger.error(f"✗ Error en frases cotidianas: {e}")
+        return False
+
+
+def test_typo_sentences():
+    """Prueba que las erratas siguen corrigiéndose."""
+    logger.info("=== Probando Erratas ===")
+
+    try:
+        from gaming_knowledge import scan_gaming_text
+
+        success = True
+        for text, expected in TYPO_SENTENCES:
+            corrections = [c.correction for c in scan_gaming_text(text)['corrections']]
+            if expected in corrections:
+                logger.info(f"✓ '{text}' -> {expected}")
+            else:
+                logger.error(f"✗ '{text}': se esperaba '{expected}', se obtuvo {corrections}")
+                success = False
+
+        return success
+
+    except Exception as e:
+        logger.error(f"✗ Error en erratas: {e}")
+        return False
+
+
+def main():
+    """Función principal de pruebas."""
+    logger.info("🚀 Iniciando pruebas de corrección de erratas")
+
+    tests = [
+        ("Palabras Frecuentes", test_common_words),
+        ("Frases Cotidianas", test_everyday_sentences),
+        ("Erratas", test_typo_sentences)
+    ]
+
+    passed = 0
+    total = len(tests)
+
+    for test_name, test_func in tests:
+        logger.info(f"\n--- {test_name} ---")
+        try:
+            if test_func():
+                logger.info(f"✓ {test_name}: PASÓ")
+                passed += 1
+            else:
+                logger.error(f"✗ {test_name}: FALLÓ")
+        except Exception as e:
+            logger.error(f"✗ {test_name}: ERROR - {e}")
+
+    logger.info(f"\n=== Resumen de Pruebas ===")
+    logger.info(f"Pruebas pasadas: {passed}/{total}")
+
+    if passed == total:
+        logger.info("🎉 ¡Todas las pruebas pasaron!")
+        return True
+    else:
+        logger.error(f"❌ {total-passed} pruebas fallaron. Revisa los errores anteriores.")
+        return False
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
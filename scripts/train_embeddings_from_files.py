@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Entrenamiento de Embeddings desde Ficheros de Corpus
+====================================================
+
+Entrena el modelo Word2Vec de videojuegos a partir de uno o varios ficheros
+grandes (logs de chat, volcados de foros) sin cargarlos en memoria:
+
+- Preprocesado en paralelo (minúsculas, tokenización respetando tildes) en fragmentos en caché
+- Entrenamiento multinúcleo con el modo corpus_file de gensim
+- Informe de palabras/segundo por época
+
+Formatos admitidos:
+- .txt: una oración por línea
+- .jsonl: un objeto JSON por línea con el texto en --text-field
+
+Uso:
+    python scripts/train_embeddings_from_files.py chats.jsonl foro.txt --workers 8 --report informe.json
+"""
+
+import sys
+import json
+import argparse
+import logging
+from pathlib import Path
+
+# Configuración de logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# Agregar el directorio lib al path
+sys.path.append(str(Path(__file__).parent.parent / "lib"))
+
+from semantic_embeddings import SemanticEmbeddings
+
+
+def main():
+    """Función principal del script."""
+    parser = argparse.ArgumentParser(description="Entrena los embeddings desde ficheros de corpus")
+    parser.add_argument('paths', nargs='+', help="Ficheros .txt o .jsonl")
+    parser.add_argument('--model-path', default="models/gaming_word2vec.model", help="Ruta del modelo completo")
+    parser.add_argument('--cache-dir', default="data/corpus_shards", help="Directorio de fragmentos preprocesados")
+    parser.add_argument('--text-field', default='text', help="Campo con el texto en los ficheros .jsonl")
+    parser.add_argument('--preprocess-workers', type=int, default=None, help="Procesos para el preprocesado")
+    parser.add_argument('--workers', type=int, default=None, help="Hilos de entrenamiento")
+    parser.add_argument('--epochs', type=int, default=None, help="Épocas de entrenamiento")
+    parser.add_argument('--vector-size', type=int, default=None, help="Dimensión de los vectores")
+    parser.add_argument('--min-count', type=int, default=None, help="Frecuencia mínima de palabras")
+    parser.add_argument('--report', help="Fichero JSON donde guardar el informe")
+    args = parser.parse_args()
+
+    missing = [path for path in args.paths if not Path(path).is_file()]
+    if missing:
+        logger.error(f"Ficheros no encontrados: {missing}")
+        return False
+
+    params = {
+        'workers': args.workers,
+        'epochs': args.epochs,
+        'vector_size': args.vector_size,
+        'min_count': args.min_count,
+    }
+    params = {key: value for key, value in params.items() if value is not None}
+
+    embeddings = SemanticEmbeddings(model_path=args.model_path)
+    report = embeddings.train_model_from_files(
+        args.paths,
+        cache_dir=args.cache_dir,
+        preprocess_workers=args.preprocess_workers,
+        text_field=args.text_field,
+        **params
+    )
+
+    output = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.report:
+        Path(args.report).write_text(output, encoding='utf-8')
+    print(output)
+
+    return report.get('success', False)
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Actualización Incremental de Embeddings
+=======================================
+
+Mantiene al día el vocabulario del modelo Word2Vec con los mensajes de chat
+recogidos (por ejemplo, nombres de juegos nuevos) sin reentrenar desde cero.
+
+En cada ciclo se leen los mensajes nuevos del fichero de acumulación, se
+actualiza el modelo con build_vocab(update=True) y unas pocas épocas, y se
+publica una nueva versión de los vectores de forma atómica. Los procesos que
+sirven consultas la cargan solos, sin reiniciarse.
+
+Uso:
+    python scripts/update_embeddings.py --once
+    python scripts/update_embeddings.py --interval 3600
+"""
+
+import sys
+import json
+import time
+import argparse
+import logging
+from pathlib import Path
+
+# Configuración de logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# Agregar el directorio lib al path
+sys.path.append(str(Path(__file__).parent.parent / "lib"))
+
+from semantic_embeddings import SemanticEmbeddings, IncrementalUpdater
+
+
+def main():
+    """Función principal del script."""
+    parser = argparse.ArgumentParser(description="Actualización incremental de los embeddings")
+    parser.add_argument('--spool', default="data/chat_sentences.txt", help="Fichero con los mensajes recogidos")
+    parser.add_argument('--model-path', default="models/gaming_word2vec.model", help="Ruta del modelo completo")
+    parser.add_argument('--interval', type=float, default=3600.0, help="Segundos entre actualizaciones")
+    parser.add_argument('--epochs', type=int, default=5, help="Épocas por actualización")
+    parser.add_argument('--min-sentences', type=int, default=50, help="Mínimo de oraciones nuevas")
+    parser.add_argument('--once', action='store_true', help="Ejecutar un solo ciclo y salir")
+    args = parser.parse_args()
+
+    embeddings = SemanticEmbeddings(model_path=args.model_path)
+    if not embeddings.is_trained:
+        logger.error("No hay modelo entrenado. Ejecuta scripts/setup_embeddings.py primero")
+        return False
+
+    updater = IncrementalUpdater(
+        embeddings,
+        spool_path=args.spool,
+        interval=args.interval,
+        epochs=args.epochs,
+        min_sentences=args.min_sentences
+    )
+
+    if args.once:
+        print(json.dumps(updater.run_once(), ensure_ascii=False, indent=2))
+        return True
+
+    logger.info(f"Actualizando cada {args.interval} segundos (Ctrl+C para salir)")
+    updater.start()
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        updater.stop()
+    return True
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)